@@ -21,18 +21,72 @@
 
 """
 
-from __future__ import print_function
-
-try:
-    from .objects import *
-    from . import objects
-    from .upload import upload as Upload
-    from .upload import upload, replace
-except Exception as e:
-    print ("Could not load all modules")
-    print (type(e), e)
-
-from .auth import set_auth_handler
-from .method_call import enable_cache, disable_cache, set_timeout, get_timeout
-from .keys import set_keys
+import importlib
+
 from ._version import __version__
+
+# Public names are resolved lazily (PEP 562): the submodule defining a name
+# is only imported the first time the name is accessed, so that
+# `import flickr_api` does not pay for the parts of the API that are not used.
+_LAZY = {
+    'Upload': ('flickr_api.upload', 'upload'),
+    'upload': ('flickr_api.upload', 'upload'),
+    'replace': ('flickr_api.upload', 'replace'),
+    'set_auth_handler': ('flickr_api.auth', 'set_auth_handler'),
+    'use_auth': ('flickr_api.auth', 'use_auth'),
+    'enable_token_cache': ('flickr_api.auth', 'enable_token_cache'),
+    'enable_cache': ('flickr_api.method_call', 'enable_cache'),
+    'disable_cache': ('flickr_api.method_call', 'disable_cache'),
+    'set_timeout': ('flickr_api.method_call', 'set_timeout'),
+    'get_timeout': ('flickr_api.method_call', 'get_timeout'),
+    'set_session': ('flickr_api.method_call', 'set_session'),
+    'set_keys': ('flickr_api.keys', 'set_keys'),
+    'FlickrError': ('flickr_api.flickrerrors', 'FlickrError'),
+}
+
+# Classes of the object oriented interface, defined in `objects` (this
+# is `objects.__all__`, repeated here to avoid importing the module).
+_OBJECTS = (
+    'Activity', 'Blog', 'BlogService', 'Camera', 'Category', 'Collection',
+    'CommonInstitution', 'CommonInstitutionUrl', 'Contact', 'FlickrList',
+    'FlickrObject', 'Gallery', 'Group', 'Image', 'Info', 'License',
+    'Location', 'MachineTag', 'Panda', 'Person', 'Photo', 'PhotoGeoPerms',
+    'Photoset', 'Place', 'Reflection', 'SlicedWalker', 'Tag', 'UploadTicket',
+    'Walker', 'prefs', 'stats', 'test',
+)
+
+_SUBMODULES = (
+    'api', 'auth', 'cache', 'flickrerrors', 'keys', 'method_call', 'methods',
+    'objects', 'reflection', 'tools', 'utils',
+)
+
+__all__ = sorted(set(_LAZY) | set(_OBJECTS)) + ['objects', '__version__']
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module, attr = _LAZY[name]
+    elif name in _OBJECTS:
+        module, attr = 'flickr_api.objects', name
+    elif name in _SUBMODULES:
+        module, attr = 'flickr_api.' + name, None
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    value = importlib.import_module(module)
+    if attr is None:
+        globals()[name] = value
+        return value
+    # bind every lazy name of the submodule at once: importing
+    # `flickr_api.upload` sets the package attribute `upload` to the
+    # submodule, which must be replaced by the function of the same name.
+    for key, (key_module, key_attr) in _LAZY.items():
+        if key_module == module:
+            globals()[key] = getattr(value, key_attr)
+    if name not in _LAZY:
+        globals()[name] = getattr(value, attr)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
@@ -0,0 +1,46 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+    Compiled version of `flickr_api.method_call.clean_content`.
+
+    It is used in place of the pure Python implementation when the
+    extension has been built (which requires Cython at install time).
+"""
+
+
+cpdef object clean_content(object d):
+    """
+    Cleans out recursively the keys coming from the JSON
+    dictionary.
+
+    Namely: "_content" keys are replaces with their associated
+        values if they are the only key of the dictionary. Other
+        wise they are replaces by a "text" key with the same value.
+    """
+    cdef dict dd, out
+    cdef list ld, lout
+    cdef Py_ssize_t i, n
+
+    while type(d) is dict and len(<dict>d) == 1 and "_content" in <dict>d:
+        d = (<dict>d)["_content"]
+
+    if type(d) is dict:
+        dd = <dict>d
+        out = {}
+        for k, v in dd.items():
+            if k == "_content":
+                k = "text"
+            if type(v) is dict or type(v) is list:
+                v = clean_content(v)
+            out[k] = v
+        return out
+    elif type(d) is list:
+        ld = <list>d
+        n = len(ld)
+        lout = [None] * n
+        for i in range(n):
+            v = ld[i]
+            if type(v) is dict or type(v) is list:
+                v = clean_content(v)
+            lout[i] = v
+        return lout
+    return d
@@ -0,0 +1,214 @@
+"""
+    Names of the Flickr API methods.
+
+    Generated by flickr_api.tools.write_frozen_methods.
+"""
+
+METHODS = (
+    "flickr.activity.userComments",
+    "flickr.activity.userPhotos",
+    "flickr.auth.checkToken",
+    "flickr.auth.getFrob",
+    "flickr.auth.getFullToken",
+    "flickr.auth.getToken",
+    "flickr.auth.oauth.checkToken",
+    "flickr.auth.oauth.getAccessToken",
+    "flickr.blogs.getList",
+    "flickr.blogs.getServices",
+    "flickr.blogs.postPhoto",
+    "flickr.cameras.getBrandModels",
+    "flickr.cameras.getBrands",
+    "flickr.collections.getInfo",
+    "flickr.collections.getTree",
+    "flickr.commons.getInstitutions",
+    "flickr.contacts.getList",
+    "flickr.contacts.getListRecentlyUploaded",
+    "flickr.contacts.getPublicList",
+    "flickr.contacts.getTaggingSuggestions",
+    "flickr.favorites.add",
+    "flickr.favorites.getContext",
+    "flickr.favorites.getList",
+    "flickr.favorites.getPublicList",
+    "flickr.favorites.remove",
+    "flickr.galleries.addPhoto",
+    "flickr.galleries.create",
+    "flickr.galleries.editMeta",
+    "flickr.galleries.editPhoto",
+    "flickr.galleries.editPhotos",
+    "flickr.galleries.getInfo",
+    "flickr.galleries.getList",
+    "flickr.galleries.getListForPhoto",
+    "flickr.galleries.getPhotos",
+    "flickr.groups.browse",
+    "flickr.groups.discuss.replies.add",
+    "flickr.groups.discuss.replies.delete",
+    "flickr.groups.discuss.replies.edit",
+    "flickr.groups.discuss.replies.getInfo",
+    "flickr.groups.discuss.replies.getList",
+    "flickr.groups.discuss.topics.add",
+    "flickr.groups.discuss.topics.getInfo",
+    "flickr.groups.discuss.topics.getList",
+    "flickr.groups.getInfo",
+    "flickr.groups.join",
+    "flickr.groups.joinRequest",
+    "flickr.groups.leave",
+    "flickr.groups.members.getList",
+    "flickr.groups.pools.add",
+    "flickr.groups.pools.getContext",
+    "flickr.groups.pools.getGroups",
+    "flickr.groups.pools.getPhotos",
+    "flickr.groups.pools.remove",
+    "flickr.groups.search",
+    "flickr.interestingness.getList",
+    "flickr.machinetags.getNamespaces",
+    "flickr.machinetags.getPairs",
+    "flickr.machinetags.getPredicates",
+    "flickr.machinetags.getRecentValues",
+    "flickr.machinetags.getValues",
+    "flickr.panda.getList",
+    "flickr.panda.getPhotos",
+    "flickr.people.findByEmail",
+    "flickr.people.findByUsername",
+    "flickr.people.getGroups",
+    "flickr.people.getInfo",
+    "flickr.people.getLimits",
+    "flickr.people.getPhotos",
+    "flickr.people.getPhotosOf",
+    "flickr.people.getPublicGroups",
+    "flickr.people.getPublicPhotos",
+    "flickr.people.getUploadStatus",
+    "flickr.photos.addTags",
+    "flickr.photos.comments.addComment",
+    "flickr.photos.comments.deleteComment",
+    "flickr.photos.comments.editComment",
+    "flickr.photos.comments.getList",
+    "flickr.photos.comments.getRecentForContacts",
+    "flickr.photos.delete",
+    "flickr.photos.geo.batchCorrectLocation",
+    "flickr.photos.geo.correctLocation",
+    "flickr.photos.geo.getLocation",
+    "flickr.photos.geo.getPerms",
+    "flickr.photos.geo.photosForLocation",
+    "flickr.photos.geo.removeLocation",
+    "flickr.photos.geo.setContext",
+    "flickr.photos.geo.setLocation",
+    "flickr.photos.geo.setPerms",
+    "flickr.photos.getAllContexts",
+    "flickr.photos.getContactsPhotos",
+    "flickr.photos.getContactsPublicPhotos",
+    "flickr.photos.getContext",
+    "flickr.photos.getCounts",
+    "flickr.photos.getExif",
+    "flickr.photos.getFavorites",
+    "flickr.photos.getInfo",
+    "flickr.photos.getNotInSet",
+    "flickr.photos.getPerms",
+    "flickr.photos.getRecent",
+    "flickr.photos.getSizes",
+    "flickr.photos.getUntagged",
+    "flickr.photos.getWithGeoData",
+    "flickr.photos.getWithoutGeoData",
+    "flickr.photos.licenses.getInfo",
+    "flickr.photos.licenses.setLicense",
+    "flickr.photos.notes.add",
+    "flickr.photos.notes.delete",
+    "flickr.photos.notes.edit",
+    "flickr.photos.people.add",
+    "flickr.photos.people.delete",
+    "flickr.photos.people.deleteCoords",
+    "flickr.photos.people.editCoords",
+    "flickr.photos.people.getList",
+    "flickr.photos.recentlyUpdated",
+    "flickr.photos.removeTag",
+    "flickr.photos.search",
+    "flickr.photos.setContentType",
+    "flickr.photos.setDates",
+    "flickr.photos.setMeta",
+    "flickr.photos.setPerms",
+    "flickr.photos.setSafetyLevel",
+    "flickr.photos.setTags",
+    "flickr.photos.suggestions.approveSuggestion",
+    "flickr.photos.suggestions.getList",
+    "flickr.photos.suggestions.rejectSuggestion",
+    "flickr.photos.suggestions.removeSuggestion",
+    "flickr.photos.suggestions.suggestLocation",
+    "flickr.photos.transform.rotate",
+    "flickr.photos.upload.checkTickets",
+    "flickr.photosets.addPhoto",
+    "flickr.photosets.comments.addComment",
+    "flickr.photosets.comments.deleteComment",
+    "flickr.photosets.comments.editComment",
+    "flickr.photosets.comments.getList",
+    "flickr.photosets.create",
+    "flickr.photosets.delete",
+    "flickr.photosets.editMeta",
+    "flickr.photosets.editPhotos",
+    "flickr.photosets.getContext",
+    "flickr.photosets.getInfo",
+    "flickr.photosets.getList",
+    "flickr.photosets.getPhotos",
+    "flickr.photosets.orderSets",
+    "flickr.photosets.removePhoto",
+    "flickr.photosets.removePhotos",
+    "flickr.photosets.reorderPhotos",
+    "flickr.photosets.setPrimaryPhoto",
+    "flickr.places.find",
+    "flickr.places.findByLatLon",
+    "flickr.places.getChildrenWithPhotosPublic",
+    "flickr.places.getInfo",
+    "flickr.places.getInfoByUrl",
+    "flickr.places.getPlaceTypes",
+    "flickr.places.getShapeHistory",
+    "flickr.places.getTopPlacesList",
+    "flickr.places.placesForBoundingBox",
+    "flickr.places.placesForContacts",
+    "flickr.places.placesForTags",
+    "flickr.places.placesForUser",
+    "flickr.places.resolvePlaceId",
+    "flickr.places.resolvePlaceURL",
+    "flickr.places.tagsForPlace",
+    "flickr.prefs.getContentType",
+    "flickr.prefs.getGeoPerms",
+    "flickr.prefs.getHidden",
+    "flickr.prefs.getPrivacy",
+    "flickr.prefs.getSafetyLevel",
+    "flickr.push.getSubscriptions",
+    "flickr.push.getTopics",
+    "flickr.push.subscribe",
+    "flickr.push.unsubscribe",
+    "flickr.reflection.getMethodInfo",
+    "flickr.reflection.getMethods",
+    "flickr.stats.getCSVFiles",
+    "flickr.stats.getCollectionDomains",
+    "flickr.stats.getCollectionReferrers",
+    "flickr.stats.getCollectionStats",
+    "flickr.stats.getPhotoDomains",
+    "flickr.stats.getPhotoReferrers",
+    "flickr.stats.getPhotoStats",
+    "flickr.stats.getPhotosetDomains",
+    "flickr.stats.getPhotosetReferrers",
+    "flickr.stats.getPhotosetStats",
+    "flickr.stats.getPhotostreamDomains",
+    "flickr.stats.getPhotostreamReferrers",
+    "flickr.stats.getPhotostreamStats",
+    "flickr.stats.getPopularPhotos",
+    "flickr.stats.getTotalViews",
+    "flickr.tags.getClusterPhotos",
+    "flickr.tags.getClusters",
+    "flickr.tags.getHotList",
+    "flickr.tags.getListPhoto",
+    "flickr.tags.getListUser",
+    "flickr.tags.getListUserPopular",
+    "flickr.tags.getListUserRaw",
+    "flickr.tags.getMostFrequentlyUsed",
+    "flickr.tags.getRelated",
+    "flickr.test.echo",
+    "flickr.test.login",
+    "flickr.test.null",
+    "flickr.urls.getGroup",
+    "flickr.urls.getUserPhotos",
+    "flickr.urls.getUserProfile",
+    "flickr.urls.lookupGallery",
+    "flickr.urls.lookupGroup",
+    "flickr.urls.lookupUser",
+)
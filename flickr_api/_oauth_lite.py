@@ -0,0 +1,123 @@
+"""
+    Minimal OAuth 1.0a support for the Flickr API.
+
+    Only what the authentication flow of Flickr needs is implemented:
+    nonces, tokens and HMAC-SHA1 signatures of the requests.
+"""
+
+import base64
+import collections
+import functools
+import hashlib
+import hmac
+import os
+import time
+import urllib.parse
+
+Consumer = collections.namedtuple("Consumer", "key secret")
+Token = collections.namedtuple("Token", "key secret verifier",
+                               defaults=(None,))
+
+# Nonces are drawn from a pool refilled with a single os.urandom call.
+_nonce_pool = collections.deque()
+_NONCE_POOL_SIZE = 1024
+
+# A forked child must not hand out the nonces of its parent.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_nonce_pool.clear)
+
+
+def make_nonce():
+    """ Returns a new random nonce (32 hexadecimal characters).
+    """
+    while True:
+        try:
+            return _nonce_pool.popleft()
+        except IndexError:
+            data = os.urandom(16 * _NONCE_POOL_SIZE).hex()
+            _nonce_pool.extend(data[i:i + 32]
+                               for i in range(0, len(data), 32))
+
+
+# (seconds, formatted seconds) of the last timestamp
+_last_timestamp = (0, "0")
+
+
+def timestamp():
+    """ Returns the current OAuth timestamp (seconds since the epoch, as a
+    string). The string is only formatted once per second.
+    """
+    global _last_timestamp
+    now = int(time.time())
+    last = _last_timestamp
+    if last[0] == now:
+        return last[1]
+    _last_timestamp = (now, str(now))
+    return _last_timestamp[1]
+
+
+def escape(s):
+    """ Percent-encodes a parameter name or value as required by OAuth.
+    """
+    if not isinstance(s, (str, bytes)):
+        s = str(s)
+    return urllib.parse.quote(s, safe="~")
+
+
+def signing_key(consumer_secret, token_secret=""):
+    """ Returns the HMAC key of the requests signed with the given secrets.
+    """
+    return ("%s&%s" % (escape(consumer_secret), escape(token_secret or ""))
+            ).encode("ascii")
+
+
+def signer(consumer_secret, token_secret=""):
+    """ Returns an HMAC-SHA1 object keyed for the given secrets. It is
+    meant to be copied for each signature, see `sign_pairs`, so that the
+    key is only processed once.
+    """
+    return hmac.new(signing_key(consumer_secret, token_secret),
+                    digestmod=hashlib.sha1)
+
+
+@functools.lru_cache(maxsize=16)
+def base_string_prefix(method, url):
+    """ Returns the head of the signature base string of the requests sent
+    to `url`: the method and the normalized url.
+    """
+    scheme, netloc, path = urllib.parse.urlsplit(url)[:3]
+    scheme, netloc = scheme.lower(), netloc.lower()
+    if ((scheme == "http" and netloc.endswith(":80"))
+            or (scheme == "https" and netloc.endswith(":443"))):
+        netloc = netloc.rsplit(":", 1)[0]
+    return "%s&%s&" % (method.upper(),
+                       escape("%s://%s%s" % (scheme, netloc, path)))
+
+
+def sign_pairs(template, prefix, pairs):
+    """ Computes the signature of a request.
+
+    Parameters
+    ----------
+    template: hmac.HMAC
+        The keyed HMAC object, see `signer`. It is left unchanged.
+    prefix: str
+        The head of the base string, see `base_string_prefix`.
+    pairs: list
+        The percent-encoded (name, value) pairs of the parameters.
+    """
+    pairs.sort()
+    raw = prefix + escape("&".join("%s=%s" % pair for pair in pairs))
+    h = template.copy()
+    h.update(raw.encode("ascii"))
+    return base64.b64encode(h.digest()).decode("ascii")
+
+
+def sign_request(method, url, params, consumer_secret, token_secret=""):
+    """ Returns the HMAC-SHA1 signature of a request with parameters
+    `params`.
+    """
+    pairs = [(escape(k), escape(v)) for k, v in params.items()
+             if k != "oauth_signature"]
+    return sign_pairs(signer(consumer_secret, token_secret),
+                      base_string_prefix(method, url), pairs)
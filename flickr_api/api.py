@@ -6,57 +6,209 @@
 
     The hierarchy of methods is built once when the module is loaded.
 
+    Calls can be grouped and sent concurrently with a batch:
+    >>> with flickr.batch() as b:
+    ...     infos = [flickr.photos.getInfo(photo_id=i) for i in ids]
+    >>> [f.result() for f in infos]
+
     Author : Alexis Mignon (c)
     email  : alexis.mignon_at_gmail.com
     Date   : 08/08/2011
 
 """
 
+import bisect
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from .method_call import call_api
 from . import auth
-from . import reflection
 
-__methods__ = reflection.__methods__.keys()
-__methods__ = sorted(__methods__)
+try:
+    from ._methods_frozen import METHODS as __methods__
+except ImportError:
+    from .methods import load_methods
+    __methods__ = sorted(load_methods())
+
 
-__proxys__ = {}
+def _is_method(name):
+    """
+        Tells whether 'name' is a Flickr method, using a binary search in
+        the sorted list of methods.
+    """
+    i = bisect.bisect_left(__methods__, name)
+    return i < len(__methods__) and __methods__[i] == name
 
 
-def _get_proxy(name):
+def _build_trie(methods):
     """
-        return the FlickrMethodProxy object with called 'name' from 
-        the __proxys__ global dictionary. Creates the objects if needed.
+        Builds a tree of nested dictionaries from the dotted method names,
+        e.g. {'flickr': {'photos': {'getInfo': {}, ...}, ...}}.
     """
-    if name in __proxys__ :
-        return __proxys__[name]
-    else :
-        p = FlickrMethodProxy(name)
-        __proxys__[name] = p
-        return p
-
-def _get_children_methods(name):
+    root = {}
+    for m in methods:
+        node = root
+        for part in m.split("."):
+            node = node.setdefault(part, {})
+    return root
+
+
+# Batch in use in the current thread, if any. See `BatchContext`.
+_batch_ctx = threading.local()
+
+
+def _run_call(future, kwargs):
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(call_api(**kwargs))
+    except Exception as e:
+        future.set_exception(e)
+
+
+class BatchContext(object):
+    """
+        Context manager grouping the calls made through FlickrMethodProxy
+        objects in the current thread.
+
+        Inside the context, calling a proxy returns a
+        `concurrent.futures.Future` instead of the response. The queued
+        calls are sent concurrently by a pool of threads when 'max_size'
+        calls are pending, when 'max_wait_ms' milliseconds have elapsed
+        since the first pending call, or when the context is left.
+    """
+    def __init__(self, max_wait_ms=200, max_size=16, max_workers=8):
+        self.max_wait = max_wait_ms / 1000.
+        self.max_size = max_size
+        self.max_workers = max_workers
+        self.queue = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._executor = None
+        self._previous = None
+
+    def __enter__(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._previous = getattr(_batch_ctx, "current", None)
+        _batch_ctx.current = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _batch_ctx.current = self._previous
+        self.flush()
+        self._executor.shutdown(wait=True)
+        return False
+
+    def submit(self, kwargs):
+        """
+            Queues a call to `call_api` with the given arguments and
+            returns the future holding its result.
+        """
+        future = Future()
+        with self._lock:
+            self.queue.append((kwargs, future))
+            if len(self.queue) >= self.max_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def flush(self):
+        """
+            Sends all the pending calls.
+        """
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        queue, self.queue = self.queue, []
+        for kwargs, future in queue:
+            self._executor.submit(_run_call, future, kwargs)
+
+
+class _ProxyDoc(object):
     """
-        Get the list of method names having 'name' for prefix
+        Descriptor returning the docstring of a FlickrMethodProxy object,
+        or the class docstring when accessed from the class.
+
+        The docstring of a method is only built on first access and then
+        stored on the proxy.
     """
-    return [ m for m in __methods__ if m.startswith(name + ".") ]
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self.doc
+        if obj._doc is None:
+            if _is_method(obj.name):
+                from . import reflection
+                obj._doc = reflection.make_docstring(obj.name)
+            else:
+                obj._doc = self.doc
+        return obj._doc
+
 
 class FlickrMethodProxy(object):
     """
         Proxy object to perform seamless direct calls to Flickr
         API.
     """
-    def __init__(self, name):
+    __slots__ = ("name", "_children", "_doc", "_call", "_method_info")
+
+    def __init__(self, name, subtrie):
         self.name = name
-        children = _get_children_methods(name)
-        for child in children :
-            child_node = child[(len(self.name) + 1):].split(".")[0]
+        self._children = {}
+        for child_node, child_trie in subtrie.items():
             child_prefix = "%s.%s" % (self.name, child_node)
-            self.__dict__[child_node] = _get_proxy(child_prefix)
-        if self.name in __methods__ :
-            self.__doc__ = reflection.make_docstring(self.name)
+            self._children[child_node] = FlickrMethodProxy(child_prefix,
+                                                           child_trie)
+        self._doc = None
+        self._method_info = None
+        if _is_method(self.name):
+            self._call = functools.partial(call_api, raw=True,
+                                           method=self.name)
+        else:
+            self._call = None
+
+    @property
+    def method_info(self):
+        """
+            Description of the Flickr method (see `flickr_api.methods`),
+            or None if the proxy is a namespace. It is only looked up once.
+        """
+        if self._method_info is None and self._call is not None:
+            from .methods import get_method
+            self._method_info = get_method(self.name)
+        return self._method_info
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._children[name]
+        except KeyError:
+            raise AttributeError("'%s' has no attribute '%s'"
+                                 % (self.name, name))
+
+    def __dir__(self):
+        return sorted(set(dir(type(self))) | set(self._children))
 
     def __call__(self, **kwargs):
-        return call_api(auth_handler=auth.AUTH_HANDLER, raw=True,
+        auth_handler = auth.get_auth_handler()
+        batch = getattr(_batch_ctx, "current", None)
+        if batch is not None:
+            return batch.submit(dict(kwargs, auth_handler=auth_handler,
+                                     raw=True, method=self.name))
+        if self._call is not None:
+            return self._call(auth_handler=auth_handler, **kwargs)
+        return call_api(auth_handler=auth_handler, raw=True,
                         method=self.name, **kwargs)
     
     def __repr__(self):
@@ -68,7 +220,65 @@ class FlickrMethodProxy(object):
     @staticmethod
     def set_auth_handler(token):
         auth.set_auth_handler(token)
+
+    @staticmethod
+    def batch(max_wait_ms=200, max_size=16, max_workers=8):
+        """
+            Returns a BatchContext grouping the calls made in the current
+            thread, see `BatchContext`.
+        """
+        return BatchContext(max_wait_ms=max_wait_ms, max_size=max_size,
+                            max_workers=max_workers)
         
+FlickrMethodProxy.__doc__ = _ProxyDoc(FlickrMethodProxy.__doc__)
+
 if __methods__ :
-    flickr = _get_proxy("flickr")
+    flickr = FlickrMethodProxy("flickr", _build_trie(__methods__)["flickr"])
+
+
+# Template of the functions built by `make_function`.
+_FUNCTION_TEMPLATE = """
+def %(func_name)s(%(params)s**kwargs):
+    args = {%(required)s}
+%(optional)s    return _proxy(**args, **kwargs)
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def make_function(name):
+    """
+        Returns a function calling the Flickr method 'name' with the
+        arguments of the method as keyword-only parameters (the required
+        ones have no default value). The source of the function is
+        generated from the description of the method, so that a call does
+        not have to inspect the arguments.
+    """
+    from .methods import get_method
+    info = get_method(name)
+    required, params, optional = [], [], []
+    for aname, is_optional in zip(info.arg_names, info.arg_optional):
+        if aname == "api_key":
+            continue
+        if is_optional:
+            params.append("%s=None, " % aname)
+            optional.append("    if %s is not None:\n"
+                            "        args[%r] = %s\n" % (aname, aname, aname))
+        else:
+            params.insert(len(required), "%s, " % aname)
+            required.append("%r: %s" % (aname, aname))
+    func_name = name.replace(".", "_")
+    source = _FUNCTION_TEMPLATE % {
+        "func_name": func_name,
+        "params": "*, " + "".join(params) if params else "",
+        "required": ", ".join(required),
+        "optional": "".join(optional),
+    }
+    proxy = flickr
+    for part in name.split(".")[1:]:
+        proxy = getattr(proxy, part)
+    namespace = {"_proxy": proxy}
+    exec(compile(source, "<flickr_api %s>" % name, "exec"), namespace)
+    func = namespace[func_name]
+    func.__doc__ = proxy.__doc__
+    return func
 
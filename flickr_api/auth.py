@@ -34,25 +34,90 @@
 
 """
 
-import oauth2
+import contextlib
+import contextvars
+import functools
+import hashlib
+import json
+import os
+import tempfile
 import time
-from six import string_types
-from six.moves import urllib
-from .utils import urlopen_and_read
+import urllib.parse
+from .method_call import get_session, get_timeout
 from . import keys
+from ._oauth_lite import (Consumer, Token, base_string_prefix, escape,
+                          make_nonce, sign_pairs, sign_request, signer,
+                          timestamp)
 
 TOKEN_REQUEST_URL = "https://www.flickr.com/services/oauth/request_token"
 AUTHORIZE_URL = "https://www.flickr.com/services/oauth/authorize"
 ACCESS_TOKEN_URL = "https://www.flickr.com/services/oauth/access_token"
 
-AUTH_HANDLER = None
+# Version of the format of the files written by `AuthHandler.tofile`.
+AUTH_FILE_VERSION = 2
+
+# The authentication handler is read through `get_auth_handler` (or the
+# `AUTH_HANDLER` module attribute). The one set by `set_auth_handler` is
+# shared by all threads, `use_auth` overrides it in the current context.
+_AUTH_HANDLER = None
+_AUTH_VAR = contextvars.ContextVar("AUTH_HANDLER", default=None)
+
+# On-disk cache of the access tokens obtained through the OAuth flow.
+# See `enable_token_cache`.
+TOKEN_CACHE = False
+TOKEN_CACHE_PATH = os.path.expanduser("~/.flickr_api_oauth")
 
 
 class AuthHandlerError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=256)
+def _build_consumer(key, secret):
+    return Consumer(key, secret)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_access_token(key, secret):
+    return Token(key, secret)
+
+
+def clear_token_cache():
+    """ Clears the in-memory cache of OAuth consumers and access tokens
+    shared by `AuthHandler` instances (e.g. when a user logs out).
+    """
+    _build_consumer.cache_clear()
+    _build_access_token.cache_clear()
+
+
+def _fetch(url, params):
+    """ Performs a GET request on an OAuth endpoint using the shared session
+    and returns the parsed body.
+    """
+    resp = get_session().get(url, params=params, timeout=get_timeout())
+    resp.raise_for_status()
+    return _parse_oauth(resp.content)
+
+
+def _parse_oauth(body):
+    """ Parses the form-encoded body of a response of an OAuth endpoint.
+    """
+    try:
+        data = dict(urllib.parse.parse_qsl(body.decode("ascii"),
+                                           max_num_fields=8,
+                                           strict_parsing=True))
+    except ValueError:
+        raise AuthHandlerError("Invalid OAuth response: %r" % body)
+    if "oauth_token" not in data:
+        raise AuthHandlerError("No token in OAuth response: %r" % body)
+    return data
+
+
 class AuthHandler(object):
+    __slots__ = ("key", "secret", "callback", "consumer", "request_token",
+                 "access_token", "_hmac_template", "_static_params",
+                 "_static_pairs")
+
     def __init__(self, key=None, secret=None, callback=None,
                  access_token_key=None, access_token_secret=None,
                  request_token_key=None, request_token_secret=None):
@@ -66,44 +131,49 @@ class AuthHandler(object):
         if callback is None:
             callback = ("https://api.flickr.com/services/rest/"
                         "?method=flickr.test.echo&api_key=%s" % self.key)
-
-        params = {
-            'oauth_timestamp': str(int(time.time())),
-            'oauth_signature_method': "HMAC-SHA1",
-            'oauth_version': "1.0",
-            'oauth_callback': callback,
-            'oauth_nonce': oauth2.generate_nonce(),
-            'oauth_consumer_key': self.key
-        }
-
-        self.consumer = oauth2.Consumer(key=self.key, secret=self.secret)
-        if (access_token_key is None) and (request_token_key is None):
-            req = oauth2.Request(method="GET",
-                                 url=TOKEN_REQUEST_URL,
-                                 parameters=params)
-            req.sign_request(oauth2.SignatureMethod_HMAC_SHA1(),
-                             self.consumer, None)
-
-            resp = urlopen_and_read(req.to_url())
-            request_token = dict(urllib.parse.parse_qsl(resp))
-
-            self.request_token = oauth2.Token(
-                request_token['oauth_token'],
-                request_token['oauth_token_secret']
+        self.callback = callback
+        self._hmac_template = None
+        self._static_params = None
+        self._static_pairs = None
+
+        self.consumer = _build_consumer(self.key, self.secret)
+        if ((access_token_key is None) and (request_token_key is None)
+                and TOKEN_CACHE and self._load_from_cache()):
+            self.request_token = None
+        elif (access_token_key is None) and (request_token_key is None):
+            self.request_token = self._fetch_token(
+                TOKEN_REQUEST_URL,
+                {'oauth_version': "1.0", 'oauth_callback': callback}
             )
             self.access_token = None
         elif request_token_key is not None:
             self.access_token = None
-            self.request_token = oauth2.Token(
+            self.request_token = Token(
                 request_token_key,
                 request_token_secret
             )
         else:
             self.request_token = None
-            self.access_token = oauth2.Token(
-                access_token_key,
-                access_token_secret
-            )
+            self._set_access_token(_build_access_token(access_token_key,
+                                                       access_token_secret))
+
+    # attributes saved when pickling or copying a handler, the others are
+    # derived from the access token (the keyed HMAC cannot be pickled)
+    _STATE = ("key", "secret", "callback", "consumer", "request_token",
+              "access_token")
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self._STATE
+                if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        self._hmac_template = None
+        self._static_params = None
+        self._static_pairs = None
+        for name, value in state.items():
+            setattr(self, name, value)
+        if state.get("access_token") is not None:
+            self._set_access_token(self.access_token)
 
     def get_authorization_url(self, perms='read'):
         if self.request_token is None:
@@ -122,45 +192,93 @@ class AuthHandler(object):
                  "This ususally means that the access token has been loaded "
                  "from a file.")
             )
-        self.request_token.set_verifier(oauth_verifier)
+        self.request_token = self.request_token._replace(
+            verifier=oauth_verifier)
+
+        access_token = self._fetch_token(
+            ACCESS_TOKEN_URL,
+            {'oauth_token': self.request_token.key,
+             'oauth_verifier': self.request_token.verifier},
+            self.request_token.secret
+        )
+        self._set_access_token(_build_access_token(*access_token[:2]))
+        if TOKEN_CACHE:
+            self._save_to_cache()
 
-        access_token_parms = {
-            'oauth_consumer_key': self.key,
-            'oauth_nonce': oauth2.generate_nonce(),
-            'oauth_signature_method': "HMAC-SHA1",
-            'oauth_timestamp': str(int(time.time())),
-            'oauth_token': self.request_token.key,
-            'oauth_verifier': self.request_token.verifier
-        }
+    def _fetch_token(self, url, params, token_secret=""):
+        """ Signs a request to the OAuth endpoint `url` and returns the
+        token of the response.
+        """
+        params['oauth_consumer_key'] = self.key
+        params['oauth_nonce'] = make_nonce()
+        params['oauth_signature_method'] = "HMAC-SHA1"
+        params['oauth_timestamp'] = timestamp()
+        params['oauth_signature'] = sign_request(
+            "GET", url, params, self.secret, token_secret)
+        resp = _fetch(url, params)
+        return Token(resp['oauth_token'], resp['oauth_token_secret'])
+
+    def _cache_key(self):
+        """ Key identifying this handler in the token cache file.
+        """
+        return hashlib.sha256(
+            ("%s\n%s" % (self.key, self.callback)).encode("utf8")
+        ).hexdigest()
 
-        req = oauth2.Request(method="GET", url=ACCESS_TOKEN_URL,
-                             parameters=access_token_parms)
-        req.sign_request(oauth2.SignatureMethod_HMAC_SHA1(),
-                         self.consumer, self.request_token)
-        resp = urlopen_and_read(req.to_url())
-        access_token_resp = dict(urllib.parse.parse_qsl(resp))
+    def _load_from_cache(self):
+        """ Sets the access token from the token cache file.
 
-        self.access_token = oauth2.Token(
-            access_token_resp["oauth_token"],
-            access_token_resp["oauth_token_secret"]
-        )
+        Returns True if a token was found for this API key and callback.
+        """
+        entry = _read_token_cache().get(self._cache_key())
+        if entry is None:
+            return False
+        self._set_access_token(_build_access_token(
+            entry["access_token_key"], entry["access_token_secret"]))
+        return True
+
+    def _save_to_cache(self):
+        """ Stores the access token in the token cache file.
+        """
+        cache = _read_token_cache()
+        cache[self._cache_key()] = {
+            "access_token_key": self.access_token.key,
+            "access_token_secret": self.access_token.secret,
+            "ts": int(time.time())
+        }
+        _atomic_write(TOKEN_CACHE_PATH, json.dumps(cache).encode("utf8"))
+
+    def _set_access_token(self, access_token):
+        """ Sets the access token and precomputes the parts of the request
+        signature that do not change from one call to the other.
+        """
+        self.access_token = access_token
+        self._hmac_template = signer(self.secret, access_token.secret)
+        self._static_params = {
+            'oauth_signature_method': "HMAC-SHA1",
+            'oauth_token': access_token.key,
+            'oauth_consumer_key': self.consumer.key,
+        }
+        # percent-encoded (name, value) pairs of the static parameters
+        self._static_pairs = [(k, (escape(k), escape(v)))
+                              for k, v in self._static_params.items()]
 
     def complete_parameters(self, url, params={}):
 
-        defaults = {
-            'oauth_timestamp': str(int(time.time())),
-            'oauth_nonce': oauth2.generate_nonce(),
-            'signature_method': "HMAC-SHA1",
-            'oauth_token': self.access_token.key,
-            'oauth_consumer_key': self.consumer.key,
+        variable = {
+            'oauth_timestamp': timestamp(),
+            'oauth_nonce': make_nonce()
         }
+        variable.update(params)
 
-        defaults.update(params)
-        req = oauth2.Request(method="POST", url=url, parameters=defaults)
-        req.sign_request(oauth2.SignatureMethod_HMAC_SHA1(), self.consumer,
-                         self.access_token)
+        pairs = [pair for k, pair in self._static_pairs if k not in variable]
+        pairs.extend((escape(k), escape(v)) for k, v in variable.items())
 
-        return req
+        defaults = dict(self._static_params)
+        defaults.update(variable)
+        defaults['oauth_signature'] = sign_pairs(
+            self._hmac_template, base_string_prefix("POST", url), pairs)
+        return defaults
 
     def tofile(self, filename, include_api_keys=False):
         """ saves authentication information to a file.
@@ -174,16 +292,15 @@ class AuthHandler(object):
         Should we include the api keys in the file ? For security issues, it
         is recommended not to save the API keys information in several places
         and the default behaviour is thus not to save the API keys.
+
+    The information is stored as a JSON object (see `todict`) with a
+    "version" field set to AUTH_FILE_VERSION.
 """
         if self.access_token is None:
             raise AuthHandlerError("Access token not set yet.")
-        with open(filename, "w") as f:
-            if include_api_keys:
-                f.write("\n".join([self.key, self.secret,
-                                   self.access_token.key, self.access_token.secret]))
-            else:
-                f.write("\n".join([self.access_token.key,
-                                   self.access_token.secret]))
+        data = self.todict(include_api_keys)
+        data["version"] = AUTH_FILE_VERSION
+        _atomic_write(filename, json.dumps(data).encode("utf8"))
 
     def save(self, filename, include_api_keys=False):
         self.tofile(filename, include_api_keys)
@@ -244,17 +361,35 @@ class AuthHandler(object):
         authentication information. The recommended way is to use a
         `flickr_keys.py` file. Setting `set_api_keys=True` should be considered
         as a conveniency only for single user settings.
+
+    Files written by older versions (the access token key and secret,
+    optionally preceded by the API key and secret, one per line) are
+    also accepted.
 """
-        with open(filename, "r") as f:
-            keys_info = f.read().split("\n")
-            try:
-                key, secret, access_key, access_secret = keys_info
-                if set_api_keys:
-                    keys.set_keys(api_key=key, api_secret=secret)
-            except ValueError:
-                access_key, access_secret = keys_info
-                key = keys.API_KEY
-                secret = keys.API_SECRET
+        with open(filename, "rb") as f:
+            content = f.read().decode("utf8")
+        if content.startswith("{"):
+            info = json.loads(content)
+            if info.get("version") != AUTH_FILE_VERSION:
+                raise AuthHandlerError(
+                    "Unsupported auth file version: %r"
+                    % info.get("version"))
+            if set_api_keys and "api_key" in info:
+                keys.set_keys(api_key=info["api_key"],
+                              api_secret=info["api_secret"])
+            return AuthHandler.fromdict(info)
+
+        keys_info = content.split("\n")
+        if len(keys_info) == 4:
+            key, secret, access_key, access_secret = keys_info
+            if set_api_keys:
+                keys.set_keys(api_key=key, api_secret=secret)
+        elif len(keys_info) == 2:
+            access_key, access_secret = keys_info
+            key = keys.API_KEY
+            secret = keys.API_SECRET
+        else:
+            raise AuthHandlerError("Invalid auth file: %s" % filename)
         return AuthHandler(key, secret, access_token_key=access_key,
                            access_token_secret=access_secret)
 
@@ -294,6 +429,53 @@ class AuthHandler(object):
                            access_token_secret=access_secret)
 
 
+def _atomic_write(filename, data):
+    """ Writes `data` (bytes) to `filename` through a temporary file so that
+    an interrupted write never leaves a truncated file behind.
+    """
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(dir=dirname)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except Exception:
+        os.remove(tmp)
+        raise
+
+
+def _read_token_cache():
+    try:
+        with open(TOKEN_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def enable_token_cache(enable=True, path=None):
+    """ Enable or disable the on-disk cache of access tokens.
+
+    When enabled, the access token obtained through `set_verifier` is saved
+    and a new `AuthHandler` created with the same API key and callback
+    reuses it instead of starting a new authorization flow.
+
+    Parameters
+    ----------
+    enable: bool, optional (default True)
+        Whether the cache should be used.
+
+    path: str, optional
+        The file in which the tokens are stored. Defaults to
+        `~/.flickr_api_oauth`.
+    """
+    global TOKEN_CACHE, TOKEN_CACHE_PATH
+    TOKEN_CACHE = enable
+    if path is not None:
+        TOKEN_CACHE_PATH = path
+
+
 def token_factory(filename=None, token_key=None, token_secret=None):
     if filename is None:
         if (token_key is None) or (token_secret is None):
@@ -320,9 +502,39 @@ def set_auth_handler(auth_handler, set_api_keys=False):
         `flickr_keys.py` file. Setting `set_api_keys=True` should be considered
         as a conveniency only for single user settings.
     """
-    global AUTH_HANDLER
-    if isinstance(auth_handler, string_types):
+    global _AUTH_HANDLER
+    if isinstance(auth_handler, str):
         ah = AuthHandler.load(auth_handler, set_api_keys)
         set_auth_handler(ah)
     else:
-        AUTH_HANDLER = auth_handler
+        _AUTH_HANDLER = auth_handler
+
+
+def get_auth_handler():
+    """ Returns the authentication handler in use in the current context.
+    """
+    auth_handler = _AUTH_VAR.get()
+    if auth_handler is None:
+        return _AUTH_HANDLER
+    return auth_handler
+
+
+@contextlib.contextmanager
+def use_auth(auth_handler):
+    """ Context manager using `auth_handler` for the calls made in the
+    current context (thread or asynchronous task) only:
+
+    >>> with use_auth(user_auth_handler):
+    ...     flickr_api.Person.findByUserName("...")
+    """
+    token = _AUTH_VAR.set(auth_handler)
+    try:
+        yield auth_handler
+    finally:
+        _AUTH_VAR.reset(token)
+
+
+def __getattr__(name):
+    if name == "AUTH_HANDLER":
+        return get_auth_handler()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -39,6 +39,7 @@ thanks to those guys for designing a simple and effective cache!
     http://www.djangoproject.com/documentation/cache/#the-low-level-cache-api
 '''
 
+import collections
 import threading
 import time
 
@@ -48,87 +49,75 @@ class SimpleCache(object):
 
     This stores max 50 entries, timing them out after 120 seconds:
     >>> cache = SimpleCache(timeout=120, max_entries=50)
+
+    When the cache is full, the least recently used entry is evicted.
+
+    Reads and writes of single entries rely on the atomicity of the
+    dictionary operations and take no lock; only eviction is locked. The
+    cache is thus consistent for each key but not across keys.
     '''
 
     def __init__(self, timeout=300, max_entries=200):
-        self.storage = {}
-        self.expire_info = {}
-        self.lock = threading.RLock()
+        # key -> (value, expiration time on the time.monotonic clock),
+        # ordered from the least to the most recently used.
+        self.storage = collections.OrderedDict()
+        self.lock = threading.Lock()
         self.default_timeout = timeout
         self.max_entries = max_entries
-        self.cull_frequency = 3
-
-    def locking(method):
-        '''Method decorator, ensures the method call is locked'''
 
-        def locked(self, *args, **kwargs):
-            self.lock.acquire()
-            try:
-                return method(self, *args, **kwargs)
-            finally:
-                self.lock.release()
+    def _touch(self, key):
+        try:
+            self.storage.move_to_end(key)
+        except KeyError:
+            # evicted or deleted by another thread in the meantime
+            pass
 
-        return locked
-
-    @locking
     def get(self, key, default=None):
         '''Fetch a given key from the cache. If the key does not exist, return
         default, which itself defaults to None.
         '''
 
-        now = time.time()
-        exp = self.expire_info.get(key)
-        if exp is None:
+        entry = self.storage.get(key)
+        if entry is None:
             return default
-        elif exp < now:
+        elif entry[1] < time.monotonic():
             self.delete(key)
             return default
 
-        return self.storage[key]
+        self._touch(key)
+        return entry[0]
 
-    @locking
     def set(self, key, value, timeout=None):
         '''Set a value in the cache. If timeout is given, that timeout will be
         used for the key; otherwise the default cache timeout will be used.
         '''
 
-        if len(self.storage) >= self.max_entries:
-            self.cull()
         if timeout is None:
             timeout = self.default_timeout
-        self.storage[key] = value
-        self.expire_info[key] = time.time() + timeout
+        if key not in self.storage and len(self.storage) >= self.max_entries:
+            with self.lock:
+                while len(self.storage) >= self.max_entries:
+                    try:
+                        self.storage.popitem(last=False)
+                    except KeyError:
+                        break
+        self.storage[key] = (value, time.monotonic() + timeout)
+        self._touch(key)
 
-    @locking
     def delete(self, key):
         '''Deletes a key from the cache, failing silently if it doesn't exist.
         '''
 
-        if key in self.storage:
-            del self.storage[key]
-        if key in self.expire_info:
-            del self.expire_info[key]
+        self.storage.pop(key, None)
 
-    @locking
     def has_key(self, key):
         '''Returns True if the key is in the cache and has not expired.'''
         return self.get(key) is not None
 
-    @locking
     def __contains__(self, key):
         '''Returns True if the key is in the cache and has not expired.'''
         return self.has_key(key)
 
-    @locking
-    def cull(self):
-        '''Reduces the number of cached items'''
-
-        doomed = [k for (i, k) in enumerate(self.storage)
-                  if i % self.cull_frequency == 0]
-        for k in doomed:
-            self.delete(k)
-
-    @locking
     def __len__(self):
         '''Returns the number of cached items -- they might be expired
         though.
@@ -5,8 +5,12 @@
 
 class FlickrError(Exception):
     """Base Exception class
+
+    The exceptions declare their attributes in `__slots__`. Instances still
+    have the `__dict__` of `BaseException`, but the attributes are stored
+    in the slots.
     """
-    pass
+    __slots__ = ()
 
 
 class FlickrAPIError(FlickrError):
@@ -19,6 +23,8 @@ class FlickrAPIError(FlickrError):
     message: str
         Error message
     """
+    __slots__ = ("code", "message")
+
     def __init__(self, code, message):
         """Constructor
 
@@ -45,6 +51,8 @@ class FlickrServerError(FlickrError):
     content: str
         error content message
     """
+    __slots__ = ("status_code", "content")
+
     def __init__(self, status_code, content):
         """Constructor
 
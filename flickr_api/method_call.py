@@ -8,18 +8,26 @@
     Date: 06/08/2011
 
 """
-from six.moves import urllib
-from six import iteritems
+import urllib.error
+import urllib.parse
+import urllib.request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
 import hashlib
-import json
 import logging
 
 from . import keys
-from .utils import urlopen_and_read
+from .utils import json_loads, urlopen_and_read
 from .flickrerrors import FlickrError, FlickrAPIError, FlickrServerError
 from .cache import SimpleCache
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 REST_URL = "https://api.flickr.com/services/rest/"
 
 CACHE = None
@@ -60,6 +68,63 @@ def set_timeout(seconds):
 def get_timeout():
     return TIMEOUT
 
+
+# Status codes for which a POST request is retried: the server tells that
+# the request was not processed.
+POST_RETRY_STATUSES = frozenset([429, 503])
+
+
+class _Retry(Retry):
+    """
+        Retry policy of the session. All the Flickr calls are POST requests,
+        including the ones that modify data (photos.delete,
+        photosets.create...), so a POST is only retried when it is known not
+        to have been processed: connection errors, 429 and 503 responses.
+        Other 5xx responses and read errors may happen after the change was
+        applied and are not retried.
+    """
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if (method.upper() == "POST"
+                and status_code not in POST_RETRY_STATUSES):
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _make_session():
+    session = requests.Session()
+    # the JSON responses compress well, always ask for them gzipped
+    session.headers["Accept-Encoding"] = "gzip"
+    # Transient errors are retried by the connection pool with an
+    # exponential backoff. Once the retries are exhausted the last response
+    # is returned and reported as a FlickrServerError by `call_api`.
+    retries = _Retry(total=5, read=0, backoff_factor=0.3,
+                     status_forcelist=[429, 500, 502, 503, 504],
+                     allowed_methods=frozenset(["GET", "POST"]),
+                     respect_retry_after_header=True,
+                     raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=10,
+                                          pool_maxsize=50,
+                                          max_retries=retries))
+    return session
+
+
+# HTTP session shared by all the calls, so that the connections to the
+# Flickr servers are kept alive and reused.
+_SESSION = _make_session()
+
+
+def set_session(session):
+    """Set the `requests.Session` used to perform the calls (e.g. to
+    configure proxies or TLS settings).
+    """
+    global _SESSION
+    _SESSION = session
+
+
+def get_session():
+    return _SESSION
+
+
 def send_request(url, data):
     """send a http request.
     """
@@ -70,6 +135,15 @@ def send_request(url, data):
         raise FlickrError(e.read().split('&')[0])
 
 
+@functools.lru_cache(maxsize=8)
+def _base_params(api_key, raw):
+    """ Parameters added to the arguments of every call.
+    """
+    if raw:
+        return (("api_key", api_key),)
+    return (("api_key", api_key), ("format", "json"), ("nojsoncallback", 1))
+
+
 def call_api(api_key=None, api_secret=None, auth_handler=None,
              needssigning=False, request_url=REST_URL, raw=False, **args):
     """
@@ -97,6 +171,157 @@ def call_api(api_key=None, api_secret=None, auth_handler=None,
             the arguments to pass to the method.
     """
 
+    api_key, api_secret = _resolve_keys(api_key, api_secret, auth_handler)
+
+    args = _format_args(args)
+    args.update(_base_params(api_key, raw))
+
+    args = _build_request(args, api_secret, auth_handler, needssigning,
+                          request_url)
+    return _send_request(request_url, args, raw)
+
+
+def bind(method, api_key=None, api_secret=None, auth_handler=None,
+         needssigning=False, request_url=REST_URL, raw=False, **fixed):
+    """
+        Returns a function calling the Flickr method `method` with the
+        arguments `fixed` and those given to the function, e.g. for
+        pagination loops:
+
+        >>> search = bind("flickr.photos.search", auth_handler=ah,
+        ...               user_id="me", per_page=500)
+        >>> pages = [search(page=i) for i in range(1, 5)]
+
+        The keys and the fixed arguments are resolved once, only the
+        varying arguments are processed by each call. See `call_api` for
+        the parameters.
+    """
+    api_key, api_secret = _resolve_keys(api_key, api_secret, auth_handler)
+    base = _base_params(api_key, raw)
+    fixed = _format_args(fixed)
+    fixed["method"] = method
+
+    def call(**args):
+        params = dict(fixed)
+        params.update(_format_args(args))
+        params.update(base)
+        params = _build_request(params, api_secret, auth_handler,
+                                needssigning, request_url)
+        return _send_request(request_url, params, raw)
+
+    call.__name__ = method
+    return call
+
+
+def stream_api(method, path, api_key=None, api_secret=None,
+               auth_handler=None, needssigning=False, request_url=REST_URL,
+               **args):
+    """
+        Calls the Flickr method `method` and yields one by one the cleaned
+        items of the list found at `path` in the JSON response, e.g.:
+
+        >>> for photo in stream_api("flickr.photos.search",
+        ...                         "photos.photo.item", text="cat"):
+        ...     print(photo["id"])
+
+        `path` is a prefix as understood by `ijson`: the keys are separated
+        by dots and `item` stands for each element of a list. The lists and
+        objects found at `path` are cleaned, the other values are yielded
+        as they are.
+
+        When the `ijson` package is installed the response is parsed while
+        it is received, so that the whole list is never held in memory.
+        Otherwise the response is parsed at once. The cache is not used.
+        See `call_api` for the other parameters.
+    """
+    api_key, api_secret = _resolve_keys(api_key, api_secret, auth_handler)
+    args = _format_args(args)
+    args["method"] = method
+    args.update(_base_params(api_key, False))
+    args = _build_request(args, api_secret, auth_handler, needssigning,
+                          request_url)
+
+    resp = _SESSION.post(request_url, data=args, timeout=get_timeout(),
+                         stream=True)
+    # the connection goes back to the pool only once the response is
+    # closed, also when the caller stops iterating early
+    try:
+        if 500 <= resp.status_code < 600:
+            raise FlickrServerError(resp.status_code,
+                                    resp.content.decode('utf8'))
+
+        if ijson is None:
+            data = json_loads(resp.content)
+            if data["stat"] != "ok":
+                raise FlickrAPIError(data["code"], data["message"])
+            for value in _iter_path(data, path.split(".")):
+                if isinstance(value, (dict, list)):
+                    value = clean_content(value)
+                yield value
+            return
+
+        resp.raw.decode_content = True
+        status = {}
+        depth = 0
+        builder = None
+        for prefix, event, value in ijson.parse(resp.raw, use_float=True):
+            if depth:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                    if not depth:
+                        yield clean_content(builder.value)
+            elif prefix == path:
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    depth = 1
+                else:
+                    yield value
+            elif prefix in ("stat", "code", "message"):
+                status[prefix] = value
+        if status.get("stat", "ok") != "ok":
+            raise FlickrAPIError(status.get("code"), status.get("message"))
+    finally:
+        resp.close()
+
+
+def _iter_path(data, keys):
+    """
+        Yields the values found at the ijson prefix `keys` in the decoded
+        JSON `data`, see `stream_api`.
+    """
+    if not keys:
+        yield data
+        return
+    key, keys = keys[0], keys[1:]
+    if key == "item" and isinstance(data, list):
+        for value in data:
+            yield from _iter_path(value, keys)
+    elif isinstance(data, dict) and key in data:
+        yield from _iter_path(data[key], keys)
+
+
+def _format_args(args):
+    """ Returns the arguments of a call as they are sent: booleans are
+    replaced by integers and lists or tuples by comma separated values.
+    """
+    formatted = {}
+    for k, v in args.items():
+        cls = v.__class__
+        if cls is bool:
+            v = int(v)
+        elif cls is list or cls is tuple:
+            v = ",".join(map(str, v))
+        formatted[k] = v
+    return formatted
+
+
+def _resolve_keys(api_key, api_secret, auth_handler):
+    """ Returns the API key and secret to use for a call.
+    """
     if not api_key:
         if auth_handler is not None:
             api_key = auth_handler.key
@@ -110,51 +335,60 @@ def call_api(api_key=None, api_secret=None, auth_handler=None,
 
     if not api_key or not api_secret:
         raise FlickrError("The Flickr API keys have not been set")
+    return api_key, api_secret
 
-    clean_args(args)
-    args["api_key"] = api_key
-    if not raw:
-        args["format"] = 'json'
-        args["nojsoncallback"] = 1
 
+def _build_request(args, api_secret, auth_handler, needssigning,
+                   request_url):
+    """ Adds the signature to the parameters of a call.
+    """
     if auth_handler is None:
         if needssigning:
-            query_elements = list(args.items())
-            query_elements.sort()
-            sig = keys.API_SECRET + \
-                ["".join(["".join(e) for e in query_elements])]
-            m = hashlib.md5()
-            m.update(sig)
-            api_sig = m.digest()
-            args["api_sig"] = api_sig
+            base = api_secret + "".join(
+                "%s%s" % kv for kv in sorted(args.items()))
+            args["api_sig"] = hashlib.md5(base.encode("utf8")).hexdigest()
     else:
         args = auth_handler.complete_parameters(
             url=request_url, params=args
         )
+    return args
+
 
+def _send_request(request_url, args, raw):
+    """ Posts the parameters of a call, through the cache if it is enabled,
+    and returns the processed response.
+    """
     if CACHE is None:
-        resp = requests.post(request_url, args, timeout=get_timeout())
+        resp = _SESSION.post(request_url, data=args, timeout=get_timeout())
     else:
-        cachekey = {k:v for k,v in args.items() if k not in IGNORED_FIELDS}
-        cachekey = urllib.parse.urlencode(cachekey)
-
-        resp = CACHE.get(cachekey) or requests.post(request_url, args,
-            timeout=get_timeout())
-        if cachekey not in CACHE:
+        ignored = IGNORED_FIELDS
+        cachekey = tuple(sorted(
+            (k, v) for k, v in args.items() if k not in ignored
+        ))
+        if not isinstance(CACHE, SimpleCache):
+            # Django compliant caches only accept string keys
+            cachekey = urllib.parse.urlencode(cachekey)
+
+        resp = CACHE.get(cachekey)
+        if resp is None:
+            resp = _SESSION.post(request_url, data=args,
+                                 timeout=get_timeout())
             CACHE.set(cachekey, resp)
-            logger.debug("NO HIT for cache key: %s" % cachekey)
+            logger.debug("NO HIT for cache key: %s" % (cachekey,))
         else:
-            logger.debug("   HIT for cache key: %s" % cachekey)
+            logger.debug("   HIT for cache key: %s" % (cachekey,))
 
     if raw:
         return resp.content
 
     # catch for all 5xx errors
     if 500 <= resp.status_code < 600:
+        logger.warning("HTTP %i from %s after retries",
+                       resp.status_code, request_url)
         raise FlickrServerError(resp.status_code, resp.content.decode('utf8'))
 
     try:
-        resp = resp.json()
+        resp = json_loads(resp.content)
 
     except ValueError as e:
         logger.error("Could not parse response: %s", str(resp.content))
@@ -167,7 +401,7 @@ def call_api(api_key=None, api_secret=None, auth_handler=None,
     return resp
 
 
-def clean_content(d):
+def _clean_content(d):
     """
     Cleans out recursively the keys coming from the JSON
     dictionary.
@@ -175,26 +409,41 @@ def clean_content(d):
     Namely: "_content" keys are replaces with their associated
         values if they are the only key of the dictionary. Other
         wise they are replaces by a "text" key with the same value.
+
+    The structure is walked with an explicit stack rather than recursive
+    calls: values that are neither dicts nor lists are copied as is.
     """
-    if isinstance(d, dict):
-        d_clean = {}
-        if len(d) == 1 and "_content" in d:
-            return clean_content(d["_content"])
-        for k, v in iteritems(d):
-            if k == "_content":
-                k = "text"
-            d_clean[k] = clean_content(v)
-        return d_clean
-    elif isinstance(d, list):
-        return [clean_content(i) for i in d]
-    else:
-        return d
+    _C = "_content"
+    root = [d]
+    stack = [(root, 0, d)]
+    while stack:
+        parent, key, value = stack.pop()
+        while type(value) is dict and len(value) == 1 and _C in value:
+            value = value[_C]
+        t = type(value)
+        if t is dict:
+            out = {}
+            for k, v in value.items():
+                if k == _C:
+                    k = "text"
+                out[k] = v
+                tv = type(v)
+                if tv is dict or tv is list:
+                    stack.append((out, k, v))
+            parent[key] = out
+        elif t is list:
+            out = list(value)
+            for i, v in enumerate(value):
+                tv = type(v)
+                if tv is dict or tv is list:
+                    stack.append((out, i, v))
+            parent[key] = out
+        else:
+            parent[key] = value
+    return root[0]
 
 
-def clean_args(args):
-    """
-        Reformat the arguments.
-    """
-    for k, v in args.items():
-        if isinstance(v, bool):
-            args[k] = int(v)
+try:
+    from ._clean_content import clean_content
+except ImportError:
+    clean_content = _clean_content
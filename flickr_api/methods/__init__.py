@@ -0,0 +1,374 @@
+"""
+    Description of the Flickr API methods, as returned by
+    flickr.reflection.getMethodInfo.
+
+    The table is split in one module per namespace in the `data` package
+    ('data/photos.py' for the flickr.photos.* methods, ...), generated by
+    `flickr_api.tools.write_methods`. These modules only contain a tuple of
+    constants, loaded from their compiled file in a single step. The module
+    of a namespace is only imported the first time one of its methods is
+    used, either through `get_method` or through the `__methods__`
+    attribute of this module.
+
+    The documentation of the methods (descriptions, example responses...)
+    is not needed to call them. It is stored in the modules of the `docs`
+    package, only imported when it is accessed.
+"""
+
+import collections
+import collections.abc
+import enum
+import functools
+import importlib
+import pkgutil
+import sys
+import types
+
+from . import data, docs
+
+
+@functools.lru_cache(maxsize=None)
+def _prepare_error(error):
+    """
+        Builds the Error object describing an error from its record. The
+        errors with the same record share the same object.
+    """
+    code, message, text = error
+    return Error(code, sys.intern(message), sys.intern(text))
+
+
+class Perms(enum.IntFlag):
+    """
+        Bits of the 'flags' field of a Method. The two lowest bits hold
+        the permission required by the method.
+    """
+    NONE = 0
+    READ = 1
+    WRITE = 2
+    DELETE = 3
+    NEEDS_LOGIN = 4
+    NEEDS_SIGNING = 8
+
+
+PERMS_MASK = 3
+PERMS_NAMES = ("none", "read", "write", "delete")
+
+
+def _getitem(self, key):
+    """
+        __getitem__ of the records of this module: the fields can also be
+        accessed by name, as with the dictionaries previously used to
+        describe the methods.
+    """
+    if isinstance(key, str):
+        if key not in self._fields and key not in self._properties:
+            raise KeyError(key)
+        return getattr(self, key)
+    return tuple.__getitem__(self, key)
+
+
+class Argument(collections.namedtuple("Argument", "name optional text")):
+    """
+        Argument of a Flickr API method.
+    """
+    __slots__ = ()
+    _properties = frozenset()
+    __getitem__ = _getitem
+
+
+class Error(collections.namedtuple("Error", "code message text")):
+    """
+        Error that a Flickr API method can return.
+    """
+    __slots__ = ()
+    _properties = frozenset()
+    __getitem__ = _getitem
+
+
+@functools.lru_cache(maxsize=None)
+def _argument(name, optional, text):
+    """
+        Returns the Argument object with the given fields. Identical
+        arguments of different methods (api_key, page, per_page...) share
+        the same object.
+    """
+    return Argument(sys.intern(name), optional, text)
+
+
+MethodDocs = collections.namedtuple(
+    "MethodDocs", "description arg_texts response explanation")
+
+
+class Method(collections.namedtuple(
+        "Method", "name flags arg_names arg_optional arg_required_mask "
+                  "errors errors_by_code")):
+    """
+        Description of a Flickr API method.
+
+        The documentation ('description', 'arg_texts', 'response' and
+        'explanation' properties) is loaded on first access, see
+        `get_docs`.
+
+        'flags' packs the required permission and whether the method needs
+        login and signing (see `Perms`); they are also available as the
+        'requiredperms', 'needslogin' and 'needssigning' properties.
+
+        The arguments are described by three parallel tuples (names,
+        optional flags and descriptions). 'arg_required_mask' has the
+        bit i set when the i-th argument is required.
+
+        The fields can also be accessed by name, as with the dictionaries
+        previously used to describe the methods: method["needslogin"].
+    """
+    __slots__ = ()
+    _properties = frozenset(
+        ("arguments", "needslogin", "needssigning", "requiredperms")
+        + MethodDocs._fields)
+    __getitem__ = _getitem
+
+    @property
+    def description(self):
+        return get_docs(self.name).description
+
+    @property
+    def arg_texts(self):
+        return get_docs(self.name).arg_texts
+
+    @property
+    def response(self):
+        return get_docs(self.name).response
+
+    @property
+    def explanation(self):
+        return get_docs(self.name).explanation
+
+    @property
+    def needslogin(self):
+        return bool(self.flags & Perms.NEEDS_LOGIN)
+
+    @property
+    def needssigning(self):
+        return bool(self.flags & Perms.NEEDS_SIGNING)
+
+    @property
+    def requiredperms(self):
+        """ Name of the required permission: 'none', 'read', 'write' or
+        'delete'.
+        """
+        return PERMS_NAMES[self.flags & PERMS_MASK]
+
+    @property
+    def arguments(self):
+        """ Tuple of the arguments of the method (Argument objects).
+        """
+        return tuple(map(_argument, self.arg_names, self.arg_optional,
+                         self.arg_texts))
+
+    def missing_arguments(self, names):
+        """ Returns the required arguments of the method that are not in
+        'names'.
+        """
+        provided = 0
+        for i, n in enumerate(self.arg_names):
+            if n in names:
+                provided |= 1 << i
+        missing = self.arg_required_mask & ~provided
+        if not missing:
+            return []
+        return [n for i, n in enumerate(self.arg_names) if missing >> i & 1]
+
+
+def _prepare(record, common_errors):
+    """
+        Builds the Method object from a record of a data module: the
+        generic errors are put back in the 'errors' tuple (the same objects
+        are shared by all the methods) and the errors are indexed by code
+        in 'errors_by_code'.
+    """
+    name, flags, arg_names, arg_optional, errors, common_mask = record
+    errors = tuple(_prepare_error(e) for e in errors)
+    errors += tuple(e for i, e in enumerate(common_errors)
+                    if common_mask >> i & 1)
+    required_mask = 0
+    for i, optional in enumerate(arg_optional):
+        if not optional:
+            required_mask |= 1 << i
+    return Method(
+        name=sys.intern(name),
+        flags=Perms(flags),
+        arg_names=tuple(sys.intern(a) for a in arg_names),
+        arg_optional=arg_optional,
+        arg_required_mask=required_mask,
+        errors=errors,
+        errors_by_code=types.MappingProxyType(
+            {e.code: e for e in errors}),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_namespace(namespace):
+    """
+        Returns the records of the methods of 'namespace' (second component
+        of their name, e.g. "photos") indexed by name. The Method objects
+        are only built when the methods are accessed, see `get_method`.
+    """
+    if namespace not in namespaces():
+        return types.MappingProxyType({})
+    module = importlib.import_module("%s.%s" % (data.__name__, namespace))
+    return types.MappingProxyType(
+        {record[0]: record for record in module.METHODS})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_docs(namespace):
+    module = importlib.import_module("%s.%s" % (docs.__name__, namespace))
+    return {name: MethodDocs(*record) for name, *record in module.DOCS}
+
+
+def get_docs(name):
+    """
+        Returns the documentation of the method 'name' (MethodDocs named
+        tuple). The documentation of a namespace is imported on first use.
+    """
+    return _load_docs(name.split(".")[1])[name]
+
+
+def get_description(name, argument=None):
+    """
+        Returns the description of the method 'name' or, if 'argument' is
+        given, the description of this argument of the method.
+    """
+    docs = get_docs(name)
+    if argument is None:
+        return docs.description
+    try:
+        i = get_method(name).arg_names.index(argument)
+    except ValueError:
+        raise KeyError(argument)
+    return docs.arg_texts[i]
+
+
+def example_response(name):
+    """
+        Returns the example of response of the method 'name' given in the
+        Flickr documentation (XML string), or None.
+    """
+    return get_docs(name).response
+
+
+@functools.lru_cache(maxsize=None)
+def namespaces():
+    """
+        Returns the sorted tuple of the namespaces for which a data module
+        exists.
+    """
+    return tuple(sorted(m.name for m in pkgutil.iter_modules(data.__path__)))
+
+
+@functools.lru_cache(maxsize=None)
+def method_names():
+    """
+        Returns the sorted tuple of the names of all the methods. The
+        frozen list of `flickr_api._methods_frozen` is used when available,
+        so that listing the methods does not load them.
+    """
+    try:
+        from .._methods_frozen import METHODS
+        return METHODS
+    except ImportError:
+        return tuple(sorted(name for namespace in namespaces()
+                            for name in _load_namespace(namespace)))
+
+
+class _Methods(collections.abc.Mapping):
+    """
+        Read-only mapping of the method names to their description. The
+        namespaces are loaded on demand.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, name):
+        return get_method(name)
+
+    def __contains__(self, name):
+        try:
+            return name in _load_namespace(name.split(".")[1])
+        except (AttributeError, IndexError):
+            return False
+
+    def __iter__(self):
+        return iter(method_names())
+
+    def __len__(self):
+        return len(method_names())
+
+    def __repr__(self):
+        return "<Flickr API methods>"
+
+
+_METHODS = _Methods()
+
+
+def load_methods():
+    """
+        Returns the read-only mapping of the method names to their
+        description. Each namespace module is only imported when one of
+        its methods is first accessed, and the description of a method is
+        only built when it is first accessed.
+    """
+    return _METHODS
+
+
+@functools.lru_cache(maxsize=None)
+def common_errors():
+    """
+        Returns the generic errors that most methods can return (invalid
+        signature, invalid API key, ...).
+    """
+    return tuple(_prepare_error(e) for e in data.COMMON_ERRORS)
+
+
+@functools.lru_cache(maxsize=None)
+def get_method(name):
+    """
+        Returns the description of the method 'name' (Method object). It is
+        built from the record of the method on first access.
+    """
+    try:
+        namespace = name.split(".")[1]
+    except (AttributeError, IndexError):
+        raise KeyError(name)
+    return _prepare(_load_namespace(namespace)[name], common_errors())
+
+
+@functools.lru_cache(maxsize=None)
+def _namespace_index():
+    index = {}
+    for name in method_names():
+        parts = name.split(".")
+        for i in range(1, len(parts)):
+            namespace = sys.intern(".".join(parts[:i]))
+            index.setdefault(namespace, []).append(name)
+    return {namespace: tuple(names) for namespace, names in index.items()}
+
+
+def methods_in(namespace):
+    """
+        Returns the sorted tuple of the names of the methods defined in
+        'namespace' (e.g. "flickr.photos"), including its sub-namespaces.
+    """
+    return _namespace_index().get(namespace, ())
+
+
+def get_error(name, code):
+    """
+        Returns the description of the error 'code' of the method 'name',
+        or None if the method does not document this error.
+    """
+    return get_method(name).errors_by_code.get(int(code))
+
+
+def __getattr__(name):
+    if name == "__methods__":
+        return load_methods()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -0,0 +1,20 @@
+"""
+    Generic errors of the Flickr API methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+COMMON_ERRORS = (
+    (96, 'Invalid signature', 'The passed signature was invalid.'),
+    (97, 'Missing signature', 'The call required signing but no signature was sent.'),
+    (98, 'Login failed / Invalid auth token', 'The login details or auth token passed were invalid.'),
+    (99, 'User not logged in / Insufficient permissions', 'The method requires user authentication but the user was not logged in, or the authenticated method call did not have the required permissions.'),
+    (100, 'Invalid API Key', 'The API key passed was not valid or has expired.'),
+    (105, 'Service currently unavailable', 'The requested service is temporarily unavailable.'),
+    (108, 'Invalid frob', 'The specified frob does not exist or has already been used.'),
+    (111, 'Format "xxx" not found', 'The requested response format was not found.'),
+    (112, 'Method "xxx" not found', 'The requested method was not found.'),
+    (114, 'Invalid SOAP envelope', 'The SOAP envelope send in the request could not be parsed.'),
+    (115, 'Invalid XML-RPC Method Call', 'The XML-RPC request document could not be parsed.'),
+    (116, 'Bad URL found', 'One or more arguments contained a URL that has been used for abuse on Flickr.'),
+)
@@ -0,0 +1,10 @@
+"""
+    Description of the flickr.activity methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.activity.userComments', 13, ('api_key', 'per_page', 'page'), (False, True, True), (), 4031),
+    ('flickr.activity.userPhotos', 13, ('api_key', 'timeframe', 'per_page', 'page'), (False, True, True, True), (), 4031),
+)
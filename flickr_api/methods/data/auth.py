@@ -0,0 +1,14 @@
+"""
+    Description of the flickr.auth methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.auth.checkToken', 0, ('api_key', 'auth_token'), (False, False), (), 4020),
+    ('flickr.auth.getFrob', 0, ('api_key',), (False,), (), 4019),
+    ('flickr.auth.getFullToken', 0, ('api_key', 'mini_token'), (False, False), ((1, 'Mini-token not found', 'The passed mini-token was not valid.'),), 4016),
+    ('flickr.auth.getToken', 0, ('api_key', 'frob'), (False, False), (), 4083),
+    ('flickr.auth.oauth.checkToken', 8, ('api_key', 'oauth_token'), (False, False), (), 4019),
+    ('flickr.auth.oauth.getAccessToken', 8, ('api_key',), (False,), (), 4019),
+)
@@ -0,0 +1,11 @@
+"""
+    Description of the flickr.blogs methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.blogs.getList', 13, ('api_key', 'service'), (False, True), (), 4031),
+    ('flickr.blogs.getServices', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.blogs.postPhoto', 14, ('api_key', 'blog_id', 'photo_id', 'title', 'description', 'blog_password', 'service'), (False, True, False, False, False, True, True), ((1, 'Blog not found', 'The blog id was not the id of a blog belonging to the calling user'), (2, 'Photo not found', 'The photo id was not the id of a public photo'), (3, 'Password needed', 'A password is not stored for the blog and one was not passed with the request'), (4, 'Blog post failed', 'The blog posting failed (a blogging API failure of some sort)')), 4031),
+)
@@ -0,0 +1,10 @@
+"""
+    Description of the flickr.cameras methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.cameras.getBrandModels', 0, ('api_key', 'brand'), (False, False), ((1, 'Brand not found', 'Unable to find the given brand ID.'),), 4016),
+    ('flickr.cameras.getBrands', 0, ('api_key',), (False,), (), 4016),
+)
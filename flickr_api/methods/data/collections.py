@@ -0,0 +1,10 @@
+"""
+    Description of the flickr.collections methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.collections.getInfo', 13, ('api_key', 'collection_id'), (False, False), ((1, 'Collection not found', 'The requested collection could not be found or is not visible to the calling user.'),), 4031),
+    ('flickr.collections.getTree', 0, ('api_key', 'collection_id', 'user_id'), (False, True, True), ((1, 'User not found', 'The specified user could not be found.'), (2, 'Collection not found', 'The specified collection does not exist.')), 4016),
+)
@@ -0,0 +1,9 @@
+"""
+    Description of the flickr.commons methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.commons.getInstitutions', 0, ('api_key',), (False,), (), 4016),
+)
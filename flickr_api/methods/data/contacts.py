@@ -0,0 +1,12 @@
+"""
+    Description of the flickr.contacts methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.contacts.getList', 13, ('api_key', 'filter', 'page', 'per_page', 'sort'), (False, True, True, True, True), ((1, 'Invalid sort parameter.', 'The possible values are: name and time.'),), 4031),
+    ('flickr.contacts.getListRecentlyUploaded', 13, ('api_key', 'date_lastupload', 'filter'), (False, True, True), (), 4031),
+    ('flickr.contacts.getPublicList', 0, ('api_key', 'user_id', 'page', 'per_page', 'show_more'), (False, False, True, True, True), ((1, 'User not found', 'The specified user NSID was not a valid user.'),), 4016),
+    ('flickr.contacts.getTaggingSuggestions', 13, ('api_key', 'include_self', 'include_address_book', 'per_page', 'page'), (False, True, True, True, True), (), 4031),
+)
@@ -0,0 +1,13 @@
+"""
+    Description of the flickr.favorites methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.favorites.add', 14, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id.'), (2, 'Photo is owned by you', 'The photo belongs to the user and so cannot be added to their favorites.'), (3, 'Photo is already in favorites', "The photo is already in the user's list of favorites."), (4, 'User cannot see photo', 'The user does not have permission to add the photo to their favorites.')), 4031),
+    ('flickr.favorites.getContext', 0, ('api_key', 'photo_id', 'user_id', 'num_prev', 'num_next', 'extras'), (False, False, False, True, True, True), ((1, 'Photo not found', 'The photo id passed was not a valid photo id, or was the id of a photo that the calling user does not have permission to view.'), (2, 'User not found', 'The specified user was not found.'), (3, 'Photo not a favorite', 'The specified photo is not a favorite of the specified user.')), 4016),
+    ('flickr.favorites.getList', 13, ('api_key', 'user_id', 'jump_to', 'min_fave_date', 'max_fave_date', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True), ((1, 'User not found', 'The specified user NSID was not a valid flickr user.'),), 4031),
+    ('flickr.favorites.getPublicList', 0, ('api_key', 'user_id', 'jump_to', 'min_fave_date', 'max_fave_date', 'extras', 'per_page', 'page'), (False, False, True, True, True, True, True, True), ((1, 'User not found', 'The specified user NSID was not a valid flickr user.'),), 4016),
+    ('flickr.favorites.remove', 14, ('api_key', 'photo_id', 'user_id'), (False, False, True), ((1, 'Photo not in favorites', "The photo id passed was not in the user's favorites."), (2, "Cannot remove photo from that user's favorites", 'user_id was passed as an argument, but photo_id is not owned by the authenticated user.'), (3, 'User not found', 'Invalid user_id argument.')), 4031),
+)
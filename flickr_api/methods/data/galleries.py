@@ -0,0 +1,17 @@
+"""
+    Description of the flickr.galleries methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.galleries.addPhoto', 14, ('api_key', 'gallery_id', 'photo_id', 'comment'), (False, False, False, True), ((1, 'Required parameter missing', 'One or more required parameters was not included with your API call.'), (2, 'Invalid gallery ID', 'That gallery could not be found.'), (3, 'Invalid photo ID', 'The requested photo could not be found.'), (4, 'Invalid comment', 'The comment body could not be validated.'), (5, 'Failed to add photo', 'Unable to add the photo to the gallery.')), 4031),
+    ('flickr.galleries.create', 14, ('api_key', 'title', 'description', 'primary_photo_id'), (False, False, False, True), ((1, 'Required parameter missing', 'One or more of the required parameters was missing from your API call.'), (2, 'Invalid title or description', 'The title or the description could not be validated.'), (3, 'Failed to add gallery', 'There was a problem creating the gallery.')), 4031),
+    ('flickr.galleries.editMeta', 14, ('api_key', 'gallery_id', 'title', 'description'), (False, False, False, True), ((1, 'Required parameter missing', 'One or more required parameters was missing from your request.'), (2, 'Invalid title or description', 'The title or description arguments could not be validated.')), 4031),
+    ('flickr.galleries.editPhoto', 14, ('api_key', 'gallery_id', 'photo_id', 'comment'), (False, False, False, False), ((1, 'Invalid gallery ID', 'That gallery could not be found.'),), 4031),
+    ('flickr.galleries.editPhotos', 14, ('api_key', 'gallery_id', 'primary_photo_id', 'photo_ids'), (False, False, False, False), (), 4031),
+    ('flickr.galleries.getInfo', 0, ('api_key', 'gallery_id'), (False, False), (), 4016),
+    ('flickr.galleries.getList', 0, ('api_key', 'user_id', 'per_page', 'page'), (False, False, True, True), (), 4016),
+    ('flickr.galleries.getListForPhoto', 0, ('api_key', 'photo_id', 'per_page', 'page'), (False, False, True, True), (), 4016),
+    ('flickr.galleries.getPhotos', 0, ('api_key', 'gallery_id', 'extras', 'per_page', 'page'), (False, False, True, True, True), (), 4016),
+)
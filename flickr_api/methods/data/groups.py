@@ -0,0 +1,28 @@
+"""
+    Description of the flickr.groups methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.groups.browse', 13, ('api_key', 'cat_id'), (False, True), ((1, 'Category not found', 'The value passed for cat_id was not a valid category id.'),), 4031),
+    ('flickr.groups.discuss.replies.add', 14, ('api_key', 'topic_id', 'message'), (False, False, False), ((1, 'Topic not found', 'The topic_id is invalid.'), (2, 'Cannot post to group', 'Either this account is not a member of the group, or discussion in this group is disabled.\r\n'), (3, 'Missing required arguments', 'The topic_id and message are required.')), 4031),
+    ('flickr.groups.discuss.replies.delete', 15, ('api_key', 'topic_id', 'reply_id'), (False, False, False), ((1, 'Topic not found', 'The topic_id is invalid.'), (2, 'Reply not found', 'The reply_id is invalid.'), (3, 'Cannot delete reply', 'Replies can only be edited by their owner.')), 4031),
+    ('flickr.groups.discuss.replies.edit', 14, ('api_key', 'topic_id', 'reply_id', 'message'), (False, False, False, False), ((1, 'Topic not found', 'The topic_id is invalid'), (2, 'Reply not found', 'The reply_id is invalid.'), (3, 'Missing required arguments', 'The topic_id and reply_id are required.'), (4, 'Cannot edit reply', 'Replies can only be edited by their owner.'), (5, 'Cannot post to group', 'Either this account is not a member of the group, or discussion in this group is disabled.')), 4031),
+    ('flickr.groups.discuss.replies.getInfo', 0, ('api_key', 'topic_id', 'reply_id'), (False, False, False), ((1, 'Topic not found', 'The topic_id is invalid'), (2, 'Reply not found', 'The reply_id is invalid')), 4016),
+    ('flickr.groups.discuss.replies.getList', 0, ('api_key', 'topic_id', 'per_page', 'page'), (False, False, False, True), ((1, 'Topic not found', 'The topic_id is invalid.'),), 4016),
+    ('flickr.groups.discuss.topics.add', 14, ('api_key', 'group_id', 'subject', 'message'), (False, False, False, False), ((1, 'Group not found', 'The group by that ID does not exist\r\n'), (2, 'Cannot post to group', 'Either this account is not a member of the group, or discussion in this group is disabled.'), (3, 'Message is too long', 'The post message is too long.'), (4, 'Missing required arguments', 'Subject and message are required.')), 4031),
+    ('flickr.groups.discuss.topics.getInfo', 0, ('api_key', 'topic_id'), (False, False), ((1, 'Topic not found', 'The topic_id is invalid'),), 4016),
+    ('flickr.groups.discuss.topics.getList', 0, ('api_key', 'group_id', 'per_page', 'page'), (False, False, True, True), ((1, 'Group not found', 'The group_id is invalid'),), 4016),
+    ('flickr.groups.getInfo', 0, ('api_key', 'group_id', 'lang'), (False, False, True), ((1, 'Group not found', "The group NSID passed did not refer to a group that the calling user can see - either an invalid group is or a group that can't be seen by the calling user."),), 4016),
+    ('flickr.groups.join', 14, ('api_key', 'group_id', 'accept_rules'), (False, False, True), ((1, 'Required arguments missing', "The group_id doesn't exist"), (2, 'Group does not exist', 'The Group does not exist'), (3, 'Group not availabie to the account', 'The authed account does not have permission to view/join the group.'), (4, 'Account is already in that group', 'The authed account has previously joined this group'), (5, 'Membership in group is by invitation only.', 'Use flickr.groups.joinRequest to contact the administrations for an invitation.'), (6, 'User must accept the group rules before joining', 'The user must read and accept the rules before joining. Please see the accept_rules argument for this method.'), (10, 'Account in maximum number of groups', 'The account is a member of the maximum number of groups.')), 4031),
+    ('flickr.groups.joinRequest', 14, ('api_key', 'group_id', 'message', 'accept_rules'), (False, False, False, False), ((1, 'Required arguments missing', 'The group_id or message argument are missing.'), (2, 'Group does not exist', 'The Group does not exist'), (3, 'Group not available to the account', 'The authed account does not have permission to view/join the group.'), (4, 'Account is already in that group', 'The authed account has previously joined this group'), (5, 'Group is public and open', 'The group does not require an invitation to join, please use flickr.groups.join.'), (6, 'User must accept the group rules before joining', 'The user must read and accept the rules before joining. Please see the accept_rules argument for this method.'), (7, 'User has already requested to join that group', 'A request has already been sent and is pending approval.')), 4031),
+    ('flickr.groups.leave', 15, ('api_key', 'group_id', 'delete_photos'), (False, False, True), ((1, 'Required arguments missing', "The group_id doesn't exist"), (2, 'Group does not exist', 'The group by that ID does not exist'), (3, 'Account is not in that group', 'The user is not a member of the group that was specified')), 4031),
+    ('flickr.groups.members.getList', 13, ('api_key', 'group_id', 'membertypes', 'per_page', 'page'), (False, False, True, True, True), ((1, 'Group not found', ''),), 4031),
+    ('flickr.groups.pools.add', 14, ('api_key', 'photo_id', 'group_id'), (False, False, False), ((1, 'Photo not found', 'The photo id passed was not the id of a photo owned by the caling user.'), (2, 'Group not found', 'The group id passed was not a valid id for a group the user is a member of.'), (3, 'Photo already in pool', 'The specified photo is already in the pool for the specified group.'), (4, 'Photo in maximum number of pools', 'The photo has already been added to the maximum allowed number of pools.'), (5, 'Photo limit reached', 'The user has already added the maximum amount of allowed photos to the pool.'), (6, 'Your Photo has been added to the Pending Queue for this Pool', 'The pool is moderated, and the photo has been added to the Pending Queue. If it is approved by a group administrator, it will be added to the pool.'), (7, 'Your Photo has already been added to the Pending Queue for this Pool', 'The pool is moderated, and the photo has already been added to the Pending Queue.'), (8, 'Content not allowed', 'The content has been disallowed from the pool by the group admin(s).'), (10, 'Maximum number of photos in Group Pool', 'A group pool has reached the upper limit for the number of photos allowed.')), 4031),
+    ('flickr.groups.pools.getContext', 0, ('api_key', 'photo_id', 'group_id', 'num_prev', 'num_next', 'extras'), (False, False, False, True, True, True), ((1, 'Photo not found', 'The photo id passed was not a valid photo id, or was the id of a photo that the calling user does not have permission to view.'), (2, 'Photo not in pool', "The specified photo is not in the specified group's pool."), (3, 'Group not found', "The specified group nsid was not a valid group or the caller does not have permission to view the group's pool.")), 4016),
+    ('flickr.groups.pools.getGroups', 13, ('api_key', 'page', 'per_page'), (False, True, True), (), 4031),
+    ('flickr.groups.pools.getPhotos', 0, ('api_key', 'group_id', 'tags', 'user_id', 'jump_to', 'extras', 'per_page', 'page'), (False, False, True, True, True, True, True, True), ((1, 'Group not found', 'The group id passed was not a valid group id.'), (2, "You don't have permission to view this pool", 'The logged in user (if any) does not have permission to view the pool for this group.'), (3, 'Unknown user', 'The user specified by user_id does not exist.')), 4016),
+    ('flickr.groups.pools.remove', 14, ('api_key', 'photo_id', 'group_id'), (False, False, False), ((1, 'Group not found', 'The group_id passed did not refer to a valid group.'), (2, 'Photo not in pool', 'The photo_id passed was not a valid id of a photo in the group pool.'), (3, 'Insufficient permission to remove photo', "The calling user doesn't own the photo and is not an administrator of the group, so may not remove the photo from the pool.")), 4031),
+    ('flickr.groups.search', 0, ('api_key', 'text', 'per_page', 'page'), (False, False, True, True), ((1, 'No text passed', 'The required text argument was ommited.'),), 4016),
+)
@@ -0,0 +1,9 @@
+"""
+    Description of the flickr.interestingness methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.interestingness.getList', 0, ('api_key', 'date', 'use_panda', 'extras', 'per_page', 'page'), (False, True, True, True, True, True), ((1, 'Not a valid date string.', 'The date string passed did not validate. All dates must be formatted : YYYY-MM-DD'),), 4016),
+)
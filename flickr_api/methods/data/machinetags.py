@@ -0,0 +1,13 @@
+"""
+    Description of the flickr.machinetags methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.machinetags.getNamespaces', 0, ('api_key', 'predicate', 'per_page', 'page'), (False, True, True, True), ((1, 'Not a valid predicate.', 'Missing or invalid predicate argument.'),), 4016),
+    ('flickr.machinetags.getPairs', 0, ('api_key', 'namespace', 'predicate', 'per_page', 'page'), (False, True, True, True, True), ((1, 'Not a valid namespace', 'Missing or invalid namespace argument.'), (2, 'Not a valid predicate', 'Missing or invalid predicate argument.')), 4016),
+    ('flickr.machinetags.getPredicates', 0, ('api_key', 'namespace', 'per_page', 'page'), (False, True, True, True), ((1, 'Not a valid namespace', 'Missing or invalid namespace argument.'),), 4016),
+    ('flickr.machinetags.getRecentValues', 0, ('api_key', 'namespace', 'predicate', 'added_since'), (False, True, True, True), (), 4016),
+    ('flickr.machinetags.getValues', 0, ('api_key', 'namespace', 'predicate', 'per_page', 'page', 'usage'), (False, False, False, True, True, True), ((1, 'Not a valid namespace', 'Missing or invalid namespace argument.'), (2, 'Not a valid predicate', 'Missing or invalid predicate argument.')), 4016),
+)
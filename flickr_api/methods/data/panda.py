@@ -0,0 +1,10 @@
+"""
+    Description of the flickr.panda methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.panda.getList', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.panda.getPhotos', 0, ('api_key', 'panda_name', 'extras', 'per_page', 'page'), (False, False, True, True, True), ((1, 'Required parameter missing.', 'One or more required parameters was not included with your request.'), (2, 'Unknown panda', "You requested a panda we haven't met yet.")), 4016),
+)
@@ -0,0 +1,18 @@
+"""
+    Description of the flickr.people methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.people.findByEmail', 0, ('api_key', 'find_email'), (False, False), ((1, 'User not found', 'No user with the supplied email address was found.'),), 4016),
+    ('flickr.people.findByUsername', 0, ('api_key', 'username'), (False, False), ((1, 'User not found', 'No user with the supplied username was found.'),), 4016),
+    ('flickr.people.getGroups', 13, ('api_key', 'user_id', 'extras'), (False, False, True), ((1, 'User not found', 'The user id passed did not match a Flickr user.'),), 4031),
+    ('flickr.people.getInfo', 0, ('api_key', 'user_id', 'url', 'fb_connected', 'storage'), (False, False, False, True, True), ((1, 'User not found', 'The user id passed did not match a Flickr user.'),), 4016),
+    ('flickr.people.getLimits', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.people.getPhotos', 13, ('api_key', 'user_id', 'safe_search', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'content_type', 'privacy_filter', 'extras', 'per_page', 'page'), (False, False, True, True, True, True, True, True, True, True, True, True), ((1, 'Required arguments missing', ''), (2, 'Unknown user', 'A user_id was passed which did not match a valid flickr user.')), 4031),
+    ('flickr.people.getPhotosOf', 0, ('api_key', 'user_id', 'owner_id', 'extras', 'per_page', 'page'), (False, False, True, True, True, True), ((1, 'User not found.', 'A user_id was passed which did not match a valid flickr user.'),), 4016),
+    ('flickr.people.getPublicGroups', 0, ('api_key', 'user_id', 'invitation_only'), (False, False, True), ((1, 'User not found', 'The user id passed did not match a Flickr user.'),), 4016),
+    ('flickr.people.getPublicPhotos', 0, ('api_key', 'user_id', 'safe_search', 'extras', 'per_page', 'page'), (False, False, True, True, True, True), ((1, 'User not found', 'The user NSID passed was not a valid user NSID.'),), 4016),
+    ('flickr.people.getUploadStatus', 13, ('api_key',), (False,), (), 4031),
+)
@@ -0,0 +1,65 @@
+"""
+    Description of the flickr.photos methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.photos.addTags', 14, ('api_key', 'photo_id', 'tags'), (False, False, False), ((1, 'Photo not found', 'The photo id passed was not the id of a photo that the calling user can add tags to. It could be an invalid id, or the user may not have permission to add tags to it.'), (2, 'Maximum number of tags reached', 'The maximum number of tags for the photo has been reached - no more tags can be added. If the current count is less than the maximum, but adding all of the tags for this request would go over the limit, the whole request is ignored. I.E. when you get this message, none of the requested tags have been added.')), 4031),
+    ('flickr.photos.comments.addComment', 14, ('api_key', 'photo_id', 'comment_text'), (False, False, False), ((1, 'Photo not found.', 'The photo id passed was not a valid photo id'), (8, 'Blank comment.', 'Comment text can not be blank'), (9, 'User is posting comments too fast.', 'The user has reached the limit for number of comments posted during a specific time period.  Wait a bit and try again.')), 4031),
+    ('flickr.photos.comments.deleteComment', 14, ('api_key', 'comment_id'), (False, False), ((1, 'Photo not found.', 'The requested comment is against a photo which no longer exists.'), (2, 'Comment not found.', 'The comment id passed was not a valid comment id')), 4031),
+    ('flickr.photos.comments.editComment', 14, ('api_key', 'comment_id', 'comment_text'), (False, False, False), ((1, 'Photo not found.', 'The requested comment is against a photo which no longer exists.'), (2, 'Comment not found.', 'The comment id passed was not a valid comment id'), (8, 'Blank comment.', 'Comment text can not be blank')), 4031),
+    ('flickr.photos.comments.getList', 0, ('api_key', 'photo_id', 'min_comment_date', 'max_comment_date', 'page', 'per_page', 'include_faves'), (False, False, True, True, True, True, True), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'),), 4016),
+    ('flickr.photos.comments.getRecentForContacts', 13, ('api_key', 'date_lastcomment', 'contacts_filter', 'extras', 'per_page', 'page'), (False, True, True, True, True, True), (), 4031),
+    ('flickr.photos.delete', 15, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id was not the id of a photo belonging to the calling user.'),), 4031),
+    ('flickr.photos.geo.batchCorrectLocation', 14, ('api_key', 'lat', 'lon', 'accuracy', 'place_id', 'woe_id'), (False, False, False, False, True, True), ((1, 'Required arguments missing', 'Some or all of the required arguments were not supplied.'), (2, 'Not a valid latitude', 'The latitude argument failed validation.'), (3, 'Not a valid longitude', 'The longitude argument failed validation.'), (4, 'Not a valid accuracy', 'The accuracy argument failed validation.'), (5, 'Not a valid Places ID', 'An invalid Places (or WOE) ID was passed with the API call.'), (6, 'No photos geotagged at that location', 'There were no geotagged photos found for the authed user at the supplied latitude, longitude and accuracy.')), 4031),
+    ('flickr.photos.geo.correctLocation', 14, ('api_key', 'photo_id', 'place_id', 'woe_id', 'foursquare_id'), (False, False, True, True, False), ((1, 'User has not configured default viewing settings for location data.', 'Before users may assign location data to a photo they must define who, by default, may view that information. Users can edit this preference at <a href="http://www.flickr.com/account/geo/privacy/">http://www.flickr.com/account/geo/privacy/</a>'), (2, 'Missing place ID', 'No place ID was passed to the method'), (3, 'Not a valid place ID', 'The place ID passed to the method could not be identified'), (4, 'Server error correcting location.', 'There was an error trying to correct the location.')), 4031),
+    ('flickr.photos.geo.getLocation', 0, ('api_key', 'photo_id', 'extras'), (False, False, True), ((1, 'Photo not found.', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Photo has no location information.', 'The photo requested has no location data or is not viewable by the calling user.')), 4016),
+    ('flickr.photos.geo.getPerms', 13, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Photo has no location information', 'The photo requested has no location data or is not viewable by the calling user.')), 4031),
+    ('flickr.photos.geo.photosForLocation', 13, ('api_key', 'lat', 'lon', 'accuracy', 'extras', 'per_page', 'page'), (False, False, False, True, True, True, True), ((1, 'Required arguments missing', 'One or more required arguments was missing from the method call.'), (2, 'Not a valid latitude', 'The latitude argument failed validation.'), (3, 'Not a valid longitude', 'The longitude argument failed validation.'), (4, 'Not a valid accuracy', 'The accuracy argument failed validation.')), 4031),
+    ('flickr.photos.geo.removeLocation', 14, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Photo has no location information', 'The specified photo has not been geotagged - there is nothing to remove.')), 4031),
+    ('flickr.photos.geo.setContext', 14, ('api_key', 'photo_id', 'context'), (False, False, False), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Not a valid context', 'The context ID passed to the method is invalid.')), 4031),
+    ('flickr.photos.geo.setLocation', 14, ('api_key', 'photo_id', 'lat', 'lon', 'accuracy', 'context', 'bookmark_id', 'is_public', 'is_contact', 'is_friend', 'is_family', 'foursquare_id', 'woeid'), (False, False, False, False, True, True, True, True, True, True, True, True, True), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Required arguments missing.', 'Some or all of the required arguments were not supplied.'), (3, 'Not a valid latitude.', 'The latitude argument failed validation.'), (4, 'Not a valid longitude.', 'The longitude argument failed validation.'), (5, 'Not a valid accuracy.', 'The accuracy argument failed validation.'), (6, 'Server error.', 'There was an unexpected problem setting location information to the photo.'), (7, 'User has not configured default viewing settings for location data.', 'Before users may assign location data to a photo they must define who, by default, may view that information. Users can edit this preference at <a href="http://www.flickr.com/account/geo/privacy/">http://www.flickr.com/account/geo/privacy/</a>')), 4031),
+    ('flickr.photos.geo.setPerms', 14, ('api_key', 'is_public', 'is_contact', 'is_friend', 'is_family', 'photo_id'), (False, False, False, False, False, False), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Photo has no location information', 'The photo requested has no location data or is not viewable by the calling user.'), (3, 'Required arguments missing.', 'Some or all of the required arguments were not supplied.')), 4031),
+    ('flickr.photos.getAllContexts', 0, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not the id of a valid photo.'),), 4016),
+    ('flickr.photos.getContactsPhotos', 13, ('api_key', 'count', 'just_friends', 'single_photo', 'include_self', 'extras'), (False, True, True, True, True, True), (), 4031),
+    ('flickr.photos.getContactsPublicPhotos', 0, ('api_key', 'user_id', 'count', 'just_friends', 'single_photo', 'include_self', 'extras'), (False, False, True, True, True, True, True), ((1, 'User not found', 'The user NSID passed was not a valid user NSID.'),), 4016),
+    ('flickr.photos.getContext', 0, ('api_key', 'photo_id', 'num_prev', 'num_next', 'extras', 'order_by'), (False, False, True, True, True, True), ((1, 'Photo not found', 'The photo id passed was not a valid photo id, or was the id of a photo that the calling user does not have permission to view.'),), 4016),
+    ('flickr.photos.getCounts', 13, ('api_key', 'dates', 'taken_dates'), (False, True, True), ((1, 'No dates specified', 'Neither dates nor taken_dates were specified.'),), 4031),
+    ('flickr.photos.getExif', 0, ('api_key', 'photo_id', 'secret'), (False, False, True), ((1, 'Photo not found', 'The photo id was either invalid or was for a photo not viewable by the calling user.'), (2, 'Permission denied', 'The owner of the photo does not want to share EXIF data.')), 4016),
+    ('flickr.photos.getFavorites', 0, ('api_key', 'photo_id', 'page', 'per_page'), (False, False, True, True), ((1, 'Photo not found', 'The specified photo does not exist, or the calling user does not have permission to view it.'),), 4016),
+    ('flickr.photos.getInfo', 0, ('api_key', 'photo_id', 'secret', 'humandates', 'privacy_filter', 'get_contexts', 'get_geofences', 'extras'), (False, False, True, True, True, True, True, True), ((1, 'Photo not found.', 'The photo id was either invalid or was for a photo not viewable by the calling user.'),), 4016),
+    ('flickr.photos.getNotInSet', 13, ('api_key', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'privacy_filter', 'media', 'min_upload_date', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True, True, True), (), 4031),
+    ('flickr.photos.getPerms', 13, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id of a photo belonging to the calling user.'),), 4031),
+    ('flickr.photos.getRecent', 0, ('api_key', 'jump_to', 'extras', 'per_page', 'page'), (False, True, True, True, True), ((1, 'bad value for jump_to, must be valid photo id.', ''),), 4016),
+    ('flickr.photos.getSizes', 0, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id.'), (2, 'Permission denied', 'The calling user does not have permission to view the photo.')), 4016),
+    ('flickr.photos.getUntagged', 13, ('api_key', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'privacy_filter', 'media', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True, True, True), (), 4031),
+    ('flickr.photos.getWithGeoData', 13, ('api_key', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'privacy_filter', 'sort', 'media', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True, True, True, True), (), 4031),
+    ('flickr.photos.getWithoutGeoData', 13, ('api_key', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'privacy_filter', 'sort', 'media', 'min_upload_date', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True, True, True, True), (), 4031),
+    ('flickr.photos.licenses.getInfo', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.photos.licenses.setLicense', 14, ('api_key', 'photo_id', 'license_id'), (False, False, False), ((1, 'Photo not found', 'The specified id was not the id of a valif photo owner by the calling user.'), (2, 'License not found', 'The license id was not valid.')), 4031),
+    ('flickr.photos.notes.add', 14, ('api_key', 'photo_id', 'note_x', 'note_y', 'note_w', 'note_h', 'note_text'), (False, False, False, False, False, False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id'), (2, 'User cannot add notes', 'The calling user does not have permission to add a note to this photo'), (3, 'Missing required arguments', 'One or more of the required arguments were not supplied.'), (4, 'Maximum number of notes reached', 'The maximum number of notes for the photo has been reached.')), 4031),
+    ('flickr.photos.notes.delete', 14, ('api_key', 'note_id'), (False, False), ((1, 'Note not found', 'The note id passed was not a valid note id'), (2, 'User cannot delete note', 'The calling user does not have permission to delete the specified note')), 4031),
+    ('flickr.photos.notes.edit', 14, ('api_key', 'note_id', 'note_x', 'note_y', 'note_w', 'note_h', 'note_text'), (False, False, False, False, False, False, False), ((1, 'Note not found', 'The note id passed was not a valid note id'), (2, 'User cannot edit note', 'The calling user does not have permission to edit the specified note'), (3, 'Missing required arguments', 'One or more of the required arguments were not supplied.')), 4031),
+    ('flickr.photos.people.add', 14, ('api_key', 'photo_id', 'user_id', 'person_x', 'person_y', 'person_w', 'person_h'), (False, False, False, True, True, True, True), ((1, 'Person not found', 'The NSID passed was not a valid user id.'), (2, 'Photo not found', 'The photo id passed was not a valid photo id.'), (3, 'User cannot add this person to photos', 'The person being added to the photo does not allow the calling user to add them.'), (4, 'User cannot add people to that photo', "The owner of the photo doesn't allow the calling user to add people to their photos."), (5, "Person can't be tagged in that photo", 'The person being added to the photo does not want to be identified in this photo.'), (6, 'Some co-ordinate paramters were blank', 'Not all of the co-ordinate parameters (person_x, person_y, person_w, person_h) were passed with valid values.'), (7, "Can't add that person to a non-public photo", "You can only add yourself to another member's non-public photos."), (8, 'Too many people in that photo', 'The maximum number of people has already been added to the photo.')), 4031),
+    ('flickr.photos.people.delete', 14, ('api_key', 'photo_id', 'user_id', 'email'), (False, False, False, True), ((1, 'Person not found', 'The NSID passed was not a valid user id.'), (2, 'Photo not found', 'The photo id passed was not a valid photo id.'), (3, 'User cannot remove that person', 'The calling user did not have permission to remove this person from this photo.')), 4031),
+    ('flickr.photos.people.deleteCoords', 14, ('api_key', 'photo_id', 'user_id'), (False, False, False), ((1, 'Person not found', 'The NSID passed was not a valid user id.'), (2, 'Photo not found', 'The photo id passed was not a valid photo id.'), (3, 'User cannot edit that person in that photo', 'The calling user is neither the person depicted in the photo nor the person who added the bounding box.')), 4031),
+    ('flickr.photos.people.editCoords', 14, ('api_key', 'photo_id', 'user_id', 'person_x', 'person_y', 'person_w', 'person_h', 'email'), (False, False, False, False, False, False, False, True), ((1, 'Person not found', 'The NSID passed was not a valid user id.'), (2, 'Photo not found', 'The photo id passed was not a valid photo id.'), (3, 'User cannot edit that person in that photo', 'The calling user did not originally add this person to the photo, and is not the person in question.'), (4, 'Some co-ordinate paramters were blank', 'Not all of the co-ordinate parameters (person_x, person_y, person_w, person_h) were passed with valid values.'), (5, 'No co-ordinates given', 'None of the co-ordinate parameters were valid.')), 4031),
+    ('flickr.photos.people.getList', 0, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id.'),), 4016),
+    ('flickr.photos.recentlyUpdated', 13, ('api_key', 'min_date', 'extras', 'per_page', 'page'), (False, False, True, True, True), ((1, 'Required argument missing.', 'Some or all of the required arguments were not supplied.'), (2, 'Not a valid date', 'The date argument did not pass validation.')), 4031),
+    ('flickr.photos.removeTag', 14, ('api_key', 'tag_id'), (False, False), ((1, 'Tag not found', "The calling user doesn't have permission to delete the specified tag. This could mean it belongs to someone else, or doesn't exist."),), 4031),
+    ('flickr.photos.search', 0, ('api_key', 'user_id', 'tags', 'tag_mode', 'text', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date', 'license', 'sort', 'privacy_filter', 'bbox', 'accuracy', 'safe_search', 'content_type', 'machine_tags', 'machine_tag_mode', 'group_id', 'faves', 'camera', 'jump_to', 'contacts', 'woe_id', 'place_id', 'media', 'has_geo', 'geo_context', 'lat', 'lon', 'radius', 'radius_units', 'is_commons', 'in_gallery', 'person_id', 'is_getty', 'extras', 'per_page', 'page'), (False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True), ((1, 'Too many tags in ALL query', "When performing an 'all tags' search, you may not specify more than 20 tags to join together."), (2, 'Unknown user', 'A user_id was passed which did not match a valid flickr user.'), (3, 'Parameterless searches have been disabled', 'To perform a search with no parameters (to get the latest public photos, please use flickr.photos.getRecent instead).'), (4, "You don't have permission to view this pool", 'The logged in user (if any) does not have permission to view the pool for this group.'), (10, 'Sorry, the Flickr search API is not currently available.', 'The Flickr API search databases are temporarily unavailable.'), (11, 'No valid machine tags', 'The query styntax for the machine_tags argument did not validate.'), (12, 'Exceeded maximum allowable machine tags', 'The maximum number of machine tags in a single query was exceeded.'), (13, 'jump_to not avaiable for this query', 'jump_to only supported for some query types.'), (14, 'Bad value for jump_to', 'jump_to must be valid photo ID.'), (15, 'Photo not found', ''), (16, 'You can only search within your own favorites', ''), (17, 'You can only search within your own contacts', 'The call tried to use the contacts parameter with no user ID or a user ID other than that of the authenticated user.'), (18, 'Illogical arguments', 'The request contained contradictory arguments.'), (20, 'Excessive photo offset in search', 'The search requested photos beyond an allowable offset. Reduce the page number or number of results per page for this search.')), 4016),
+    ('flickr.photos.setContentType', 14, ('api_key', 'photo_id', 'content_type'), (False, False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id of a photo belonging to the calling user.'), (2, 'Required arguments missing', 'Some or all of the required arguments were not supplied.'), (3, 'Change not allowed', 'Changing the content type of this photo is not allowed.')), 4031),
+    ('flickr.photos.setDates', 14, ('api_key', 'photo_id', 'date_posted', 'date_taken', 'date_taken_granularity'), (False, False, True, True, True), ((1, 'Photo not found', 'The photo id was not the id of a valid photo belonging to the calling user.'), (2, 'Not enough arguments', 'No dates were specified to be changed.'), (3, 'Invalid granularity', "The value passed for 'granularity' was not a valid flickr date granularity.")), 4031),
+    ('flickr.photos.setMeta', 14, ('api_key', 'photo_id', 'title', 'description'), (False, False, False, False), ((1, 'Photo not found', 'The photo id passed was not the id of a photo belonging to the calling user. It might be an invalid id, or the photo might be owned by another user. '),), 4031),
+    ('flickr.photos.setPerms', 14, ('api_key', 'photo_id', 'is_public', 'is_friend', 'is_family', 'perm_comment', 'perm_addmeta'), (False, False, False, False, False, False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id of a photo belonging to the calling user.'), (2, 'Required arguments missing', 'Some or all of the required arguments were not supplied.')), 4031),
+    ('flickr.photos.setSafetyLevel', 14, ('api_key', 'photo_id', 'safety_level', 'hidden'), (False, False, True, True), ((1, 'Photo not found', 'The photo id passed was not a valid photo id of a photo belonging to the calling user.'), (2, 'Invalid or missing arguments', 'Neither a valid safety level nor a hidden value were passed.'), (3, 'Change not allowed', 'Changing the safety level of this photo is not allowed.')), 4031),
+    ('flickr.photos.setTags', 14, ('api_key', 'photo_id', 'tags'), (False, False, False), ((1, 'Photo not found', 'The photo id passed was not the id of a photo belonging to the calling user. It might be an invalid id, or the photo might be owned by another user. '), (2, 'Maximum number of tags reached', 'The number of tags specified exceeds the limit for the photo. No tags were modified.')), 4031),
+    ('flickr.photos.suggestions.approveSuggestion', 14, ('api_key', 'suggestion_id'), (False, False), (), 4031),
+    ('flickr.photos.suggestions.getList', 13, ('api_key', 'photo_id', 'status_id'), (False, True, True), (), 4031),
+    ('flickr.photos.suggestions.rejectSuggestion', 14, ('api_key', 'suggestion_id'), (False, False), (), 4031),
+    ('flickr.photos.suggestions.removeSuggestion', 14, ('api_key', 'suggestion_id'), (False, False), (), 4031),
+    ('flickr.photos.suggestions.suggestLocation', 14, ('api_key', 'photo_id', 'lat', 'lon', 'accuracy', 'woe_id', 'place_id', 'note'), (False, False, False, False, True, True, True, True), (), 4031),
+    ('flickr.photos.transform.rotate', 14, ('api_key', 'photo_id', 'degrees'), (False, False, False), ((1, 'Photo not found', 'The photo id was invalid or did not belong to the calling user.'), (2, 'Invalid rotation', 'The rotation degrees were an invalid value.'), (3, 'Temporary failure', 'There was a problem either rotating the image or storing the rotated versions.'), (4, 'Rotation disabled', 'The rotation service is currently disabled.')), 4031),
+    ('flickr.photos.upload.checkTickets', 0, ('api_key', 'tickets', 'batch_id'), (False, False, True), (), 4016),
+)
@@ -0,0 +1,26 @@
+"""
+    Description of the flickr.photosets methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.photosets.addPhoto', 14, ('api_key', 'photoset_id', 'photo_id'), (False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not the id of avalid photoset owned by the calling user.'), (2, 'Photo not found', 'The photo id passed was not the id of a valid photo owned by the calling user.'), (3, 'Photo already in set', 'The photo is already a member of the photoset.'), (10, 'Maximum number of photos in set', 'A set has reached the upper limit for the number of photos allowed.')), 4031),
+    ('flickr.photosets.comments.addComment', 14, ('api_key', 'photoset_id', 'comment_text'), (False, False, False), ((1, 'Photoset not found', ''), (8, 'Blank comment', ''), (9, 'User is posting comments too fast.', 'The user has reached the limit for number of comments posted during a specific time period. Wait a bit and try again.')), 4031),
+    ('flickr.photosets.comments.deleteComment', 14, ('api_key', 'comment_id'), (False, False), ((2, 'Comment not found.', 'The comment id passed was not a valid comment id'),), 4031),
+    ('flickr.photosets.comments.editComment', 14, ('api_key', 'comment_id', 'comment_text'), (False, False, False), ((2, 'Comment not found.', 'The comment id passed was not a valid comment id.'), (8, 'Blank comment.', "Comment text can't be blank.")), 4031),
+    ('flickr.photosets.comments.getList', 0, ('api_key', 'photoset_id'), (False, False), ((1, 'Photoset not found.', 'The photoset id was invalid.'),), 4016),
+    ('flickr.photosets.create', 14, ('api_key', 'title', 'description', 'primary_photo_id'), (False, False, True, False), ((1, 'No title specified', 'No title parameter was passed in the request.'), (2, 'Photo not found', 'The primary photo id passed was not a valid photo id or does not belong to the calling user.'), (3, "Can't create any more sets", 'The user has reached their maximum number of photosets limit.')), 4031),
+    ('flickr.photosets.delete', 14, ('api_key', 'photoset_id'), (False, False), ((1, 'Photoset not found', 'The photoset id passed was not a valid photoset id or did not belong to the calling user.'),), 4031),
+    ('flickr.photosets.editMeta', 14, ('api_key', 'photoset_id', 'title', 'description'), (False, False, False, True), ((1, 'Photoset not found', 'The photoset id passed was not a valid photoset id or did not belong to the calling user.'), (2, 'No title specified', 'No title parameter was passed in the request. ')), 4031),
+    ('flickr.photosets.editPhotos', 14, ('api_key', 'photoset_id', 'primary_photo_id', 'photo_ids'), (False, False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not a valid photoset id or did not belong to the calling user.'), (2, 'Photo not found', 'One or more of the photo ids passed was not a valid photo id or does not belong to the calling user.'), (3, 'Primary photo not found', 'The primary photo id passed was not a valid photo id or does not belong to the calling user.'), (4, 'Primary photo not in list', 'The primary photo id passed did not appear in the photo id list.'), (5, 'Empty photos list', 'No photo ids were passed.')), 4031),
+    ('flickr.photosets.getContext', 0, ('api_key', 'photo_id', 'photoset_id', 'num_prev', 'num_next', 'extras'), (False, False, False, True, True, True), ((1, 'Photo not found', 'The photo id passed was not a valid photo id, or was the id of a photo that the calling user does not have permission to view.'), (2, 'Photo not in set', 'The specified photo is not in the specified set.')), 4016),
+    ('flickr.photosets.getInfo', 0, ('api_key', 'photoset_id'), (False, False), ((1, 'Photoset not found', 'The photoset id was not valid.'),), 4016),
+    ('flickr.photosets.getList', 0, ('api_key', 'user_id', 'page', 'per_page'), (False, True, True, True), ((1, 'User not found', 'The user NSID passed was not a valid user NSID and the calling user was not logged in.\r\n'),), 4016),
+    ('flickr.photosets.getPhotos', 0, ('api_key', 'photoset_id', 'extras', 'privacy_filter', 'per_page', 'page', 'media'), (False, False, True, True, True, True, True), ((1, 'Photoset not found', 'The photoset id passed was not a valid photoset id.'),), 4016),
+    ('flickr.photosets.orderSets', 14, ('api_key', 'photoset_ids'), (False, False), ((1, 'Set not found', 'One of the photoset ids passed was not the id of a valid photoset belonging to the calling user.'),), 4031),
+    ('flickr.photosets.removePhoto', 14, ('api_key', 'photoset_id', 'photo_id'), (False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not the id of avalid photoset owned by the calling user.'), (2, 'Photo not found', 'The photo id passed was not the id of a valid photo belonging to the calling user.'), (3, 'Photo not in set', 'The photo is not a member of the photoset.')), 4031),
+    ('flickr.photosets.removePhotos', 14, ('api_key', 'photoset_id', 'photo_ids'), (False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not the id of available photosets owned by the calling user.'), (2, 'Photo not found', 'The photo id passed was not the id of a valid photo belonging to the calling user.')), 4031),
+    ('flickr.photosets.reorderPhotos', 14, ('api_key', 'photoset_id', 'photo_ids'), (False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not a valid photoset id or did not belong to the calling user.'), (2, 'Photo not found', 'One or more of the photo ids passed was not a valid photo id or does not belong to the calling user.')), 4031),
+    ('flickr.photosets.setPrimaryPhoto', 14, ('api_key', 'photoset_id', 'photo_id'), (False, False, False), ((1, 'Photoset not found', 'The photoset id passed was not the id of avalid photoset owned by the calling user.'), (2, 'Photo not found', 'The photo id passed was not the id of a valid photo owned by the calling user.')), 4031),
+)
@@ -0,0 +1,23 @@
+"""
+    Description of the flickr.places methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.places.find', 0, ('api_key', 'query', 'bbox', 'extras', 'safe'), (False, False, True, True, True), ((1, 'Required parameter missing', 'One or more required parameters was not included with the API call.'),), 4016),
+    ('flickr.places.findByLatLon', 0, ('api_key', 'lat', 'lon', 'accuracy'), (False, False, False, True), ((1, 'Required arguments missing', 'One or more required parameters was not included with the API request.'), (2, 'Not a valid latitude', 'The latitude argument failed validation.'), (3, 'Not a valid longitude', 'The longitude argument failed validation.'), (4, 'Not a valid accuracy', 'The accuracy argument failed validation.')), 4016),
+    ('flickr.places.getChildrenWithPhotosPublic', 0, ('api_key', 'place_id', 'woe_id'), (False, True, True), ((1, 'Required parameter missing', 'One or more required parameter is missing from the API call.'), (2, 'Not a valid Places ID', 'An invalid Places (or WOE) ID was passed with the API call.'), (3, 'Place not found', 'No place could be found for the Places (or WOE) ID passed to the API call.')), 4016),
+    ('flickr.places.getInfo', 0, ('api_key', 'place_id', 'woe_id'), (False, True, True), ((1, 'Required parameter missing', 'One or more required parameter is missing from the API call.'), (2, 'Not a valid Places ID', 'An invalid Places (or WOE) ID was passed with the API call.'), (3, 'Place not found', 'No place could be found for the Places (or WOE) ID passed to the API call.')), 4016),
+    ('flickr.places.getInfoByUrl', 0, ('api_key', 'url'), (False, False), ((2, 'Place URL required.', 'The flickr.com/places URL was not passed with the API method.'), (3, 'Place not found.', 'Unable to find a valid place for the places URL.')), 4016),
+    ('flickr.places.getPlaceTypes', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.places.getShapeHistory', 0, ('api_key', 'place_id', 'woe_id'), (False, True, True), ((1, 'Required parameter missing', 'One or more required parameter is missing from the API call.'), (2, 'Not a valid Places ID', 'An invalid Places (or WOE) ID was passed with the API call.'), (3, 'Place not found', 'No place could be found for the Places (or WOE) ID passed to the API call.')), 4016),
+    ('flickr.places.getTopPlacesList', 0, ('api_key', 'place_type_id', 'date', 'woe_id', 'place_id'), (False, False, True, True, True), ((1, 'Required parameter missing', 'One or more required parameters with missing from your request.'), (2, 'Not a valid place type.', 'An unknown or unsupported place type ID was passed with your request.'), (3, 'Not a valid date.', 'The date argument passed with your request is invalid.'), (4, 'Not a valid Place ID', 'An invalid Places (or WOE) identifier was included with your request.')), 4016),
+    ('flickr.places.placesForBoundingBox', 0, ('api_key', 'bbox', 'place_type', 'place_type_id', 'recursive'), (False, False, True, True, True), ((1, 'Required parameters missing', 'One or more required parameter is missing from the API call.'), (2, 'Not a valid bbox', 'The bbox argument was incomplete or incorrectly formatted'), (3, 'Not a valid place type', 'An invalid place type was included with your request.'), (4, 'Bounding box exceeds maximum allowable size for place type', 'The bounding box passed along with your request was too large for the request place type.')), 4016),
+    ('flickr.places.placesForContacts', 13, ('api_key', 'place_type', 'place_type_id', 'woe_id', 'place_id', 'threshold', 'contacts', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date'), (False, True, True, True, True, True, True, True, True, True, True), ((1, 'Places for contacts are not available at this time', 'Places for contacts have been disabled or are otherwise not available.'), (2, 'Required parameter missing', 'One or more of the required parameters was not included with your request.'), (3, 'Not a valid place type.', 'An invalid place type was included with your request.'), (4, 'Not a valid Place ID', 'An invalid Places (or WOE) identifier was included with your request.'), (5, 'Not a valid threshold', 'The threshold passed was invalid. '), (6, 'Not a valid contacts type', 'Contacts must be either "all" or "ff" (friends and family).')), 4031),
+    ('flickr.places.placesForTags', 0, ('api_key', 'place_type_id', 'woe_id', 'place_id', 'threshold', 'tags', 'tag_mode', 'machine_tags', 'machine_tag_mode', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date'), (False, False, True, True, True, True, True, True, True, True, True, True, True), (), 4016),
+    ('flickr.places.placesForUser', 13, ('api_key', 'place_type_id', 'place_type', 'woe_id', 'place_id', 'threshold', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date'), (False, True, True, True, True, True, True, True, True, True), ((1, 'Places for user are not available at this time', 'Places for user have been disabled or are otherwise not available.'), (2, 'Required parameter missing', 'One or more of the required parameters was not included with your request.'), (3, 'Not a valid place type', 'An invalid place type was included with your request.'), (4, 'Not a valid Place ID', 'An invalid Places (or WOE) identifier was included with your request.'), (5, 'Not a valid threshold', 'The threshold passed was invalid. ')), 4031),
+    ('flickr.places.resolvePlaceId', 0, ('api_key', 'place_id'), (False, False), ((2, 'Place ID required.', ''), (3, 'Place not found.', '')), 4016),
+    ('flickr.places.resolvePlaceURL', 0, ('api_key', 'url'), (False, False), ((2, 'Place URL required.', ''), (3, 'Place not found.', '')), 4016),
+    ('flickr.places.tagsForPlace', 0, ('api_key', 'woe_id', 'place_id', 'min_upload_date', 'max_upload_date', 'min_taken_date', 'max_taken_date'), (False, True, True, True, True, True, True), ((1, 'Required parameter missing', 'One or more parameters was not included with the API request'), (2, 'Not a valid Places ID', 'An invalid Places (or WOE) identifier was included with your request.'), (3, 'Place not found', 'An invalid Places (or WOE) identifier was included with your request.')), 4016),
+)
@@ -0,0 +1,13 @@
+"""
+    Description of the flickr.prefs methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.prefs.getContentType', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.prefs.getGeoPerms', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.prefs.getHidden', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.prefs.getPrivacy', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.prefs.getSafetyLevel', 13, ('api_key',), (False,), (), 4031),
+)
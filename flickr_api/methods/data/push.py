@@ -0,0 +1,12 @@
+"""
+    Description of the flickr.push methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.push.getSubscriptions', 13, ('api_key',), (False,), ((5, 'Service currently available only to pro accounts', 'PuSH subscriptions are currently restricted to Pro account holders.'),), 4031),
+    ('flickr.push.getTopics', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.push.subscribe', 13, ('api_key', 'topic', 'callback', 'verify', 'verify_token', 'lease_seconds', 'woe_ids', 'place_ids', 'lat', 'lon', 'radius', 'radius_units', 'accuracy', 'nsids', 'tags', 'machine_tags', 'update_type', 'output_format', 'mailto'), (False, False, False, False, True, True, True, True, True, True, True, True, True, True, True, True, True, True, True), ((1, 'Required parameter missing', 'One of the required arguments for the method was not provided.'), (2, 'Invalid parameter value', 'One of the arguments was specified with an illegal value.'), (3, 'Callback URL already in use for a different subscription', 'A different subscription already exists that uses the same callback URL.'), (4, 'Callback failed or invalid response', 'The verification callback failed, or failed to return the expected response to confirm the subscription.'), (5, 'Service currently available only to pro accounts', 'PuSH subscriptions are currently restricted to Pro account holders.'), (6, 'Subscription awaiting verification callback response - try again later', 'A subscription with those details exists already, but it is in a pending (non-verified) state. Please wait a bit for the verification callback to complete before attempting to update the subscription.')), 4031),
+    ('flickr.push.unsubscribe', 13, ('api_key', 'topic', 'callback', 'verify', 'verify_token'), (False, False, False, False, True), ((1, 'Required parameter missing', 'One of the required arguments for the method was not provided.'), (2, 'Invalid parameter value', 'One of the arguments was specified with an illegal value.'), (4, 'Callback failed or invalid response', 'The verification callback failed, or failed to return the expected response to confirm the un-subscription.'), (6, 'Subscription awaiting verification callback response - try again later', 'A subscription with those details exists already, but it is in a pending (non-verified) state. Please wait a bit for the verification callback to complete before attempting to update the subscription.'), (7, 'Subscription not found', 'No subscription matching the provided details for this user could be found.')), 4031),
+)
@@ -0,0 +1,10 @@
+"""
+    Description of the flickr.reflection methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.reflection.getMethodInfo', 0, ('api_key', 'method_name'), (False, False), ((1, 'Method not found', 'The requested method was not found.'),), 4016),
+    ('flickr.reflection.getMethods', 0, ('api_key',), (False,), (), 4016),
+)
@@ -0,0 +1,23 @@
+"""
+    Description of the flickr.stats methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.stats.getCSVFiles', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.stats.getCollectionDomains', 13, ('api_key', 'date', 'collection_id', 'per_page', 'page'), (False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Collection not found', 'The collection id was either invalid or was for a collection not owned by the calling user.')), 4031),
+    ('flickr.stats.getCollectionReferrers', 13, ('api_key', 'date', 'domain', 'collection_id', 'per_page', 'page'), (False, False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Collection not found', 'The collection id was either invalid or was for a collection not owned by the calling user.'), (5, 'Invalid domain', 'The domain provided is not in the expected format.')), 4031),
+    ('flickr.stats.getCollectionStats', 13, ('api_key', 'date', 'collection_id'), (False, False, False), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Collection not found', 'The collection id was either invalid or was for a collection not owned by the calling user.')), 4031),
+    ('flickr.stats.getPhotoDomains', 13, ('api_key', 'date', 'photo_id', 'per_page', 'page'), (False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photo not found', 'The photo id was either invalid or was for a photo not owned by the calling user.')), 4031),
+    ('flickr.stats.getPhotoReferrers', 13, ('api_key', 'date', 'domain', 'photo_id', 'per_page', 'page'), (False, False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photo not found', 'The photo id was either invalid or was for a photo not owned by the calling user.'), (5, 'Invalid domain', 'The domain provided is not in the expected format.')), 4031),
+    ('flickr.stats.getPhotoStats', 13, ('api_key', 'date', 'photo_id'), (False, False, False), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photo not found', 'The photo id was either invalid or was for a photo not owned by the calling user.')), 4031),
+    ('flickr.stats.getPhotosetDomains', 13, ('api_key', 'date', 'photoset_id', 'per_page', 'page'), (False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photoset not found', 'The photoset id was either invalid or was for a set not owned by the calling user.')), 4031),
+    ('flickr.stats.getPhotosetReferrers', 13, ('api_key', 'date', 'domain', 'photoset_id', 'per_page', 'page'), (False, False, False, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photoset not found', 'The photoset id was either invalid or was for a set not owned by the calling user.'), (5, 'Invalid domain', 'The domain provided is not in the expected format.')), 4031),
+    ('flickr.stats.getPhotosetStats', 13, ('api_key', 'date', 'photoset_id'), (False, False, False), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (4, 'Photoset not found', 'The photoset id was either invalid or was for a set not owned by the calling user.')), 4031),
+    ('flickr.stats.getPhotostreamDomains', 13, ('api_key', 'date', 'per_page', 'page'), (False, False, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed')), 4031),
+    ('flickr.stats.getPhotostreamReferrers', 13, ('api_key', 'date', 'domain', 'per_page', 'page'), (False, False, False, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (5, 'Invalid domain', 'The domain provided is not in the expected format.')), 4031),
+    ('flickr.stats.getPhotostreamStats', 13, ('api_key', 'date'), (False, False), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed')), 4031),
+    ('flickr.stats.getPopularPhotos', 13, ('api_key', 'date', 'sort', 'per_page', 'page'), (False, True, True, True, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed'), (5, 'Invalid sort', 'The sort provided is not valid')), 4031),
+    ('flickr.stats.getTotalViews', 13, ('api_key', 'date'), (False, True), ((1, 'User does not have stats', 'The user you have requested stats has not enabled stats on their account.'), (2, 'No stats for that date', 'No stats are available for the date requested. Flickr only keeps stats data for the last 28 days.'), (3, 'Invalid date', 'The date provided could not be parsed')), 4031),
+)
@@ -0,0 +1,17 @@
+"""
+    Description of the flickr.tags methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.tags.getClusterPhotos', 0, ('api_key', 'tag', 'cluster_id'), (False, False, False), (), 4016),
+    ('flickr.tags.getClusters', 0, ('api_key', 'tag'), (False, False), ((1, 'Tag cluster not found', 'The tag was invalid or no cluster exists for that tag.'),), 4016),
+    ('flickr.tags.getHotList', 0, ('api_key', 'period', 'count'), (False, True, True), ((1, 'Invalid period', 'The specified period was not understood.'),), 4016),
+    ('flickr.tags.getListPhoto', 0, ('api_key', 'photo_id'), (False, False), ((1, 'Photo not found', 'The photo id passed was not a valid photo id.'),), 4016),
+    ('flickr.tags.getListUser', 0, ('api_key', 'user_id'), (False, True), ((1, 'User not found', 'The user NSID passed was not a valid user NSID and the calling user was not logged in.\r\n'),), 4016),
+    ('flickr.tags.getListUserPopular', 0, ('api_key', 'user_id', 'count'), (False, True, True), ((1, 'User not found', 'The user NSID passed was not a valid user NSID and the calling user was not logged in.\r\n'),), 4016),
+    ('flickr.tags.getListUserRaw', 0, ('api_key', 'tag'), (False, True), ((1, 'User not found', 'The calling user was not logged in.'),), 4016),
+    ('flickr.tags.getMostFrequentlyUsed', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.tags.getRelated', 0, ('api_key', 'tag'), (False, False), ((1, 'Tag not found', 'The tag argument was missing.'),), 4016),
+)
@@ -0,0 +1,11 @@
+"""
+    Description of the flickr.test methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.test.echo', 0, ('api_key',), (False,), (), 4016),
+    ('flickr.test.login', 13, ('api_key',), (False,), (), 4031),
+    ('flickr.test.null', 13, ('api_key',), (False,), (), 4031),
+)
@@ -0,0 +1,14 @@
+"""
+    Description of the flickr.urls methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+METHODS = (
+    ('flickr.urls.getGroup', 0, ('api_key', 'group_id'), (False, False), ((1, 'Group not found', 'The NSID specified was not a valid group.'),), 4016),
+    ('flickr.urls.getUserPhotos', 0, ('api_key', 'user_id'), (False, True), ((1, 'User not found', 'The NSID specified was not a valid user.'), (2, 'No user specified', 'No user_id was passed and the calling user was not logged in.')), 4016),
+    ('flickr.urls.getUserProfile', 0, ('api_key', 'user_id'), (False, True), ((1, 'User not found', 'The NSID specified was not a valid user.'), (2, 'No user specified', 'No user_id was passed and the calling user was not logged in.')), 4016),
+    ('flickr.urls.lookupGallery', 0, ('api_key', 'url'), (False, False), (), 4016),
+    ('flickr.urls.lookupGroup', 0, ('api_key', 'url'), (False, False), ((1, 'Group not found', 'The passed URL was not a valid group page or photo pool url.'),), 4016),
+    ('flickr.urls.lookupUser', 0, ('api_key', 'url'), (False, False), ((1, 'User not found', 'The passed URL was not a valid user profile or photos url.'),), 4016),
+)
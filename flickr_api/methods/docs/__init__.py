@@ -0,0 +1,5 @@
+"""
+    Documentation of the Flickr API methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
@@ -0,0 +1,14 @@
+"""
+    Documentation of the flickr.auth methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.auth.checkToken', 'Returns the credentials attached to an authentication token. This call <b>must</b> be signed, and is <b><a href="/services/api/auth.oauth.html">deprecated in favour of OAuth</a></b>.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The authentication token to check.'), '<auth>\r\n\t<token>976598454353455</token>\r\n\t<perms>read</perms>\r\n\t<user nsid="12037949754@N01" username="Bees" fullname="Cal H" />\r\n</auth>', '<p><code>perms</code> can have values of <code>none</code>, <code>read</code>, <code>write</code> or <code>delete</code>. For more information, see the <a href="/services/api/auth.spec.html">Auth API spec</a>.</p>'),
+    ('flickr.auth.getFrob', 'Returns a frob to be used during authentication. <b>This method call must be signed</b>, and is <b><a href="/services/api/auth.oauth.html">deprecated in favour of OAuth</a></b>.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<frob>746563215463214621</frob>', None),
+    ('flickr.auth.getFullToken', 'Get the full authentication token for a mini-token. <b>This method call must be signed</b>, and is <b><a href="/services/api/auth.oauth.html">deprecated in favour of OAuth</a></b>.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The mini-token typed in by a user. It should be 9 digits long. It may optionally contain dashes.'), '<auth>\r\n\t<token>976598454353455</token>\r\n\t<perms>write</perms>\r\n\t<user nsid="12037949754@N01" username="Bees" fullname="Cal H" />\r\n</auth>', '<p><code>perms</code> can have values of <code>none</code>, <code>read</code>, <code>write</code> or <code>delete</code>. For more information, see the <a href="/services/api/auth.spec.html">Auth API spec</a>.</p>'),
+    ('flickr.auth.getToken', 'Returns the auth token for the given frob, if one has been attached. <b>This method call must be signed</b>, and is <b><a href="/services/api/auth.oauth.html">deprecated in favour of OAuth</a></b>.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The frob to check.'), '<auth>\r\n\t<token>976598454353455</token>\r\n\t<perms>write</perms>\r\n\t<user nsid="12037949754@N01" username="Bees" fullname="Cal H" />\r\n</auth>', '<p><code>perms</code> can have values of <code>none</code>, <code>read</code>, <code>write</code> or <code>delete</code>. For more information, see the <a href="/services/api/auth.spec.html">Auth API spec</a>.</p>'),
+    ('flickr.auth.oauth.checkToken', 'Returns the credentials attached to an OAuth authentication token.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The OAuth authentication token to check.'), '<oauth>\r\n    <token>72157627611980735-09e87c3024f733da</token>\r\n    <perms>write</perms>\r\n    <user nsid="1121451801@N07" username="jamalf" fullname="Jamal F"/>\r\n</oauth>', None),
+    ('flickr.auth.oauth.getAccessToken', 'Exchange an auth token from the old Authentication API, to an OAuth access token. Calling this method will delete the auth token used to make the request.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<auth> \r\n\t<access_token oauth_token="72157607082540144-8d5d7ea7696629bf" oauth_token_secret="f38bf58b2d95bc8b" /> \r\n</auth> ', None),
+)
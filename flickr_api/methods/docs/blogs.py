@@ -0,0 +1,11 @@
+"""
+    Documentation of the flickr.blogs methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.blogs.getList', 'Get a list of configured blogs for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Optionally only return blogs for a given service id.  You can get a list of from <a href="/services/api/flickr.blogs.getServices.html">flickr.blogs.getServices()</a>.'), '<blogs>\r\n\t<blog id="73" name="Bloxus test" needspassword="0"\r\n\t\turl="http://remote.bloxus.com/" /> \r\n\t<blog id="74" name="Manila Test" needspassword="1"\r\n\t\turl="http://flickrtest1.userland.com/" /> \r\n</blogs>', '<p>The <code>needspassword</code> attribute indicates whether a call to <code>flickr.blogs.postPhoto</code> for this blog will require a password to be sent. When flickr has a password already stored, <code>needspassword</code> is 0</p>'),
+    ('flickr.blogs.getServices', 'Return a list of Flickr supported blogging services', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<services>\r\n<service id="beta.blogger.com">Blogger</service>\r\n<service id="Typepad">Typepad</service>\r\n<service id="MovableType">Movable Type</service>\r\n<service id="LiveJournal">LiveJournal</service>\r\n<service id="MetaWeblogAPI">Wordpress</service>\r\n<service id="MetaWeblogAPI">MetaWeblogAPI</service>\r\n<service id="Manila">Manila</service>\r\n<service id="AtomAPI">AtomAPI</service>\r\n<service id="BloggerAPI">BloggerAPI</service>\r\n<service id="Vox">Vox</service>\r\n<service id="Twitter">Twitter</service>\r\n</services>', None),
+    ('flickr.blogs.postPhoto', '', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the blog to post to.', 'The id of the photo to blog', 'The blog post title', 'The blog post body', 'The password for the blog (used when the blog does not have a stored password).', "A Flickr supported blogging service.  Instead of passing a blog id you can pass a service id and we'll post to the first blog of that service we find."), None, None),
+)
@@ -0,0 +1,10 @@
+"""
+    Documentation of the flickr.cameras methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.cameras.getBrandModels', 'Retrieve all the models for a given camera brand.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the requested brand (as returned from flickr.cameras.getBrands).'), '<rsp stat="ok">\r\n  <cameras brand="apple">\r\n    <camera id="iphone_9000">\r\n      <name>iPhone 9000</name>\r\n      <details>\r\n        <megapixels>22.0</megapixels>\r\n        <zoom>3.0</zoom>\r\n        <lcd_size>40.5</lcd_size>\r\n        <storage_type>Flash</storage_type>\r\n      </details>\r\n      <images>\r\n        <small>http://farm3.staticflickr.com/1234/cameras/123456_model_small_123456.jpg</small>\r\n        <large>http://farm3.staticflickr.com/1234/cameras/123456_model_large_123456.jpg</large>\r\n      </images>\r\n    </camera>\r\n  </cameras>\r\n</rsp>', None),
+    ('flickr.cameras.getBrands', 'Returns all the brands of cameras that Flickr knows about.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<rsp stat="ok">\r\n<brands>\r\n\t<brand id="canon">Canon</brand>\r\n\t<brand id="nikon">Nikon</brand>\r\n        <brand id="apple">Apple</brand>\r\n</brands>\r\n</rsp>', None),
+)
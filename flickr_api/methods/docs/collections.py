@@ -0,0 +1,10 @@
+"""
+    Documentation of the flickr.collections methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.collections.getInfo', 'Returns information for a single collection.  Currently can only be called by the collection owner, this may change.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the collection to fetch information for.'), '<collection id="12-72157594586579649" child_count="6" datecreate="1173812218" iconlarge="http://farm1.static.flickr.com/187/cols/73743fac2cf79_l.jpg" iconsmall="http://farm1.static.flickr.com/187/cols/72157594586579649_43fac2cf79_s.jpg" server="187" secret="36">\r\n<title>All My Photos</title>\r\n<description>Photos!</description>\r\n<iconphotos>\r\n<photo id="14" owner="12@N01" secret="b57ba5c" server="51" farm="1" title="in full cap and gown" ispublic="1" isfriend="0" isfamily="0"/>\r\n<photo id="15" owner="12@N01" secret="ba1c2a8" server="58" farm="1" title="Just beyond the door" ispublic="0" isfriend="1" isfamily="0"/>\r\n<photo id="17" owner="12@N01" secret="0001969" server="73" farm="1" title="IMG_3787.JPG" ispublic="1" isfriend="0" isfamily="0"/>\r\n....\r\n</iconphotos>\r\n</collection>', None),
+    ('flickr.collections.getTree', 'Returns a tree (or sub tree) of collections belonging to a given user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the collection to fetch a tree for, or zero to fetch the root collection. Defaults to zero.', 'The ID of the account to fetch the collection tree for. Deafults to the calling user.'), '<collections>\r\n<collection id="12-72157594586579649" title="All My Photos" description="a collection" iconlarge="http://farm1.static.flickr.com/187/cols/37_43fac2cf79_l.jpg" \r\niconsmall="http://farm1.static.flickr.com/187/cols/56_43fac2cf79_s.jpg">\r\n<set id="92157594171298291" title="kitesurfing" description="a set"/>\r\n<set id="72157594247596158" title="faves" description="some favorites."/>\r\n</collection>\r\n</collections>', 'A nested tree of collections, and the collections and sets they contain.'),
+)
@@ -0,0 +1,9 @@
+"""
+    Documentation of the flickr.commons methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.commons.getInstitutions', 'Retrieves a list of the current Commons institutions.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<rsp stat="ok">\r\n <institutions>\r\n  <institution nsid="123456@N01" date_launch="1232000000">\r\n   <name>Institution</name>\r\n    <urls>\r\n     <url type="site">http://example.com/</url>\r\n     <url type="license">http://example.com/commons/license</url>\r\n     <url type="flickr">http://flickr.com/photos/institution</url>\r\n    </urls>\r\n   </institution>\r\n  </institutions>\r\n</rsp>', None),
+)
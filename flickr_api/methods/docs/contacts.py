@@ -0,0 +1,12 @@
+"""
+    Documentation of the flickr.contacts methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.contacts.getList', 'Get a list of contacts for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'An optional filter of the results. The following values are valid:<br />\r\n&nbsp;\r\n<dl>\r\n\t<dt><b><code>friends</code></b></dt>\r\n\t<dl>Only contacts who are friends (and not family)</dl>\r\n\r\n\t<dt><b><code>family</code></b></dt>\r\n\t<dl>Only contacts who are family (and not friends)</dl>\r\n\r\n\t<dt><b><code>both</code></b></dt>\r\n\t<dl>Only contacts who are both friends and family</dl>\r\n\r\n\t<dt><b><code>neither</code></b></dt>\r\n\t<dl>Only contacts who are neither friends nor family</dl>\r\n</dl>', 'The page of results to return. If this argument is omitted, it defaults to 1.', 'Number of photos to return per page. If this argument is omitted, it defaults to 1000. The maximum allowed value is 1000.', 'The order in which to sort the returned contacts. Defaults to name. The possible values are: name and time.'), '<contacts page="1" pages="1" perpage="1000" total="3">\r\n\t<contact nsid="12037949629@N01" username="Eric" iconserver="1"\r\n\t\trealname="Eric Costello"\r\n\t\tfriend="1" family="0" ignored="1" /> \r\n\t<contact nsid="12037949631@N01" username="neb" iconserver="1"\r\n\t\trealname="Ben Cerveny"\r\n\t\tfriend="0" family="0" ignored="0" /> \r\n\t<contact nsid="41578656547@N01" username="cal_abc" iconserver="1"\r\n\t\trealname="Cal Henderson"\r\n\t\tfriend="1" family="1" ignored="0" />\r\n</contacts>', None),
+    ('flickr.contacts.getListRecentlyUploaded', "Return a list of contacts for a user who have recently uploaded photos along with the total count of photos uploaded.<br /><br />\r\n\r\nThis method is still considered experimental. We don't plan for it to change or to go away but so long as this notice is present you should write your code accordingly.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Limits the resultset to contacts that have uploaded photos since this date. The date should be in the form of a Unix timestamp.\r\n\r\nThe default offset is (1) hour and the maximum (24) hours. ', 'Limit the result set to all contacts or only those who are friends or family. Valid options are:\r\n\r\n<ul>\r\n<li><strong>ff</strong> friends and family</li>\r\n<li><strong>all</strong> all your contacts</li>\r\n</ul>\r\nDefault value is "all".'), None, None),
+    ('flickr.contacts.getPublicList', 'Get the contact list for a user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the contact list for.', 'The page of results to return. If this argument is omitted, it defaults to 1.', 'Number of photos to return per page. If this argument is omitted, it defaults to 1000. The maximum allowed value is 1000.', 'Include additional information for each contact, such as realname, is_friend, is_family, path_alias and location.'), '<contacts page="1" pages="1" perpage="1000" total="3">\r\n\t<contact nsid="12037949629@N01" username="Eric" iconserver="1" ignored="1" /> \r\n\t<contact nsid="12037949631@N01" username="neb" iconserver="1" ignored="0" /> \r\n\t<contact nsid="41578656547@N01" username="cal_abc" iconserver="1" ignored="0" />\r\n</contacts>', '<p>See <a href="/services/api/flickr.contacts.getList.html">flickr.contacts.getList</a> for an explanation of the response.</p>'),
+    ('flickr.contacts.getTaggingSuggestions', "Get suggestions for tagging people in photos based on the calling user's contacts.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Return calling user in the list of suggestions. Default: true.', "Include suggestions from the user's address book. Default: false", 'Number of contacts to return per page. If this argument is omitted, all contacts will be returned.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<rsp stat="ok">\r\n<contacts page="1" pages="1" perpage="1000" total="1">\r\n\t<contact nsid="30135021@N05" username="Hugo Haas" iconserver="1" iconfarm="1" realname="" friend="0" family="0" path_alias="" />\r\n</contacts>\r\n</rsp>', None),
+)
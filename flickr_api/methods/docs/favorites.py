@@ -0,0 +1,13 @@
+"""
+    Documentation of the flickr.favorites methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.favorites.add', "Adds a photo to a user's favorites list.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "The id of the photo to add to the user's favorites."), None, None),
+    ('flickr.favorites.getContext', "Returns next and previous favorites for a photo in a user's favorites.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch the context for.', 'The user who counts the photo as a favorite.', '', '', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: description, license, date_upload, date_taken, owner_name, icon_server, original_format, last_update, geo, tags, machine_tags, o_dims, views, media, path_alias, url_sq, url_t, url_s, url_m, url_z, url_l, url_o'), '<rsp stat=\'ok\'>\r\n<count>3</count>\r\n<prevphoto id="2980" secret="973da1e709"\r\n\ttitle="boo!" url="/photos/bees/2980/" /> \r\n<nextphoto id="2985" secret="059b664012"\r\n\ttitle="Amsterdam Amstel" url="/photos/bees/2985/" />\r\n</rsp>', '<p>See <a href="/services/api/flickr.photos.getContext.html">flickr.photos.getContext</a></p>'),
+    ('flickr.favorites.getList', "Returns a list of the user's favorite photos. Only photos which the calling user has permission to see are returned.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the favorites list for. If this argument is omitted, the favorites list for the calling user is returned.', '', 'Minimum date that a photo was favorited on. The date should be in the form of a unix timestamp.', 'Maximum date that a photo was favorited on. The date should be in the form of a unix timestamp.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.favorites.getPublicList', 'Returns a list of favorite public photos for the given user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The user to fetch the favorites list for.', '', 'Minimum date that a photo was favorited on. The date should be in the form of a unix timestamp.', 'Maximum date that a photo was favorited on. The date should be in the form of a unix timestamp.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.favorites.remove', "Removes a photo from a user's favorites list.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "The id of the photo to remove from the user's favorites.", 'NSID of the user whose favorites the photo should be removed from. This only works if the calling user owns the photo.'), None, None),
+)
@@ -0,0 +1,17 @@
+"""
+    Documentation of the flickr.galleries methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.galleries.addPhoto', 'Add a photo to a gallery.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the gallery to add a photo to.  Note: this is the compound ID returned in methods like <a href="/services/api/flickr.galleries.getList.html">flickr.galleries.getList</a>, and <a href="/services/api/flickr.galleries.getListForPhoto.html">flickr.galleries.getListForPhoto</a>.', 'The photo ID to add to the gallery', 'A short comment or story to accompany the photo.'), None, None),
+    ('flickr.galleries.create', 'Create a new gallery for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The name of the gallery', 'A short description for the gallery', 'The first photo to add to your gallery'), '  <gallery id="50736-72157623680420409" url="http://www.flickr.com/photos/kellan/galleries/72157623680420409" /> \r\n', 'The ID of the newly created gallery, and its URL.'),
+    ('flickr.galleries.editMeta', 'Modify the meta-data for a gallery.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The gallery ID to update.', 'The new title for the gallery.', 'The new description for the gallery.'), None, None),
+    ('flickr.galleries.editPhoto', 'Edit the comment for a gallery photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the gallery to add a photo to. Note: this is the compound ID returned in methods like flickr.galleries.getList, and flickr.galleries.getListForPhoto.', 'The photo ID to add to the gallery.', 'The updated comment the photo.'), None, None),
+    ('flickr.galleries.editPhotos', 'Modify the photos in a gallery. Use this method to add, remove and re-order photos.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the gallery to modify. The gallery must belong to the calling user.', "The id of the photo to use as the 'primary' photo for the gallery. This id must also be passed along in photo_ids list argument.", 'A comma-delimited list of photo ids to include in the gallery. They will appear in the set in the order sent. This list must contain the primary photo id. This list of photos replaces the existing list.'), None, None),
+    ('flickr.galleries.getInfo', '', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The gallery ID you are requesting information for.'), '<gallery id="6065-72157617483228192" url="http://www.flickr.com/photos/straup/galleries/72157617483228192" \r\nowner="35034348999@N01" \r\n         primary_photo_id="292882708" date_create="1241028772" date_update="1270111667" count_photos="17"\r\n count_videos="0" primary_photo_server="112" primary_photo_farm="1" primary_photo_secret="7f29861bc4">\r\n\t<title>Cat Pictures I\'ve Sent To Kevin Collins</title>\r\n\t<description />\r\n</gallery>', None),
+    ('flickr.galleries.getList', 'Return the list of galleries created by a user.  Sorted from newest to oldest.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to get a galleries list for. If none is specified, the calling user is assumed.', 'Number of galleries to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<galleries total="9" page="1" pages="1" per_page="100" user_id="34427469121@N01">\r\n   <gallery id="5704-72157622637971865" \r\n             url="http://www.flickr.com/photos/george/galleries/72157622637971865" \r\n             owner="34427469121@N01" date_create="1257711422" date_update="1260360756"\r\n             primary_photo_id="107391222"  primary_photo_server="39" \r\n             primary_photo_farm="1" primary_photo_secret="ffa"\r\n             count_photos="16" count_videos="2" >\r\n       <title>I like me some black &amp; white</title>\r\n       <description>black and whites</description>\r\n   </gallery>\r\n   <gallery id="5704-72157622566655097" \r\n            url="http://www.flickr.com/photos/george/galleries/72157622566655097" \r\n            owner="34427469121@N01" date_create="1256852229" date_update="1260462343" \r\n            primary_photo_id="497374910" primary_photo_server="231" \r\n            primary_photo_farm="1" primary_photo_secret="9ae0f"\r\n            count_photos="18" count_videos="0" >\r\n       <title>People Sleeping in Libraries</title>\r\n       <description />\r\n   </gallery>\r\n</galleries>', None),
+    ('flickr.galleries.getListForPhoto', 'Return the list of galleries to which a photo has been added.  Galleries are returned sorted by date which the photo was added to the gallery.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the photo to fetch a list of galleries for.', 'Number of galleries to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<galleries total="7" page="1" pages="1" per_page="100">\r\n    <gallery id="9634-72157621980433950" \r\n             url="http://www.flickr.com/photos/revdancatt/galleries/72157621980433950" \r\n             owner="35468159852@N01" date_create="1249748647" date_update="1260486168" \r\n\t     primary_photo_id="2080242123" primary_photo_server="2209" \r\n\t     primary_photo_farm="3" primary_photo_secret="55c9"\r\n             count_photos="18" count_videos="0">\r\n        <title>Vivitar Ultra Wide &amp; Slim Selection</title>\r\n        <description>The cheap and cheerful camera that isn\'t quite as cheap as it used to be.</description>\r\n    </gallery>\r\n   <gallery id="22342631-72157622254010831" \r\n             url="http://www.flickr.com/photos/22365685@N03/galleries/72157622254010831" \r\n             owner="22365685@N03" date_create="1253035020" date_update="1260431618" \r\n             primary_photo_id="3182914049" primary_photo_server="3319" \r\n             primary_photo_farm="4" primary_photo_secret="b94fb"\r\n             count_photos="13" count_videos="0">\r\n        <title>Awesome Pics</title>\r\n        <description />\r\n    </gallery>\r\n</galleries>', None),
+    ('flickr.galleries.getPhotos', 'Return the list of photos for a gallery', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the gallery of photos to return', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<photos page="1" pages="1" perpage="500" total="2">\r\n\t<photo id="2822546461" owner="78398753@N00" secret="2dbcdb589f" server="1" farm="1" title="FOO" \r\n     ispublic="1" isfriend="0" isfamily="0" is_primary="1" has_comment="1">\r\n\t\t<comment>best cat picture ever!</comment>\r\n\t</photo>\r\n\t<photo id="2822544806" owner="78398753@N00" secret="bd93cbe917" server="1" farm="1" title="OOK" \r\n     ispublic="1" isfriend="0" isfamily="0" is_primary="0" has_comment="0" />\r\n</photos>', 'Returns a <a href="http://code.flickr.com/blog/2008/08/19/standard-photos-response-apis-for-civilized-age/">standard photo response</a>.  Additionally if the gallery creator has included a comment with the photo this will be then the photo element will have the attribute has_comment="1" and the child element "comment" will be present.'),
+)
@@ -0,0 +1,9 @@
+"""
+    Documentation of the flickr.interestingness methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.interestingness.getList', 'Returns the list of interesting photos for the most recent day or a user-specified date.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A specific date, formatted as YYYY-MM-DD, to return interesting photos for.', 'Always ask the pandas for interesting photos. This is a temporary argument to allow developers to update their code.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+)
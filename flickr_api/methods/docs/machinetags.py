@@ -0,0 +1,13 @@
+"""
+    Documentation of the flickr.machinetags methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.machinetags.getNamespaces', 'Return a list of unique namespaces, optionally limited by a given predicate, in alphabetical order.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Limit the list of namespaces returned to those that have the following predicate.', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<namespaces page="1" total="5" perpage="500" pages="1">\r\n  <namespace usage="6538" predicates="13">aero</namespace>\r\n  <namespace usage="9072" predicates="24">flickr</namespace>\r\n  <namespace usage="670270" predicates="35">geo</namespace>\r\n  <namespace usage="23903" predicates="36">taxonomy</namespace>\r\n  <namespace usage="50449" predicates="4">upcoming</namespace>\r\n</namespaces>\r\n', '"Usage" gives you roughly how popular a machine tags, while "predicates" is the count of distinct predicates a namespace has.'),
+    ('flickr.machinetags.getPairs', 'Return a list of unique namespace and predicate pairs, optionally limited by predicate or namespace, in alphabetical order.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Limit the list of pairs returned to those that have the following namespace.', 'Limit the list of pairs returned to those that have the following predicate.', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<pairs page="1" total="1228" perpage="500" pages="3">\r\n   <pair namespace="aero" predicate="airline" usage="1093">aero:airline</pair>\r\n   <pair namespace="aero" predicate="icao" usage="4">aero:icao</pair>\r\n   <pair namespace="aero" predicate="model" usage="1026">aero:model</pair>\r\n   <pair namespace="aero" predicate="tail" usage="1048">aero:tail</pair>\r\n</pairs>', None),
+    ('flickr.machinetags.getPredicates', 'Return a list of unique predicates, optionally limited by a given namespace.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Limit the list of predicates returned to those that have the following namespace.', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<predicates page="1" pages="1" total="3" perpage="500">\r\n    <predicate usage="20" namespaces="1">elbow</predicate>\r\n    <predicate usage="52" namespaces="2">face</predicate>\r\n    <predicate usage="10" namespaces="1">hand</predicate>\r\n</predicates>\r\n', None),
+    ('flickr.machinetags.getRecentValues', 'Fetch recently used (or created) machine tags values.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A namespace that all values should be restricted to.', 'A predicate that all values should be restricted to.', 'Only return machine tags values that have been added since this timestamp, in epoch seconds.  '), '<values namespace="taxonomy" predicate="common" page="1" total="500" perpage="500" pages="1">\r\n    <value usage="4" namespace="taxonomy" predicate="common"\r\n           first_added="1244232796" last_added="1244232796">maui chaff flower</value>\r\n\r\n    <!-- and so on... -->\r\n</values>', None),
+    ('flickr.machinetags.getValues', 'Return a list of unique values for a namespace and predicate.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The namespace that all values should be restricted to.', 'The predicate that all values should be restricted to.', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.', 'Minimum usage count.'), '<values namespace="upcoming" predicate="event" page="1" pages="1" total="3" perpage="500">\r\n    <value usage="3">123</value>\r\n    <value usage="1">456</value>\r\n    <value usage="147">789</value>\r\n</values>', None),
+)
@@ -0,0 +1,65 @@
+"""
+    Documentation of the flickr.photos methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.photos.addTags', 'Add tags to a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to add tags to.', 'The tags to add to the photo.'), None, None),
+    ('flickr.photos.comments.addComment', 'Add comment to a photo as the currently authenticated user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to add a comment to.', 'Text of the comment'), '<comment id="97777-72057594037941949-72057594037942602" />', None),
+    ('flickr.photos.comments.deleteComment', 'Delete a comment as the currently authenticated user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the comment to edit.'), None, None),
+    ('flickr.photos.comments.editComment', 'Edit the text of a comment as the currently authenticated user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the comment to edit.', 'Update the comment to this text.'), None, None),
+    ('flickr.photos.comments.getList', 'Returns the comments for a photo', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch comments for.', 'Minimum date that a a comment was added. The date should be in the form of a unix timestamp.', 'Maximum date that a comment was added. The date should be in the form of a unix timestamp.', '', '', ''), '<comments photo_id="109722179">\r\n        <comment id="6065-109722179-72057594077818641"\r\n         author="35468159852@N01" authorname="Rev Dan Catt" datecreate="1141841470"\r\n         permalink="http://www.flickr.com/photos/straup/109722179/#comment72057594077818641"\r\n         >Umm, I\'m not sure, can I get back to you on that one?</comment>\r\n</comments>', None),
+    ('flickr.photos.comments.getRecentForContacts', 'Return the list of photos belonging to your contacts that have been commented on recently.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Limits the resultset to photos that have been commented on since this date. The date should be in the form of a Unix timestamp.<br /><br />\r\nThe default, and maximum, offset is (1) hour.\r\n\r\n\r\n', 'A comma-separated list of contact NSIDs to limit the scope of the query to.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.delete', 'Delete a photo from flickr.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to delete.'), None, None),
+    ('flickr.photos.geo.batchCorrectLocation', "Correct the places hierarchy for all the photos for a user at a given latitude, longitude and accuracy.<br /><br />\r\n\r\nBatch corrections are processed in a delayed queue so it may take a few minutes before the changes are reflected in a user's photos.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The latitude of the photos to be update whose valid range is -90 to 90. Anything more than 6 decimal places will be truncated.', 'The longitude of the photos to be updated whose valid range is -180 to 180. Anything more than 6 decimal places will be truncated.', 'Recorded accuracy level of the photos to be updated. World level is 1, Country is ~3, Region ~6, City ~11, Street ~16. Current range is 1-16. Defaults to 16 if not specified.', 'A Flickr Places ID. (While optional, you must pass either a valid Places ID or a WOE ID.)', 'A Where On Earth (WOE) ID. (While optional, you must pass either a valid Places ID or a WOE ID.)'), None, None),
+    ('flickr.photos.geo.correctLocation', '', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the photo whose WOE location is being corrected.', 'A Flickr Places ID. (While optional, you must pass either a valid Places ID or a WOE ID.)', 'A Where On Earth (WOE) ID. (While optional, you must pass either a valid Places ID or a WOE ID.)', 'The venue ID for a Foursquare location. (If not passed in with correction, any existing foursquare venue will be removed).'), None, None),
+    ('flickr.photos.geo.getLocation', 'Get the geo data (latitude and longitude and the accuracy level) for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo you want to retrieve location data for.', 'Extra flags.'), '<photo id="123">\r\n        <location latitude="-17.685895" longitude="-63.36914" accuracy="6" />\r\n</photo>', None),
+    ('flickr.photos.geo.getPerms', 'Get permissions for who may view geo data for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to get permissions for.'), '<perms id="10592" ispublic="0" iscontact="0" isfriend="0" isfamily="1" />', None),
+    ('flickr.photos.geo.photosForLocation', 'Return a list of photos for the calling user at a specific latitude, longitude and accuracy', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The latitude whose valid range is -90 to 90. Anything more than 6 decimal places will be truncated.', 'The longitude whose valid range is -180 to 180. Anything more than 6 decimal places will be truncated.', 'Recorded accuracy level of the location information. World level is 1, Country is ~3, Region ~6, City ~11, Street ~16. Current range is 1-16. Defaults to 16 if not specified.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.geo.removeLocation', 'Removes the geo data associated with a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo you want to remove location data from.'), None, None),
+    ('flickr.photos.geo.setContext', "Indicate the state of a photo's geotagginess beyond latitude and longitude.<br /><br />\r\nNote : photos passed to this method must already be geotagged (using the <q>flickr.photos.geo.setLocation</q> method).", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set context data for.', 'Context is a numeric value representing the photo\'s geotagginess beyond latitude and longitude. For example, you may wish to indicate that a photo was taken "indoors" or "outdoors". <br /><br />\r\nThe current list of context IDs is :<br /><br/>\r\n<ul>\r\n<li><strong>0</strong>, not defined.</li>\r\n<li><strong>1</strong>, indoors.</li>\r\n<li><strong>2</strong>, outdoors.</li>\r\n</ul>'), None, None),
+    ('flickr.photos.geo.setLocation', 'Sets the geo data (latitude and longitude and, optionally, the accuracy level) for a photo.\r\n\r\nBefore users may assign location data to a photo they must define who, by default, may view that information. Users can edit this preference at <a href="http://www.flickr.com/account/geo/privacy/">http://www.flickr.com/account/geo/privacy/</a>. If a user has not set this preference, the API method will return an error.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set location data for.', 'The latitude whose valid range is -90 to 90. Anything more than 6 decimal places will be truncated.', 'The longitude whose valid range is -180 to 180. Anything more than 6 decimal places will be truncated.', 'Recorded accuracy level of the location information. World level is 1, Country is ~3, Region ~6, City ~11, Street ~16. Current range is 1-16. Defaults to 16 if not specified.', 'Context is a numeric value representing the photo\'s geotagginess beyond latitude and longitude. For example, you may wish to indicate that a photo was taken "indoors" or "outdoors". <br /><br />\r\nThe current list of context IDs is :<br /><br/>\r\n<ul>\r\n<li><strong>0</strong>, not defined.</li>\r\n<li><strong>1</strong>, indoors.</li>\r\n<li><strong>2</strong>, outdoors.</li>\r\n</ul><br />\r\nThe default context for geotagged photos is 0, or "not defined"\r\n', 'Associate a geo bookmark with this photo.', '', '', '', '', 'The venue ID for a Foursquare location.', 'A Where On Earth (WOE) ID. (If passed in, will override the default venue based on the lat/lon.)'), None, None),
+    ('flickr.photos.geo.setPerms', 'Set the permission for who may view the geo data associated with a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "1 to set viewing permissions for the photo's location data to public, 0 to set it to private.", "1 to set viewing permissions for the photo's location data to contacts, 0 to set it to private.", "1 to set viewing permissions for the photo's location data to friends, 0 to set it to private.", "1 to set viewing permissions for the photo's location data to family, 0 to set it to private.", 'The id of the photo to get permissions for.'), None, None),
+    ('flickr.photos.getAllContexts', 'Returns all visible sets and pools the photo belongs to.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The photo to return information for.'), '<set id="392" title="记忆群组" />\r\n<pool id="34427465471@N01" title="FlickrDiscuss" />', None),
+    ('flickr.photos.getContactsPhotos', "Fetch a list of recent photos from the calling users' contacts.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Number of photos to return. Defaults to 10, maximum 50. This is only used if <code>single_photo</code> is not passed.', 'set as 1 to only show photos from friends and family (excluding regular contacts).', 'Only fetch one photo (the latest) per contact, instead of all photos in chronological order.', 'Set to 1 to include photos from the calling user.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields include: license, date_upload, date_taken, owner_name, icon_server, original_format, last_update. For more information see extras under <a href="/services/api/flickr.photos.search.html">flickr.photos.search</a>.'), '<photos>\r\n\t<photo id="2801" owner="12037949629@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="Eric is the best" title="grease" /> \r\n\t<photo id="2499" owner="33853651809@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="cal18" title="36679_o" /> \r\n\t<photo id="2437" owner="12037951898@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="georgie parker" title="phoenix9_stewart" /> \r\n</photos>', None),
+    ('flickr.photos.getContactsPublicPhotos', "Fetch a list of recent public photos from a users' contacts.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch photos for.', 'Number of photos to return. Defaults to 10, maximum 50. This is only used if <code>single_photo</code> is not passed.', 'set as 1 to only show photos from friends and family (excluding regular contacts).', 'Only fetch one photo (the latest) per contact, instead of all photos in chronological order.', 'Set to 1 to include photos from the user specified by user_id.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: license, date_upload, date_taken, owner_name, icon_server, original_format, last_update.'), '<photos>\r\n\t<photo id="2801" owner="12037949629@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="Eric is the best" title="grease" /> \r\n\t<photo id="2499" owner="33853651809@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="cal18" title="36679_o" /> \r\n\t<photo id="2437" owner="12037951898@N01"\r\n\t\tsecret="123456" server="1"\r\n\t\tusername="georgie parker" title="phoenix9_stewart" /> \r\n</photos>', None),
+    ('flickr.photos.getContext', 'Returns next and previous photos for a photo in a photostream.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch the context for.', '', '', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description, license, date_upload, date_taken, owner_name, icon_server, original_format, last_update, geo, tags, machine_tags, o_dims, views, media, path_alias, url_sq, url_t, url_s, url_m, url_z, url_l, url_o</code>', 'Accepts <code>datetaken</code> or <code>dateposted</code> and returns results in the proper order.'), '<prevphoto id="2980" secret="973da1e709"\r\n\ttitle="boo!" url="/photos/bees/2980/" /> \r\n<nextphoto id="2985" secret="059b664012"\r\n\ttitle="Amsterdam Amstel" url="/photos/bees/2985/" /> ', '<p>When either the previous of next photo is unavailable, the element is still returned, but contains <code>id="0"</code></p>'),
+    ('flickr.photos.getCounts', 'Gets a list of photo counts for the given date ranges for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A comma delimited list of unix timestamps, denoting the periods to return counts for. They should be specified <b>smallest first</b>.', 'A comma delimited list of mysql datetimes, denoting the periods to return counts for. They should be specified <b>smallest first</b>.'), '<photocounts>\r\n\t<photocount count="4" fromdate="1093566950" todate="1093653350" /> \r\n\t<photocount count="0" fromdate="1093653350" todate="1093739750" /> \r\n\t<photocount count="0" fromdate="1093739750" todate="1093826150" /> \r\n\t<photocount count="2" fromdate="1093826150" todate="1093912550" /> \r\n\t<photocount count="0" fromdate="1093912550" todate="1093998950" /> \r\n\t<photocount count="0" fromdate="1093998950" todate="1094085350" /> \r\n\t<photocount count="0" fromdate="1094085350" todate="1094171750" /> \r\n</photocounts>\r\n', None),
+    ('flickr.photos.getExif', 'Retrieves a list of EXIF/TIFF/GPS tags for a given photo. The calling user must have permission to view the photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch information for.', "The secret for the photo. If the correct secret is passed then permissions checking is skipped. This enables the 'sharing' of individual photos by passing around the id and secret."), '<photo id="4424" secret="06b8e43bc7" server="2">\r\n\t<exif tagspace="TIFF" tagspaceid="1" tag="271" label="Manufacturer">\r\n\t\t<raw>Canon</raw>\r\n\t</exif>\r\n\t<exif tagspace="EXIF" tagspaceid="0" tag="33437" label="Aperture">\r\n\t\t<raw>90/10</raw>\r\n\t\t<clean>f/9</clean>\r\n\t</exif>\r\n\t<exif tagspace="GPS" tagspaceid="3" tag="4" label="Longitude">\r\n\t\t<raw>64/1, 42/1, 4414/100</raw>\r\n\t\t<clean>64° 42\' 44.14"</clean>\r\n\t</exif>\r\n</photo>\r\n', '<p>The <code>&lt;clean&gt;</code> element contains a pretty-formatted version of the tag where availabale.</p>'),
+    ('flickr.photos.getFavorites', 'Returns the list of people who have favorited a given photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the photo to fetch the favoriters list for.', 'The page of results to return. If this argument is omitted, it defaults to 1.', 'Number of usres to return per page. If this argument is omitted, it defaults to 10. The maximum allowed value is 50.'), '<photo id="1253576" secret="81b96be690" server="1" farm="1"\r\n\tpage="1" pages="3" perpage="10" total="27">\r\n\t<person nsid="33939862@N00" username="Dementation" favedate="1166689690"/>\r\n\t<person nsid="49485425@N00" username="indigenous_prodigy" favedate="1166573724"/>\r\n\t<person nsid="46834205@N00" username="smaaz" favedate="1161874052"/>\r\n\t<person nsid="95626108@N00" username="chrome Foxpuppy" favedate="1160528154"/>\r\n\t<person nsid="44991966@N00" username="getnoid" favedate="1159828789"/>\r\n\t<person nsid="92544710@N00" username="miss_rogue" favedate="1158034266"/>\r\n\t<person nsid="50944224@N00" username="Infollatus" favedate="1155317436"/>\r\n\t<person nsid="80544408@N00" username="DafyddLlyr" favedate="1148511763"/>\r\n\t<person nsid="31154299@N00" username="c r i s" favedate="1143085224"/>\r\n\t<person nsid="54309070@N00" username="Shinayaker" favedate="1142584219"/>\r\n</photo>', None),
+    ('flickr.photos.getInfo', 'Get information about a photo. The calling user must have permission to view the photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to get information for.', "The secret for the photo. If the correct secret is passed then permissions checking is skipped. This enables the 'sharing' of individual photos by passing around the id and secret.", '', '', '', "Return geofence information in the photo's location property", ''), '<photo id="2733" secret="123456" server="12"\r\n\tisfavorite="0" license="3" rotation="90" \r\n\toriginalsecret="1bc09ce34a" originalformat="png">\r\n\t<owner nsid="12037949754@N01" username="Bees"\r\n\t\trealname="Cal Henderson" location="Bedford, UK" />\r\n\t<title>orford_castle_taster</title>\r\n\t<description>hello!</description>\r\n\t<visibility ispublic="1" isfriend="0" isfamily="0" />\r\n\t<dates posted="1100897479" taken="2004-11-19 12:51:19"\r\n\t\ttakengranularity="0" lastupdate="1093022469" />\r\n\t<permissions permcomment="3" permaddmeta="2" />\r\n\t<editability cancomment="1" canaddmeta="1" />\r\n\t<comments>1</comments>\r\n\t<notes>\r\n\t\t<note id="313" author="12037949754@N01"\r\n\t\t\tauthorname="Bees" x="10" y="10"\r\n\t\t\tw="50" h="50">foo</note>\r\n\t</notes>\r\n\t<tags>\r\n\t\t<tag id="1234" author="12037949754@N01" raw="woo yay">wooyay</tag>\r\n\t\t<tag id="1235" author="12037949754@N01" raw="hoopla">hoopla</tag>\r\n\t</tags>\r\n\t<urls>\r\n\t\t<url type="photopage">http://www.flickr.com/photos/bees/2733/</url> \r\n\t</urls>\r\n</photo>', "<p>The <code>&lt;permissions&gt;</code> element is only returned for photos owned by the calling user. The <code>isfavorite</code> attribute only makes sense for logged in users who don't own the photo. The <code>rotation</code> attribute is the current clockwise rotation, in degrees, by which the smaller image sizes differ from the original image.</p>\r\n\r\n<p>The <code>&lt;date&gt;</code> element's <code>lastupdate</code> attribute is a Unix timestamp indicating the last time the photo, or any of its metadata (tags, comments, etc.) was modified.</p>"),
+    ('flickr.photos.getNotInSet', 'Returns a list of your photos that are not part of any sets.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Maximum upload date. Photos with an upload date less than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'Minimum taken date. Photos with an taken date greater than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Maximum taken date. Photos with an taken date less than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Return photos only matching a certain privacy level. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends &amp; family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>', 'Minimum upload date. Photos with an upload date greater than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.getPerms', 'Get permissions for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to get permissions for.'), '<perms id="2733" ispublic="1" isfriend="1" isfamily="0" permcomment="0" permaddmeta="1" /> ', None),
+    ('flickr.photos.getRecent', 'Returns a list of the latest public photos uploaded to flickr.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', '', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.getSizes', 'Returns the available sizes for a photo.  The calling user must have permission to view the photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch size information for.'), '<sizes canblog="1" canprint="1" candownload="1">\r\n    <size label="Square" width="75" height="75" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_s.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/sq/" media="photo" />\r\n    <size label="Large Square" width="150" height="150" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_q.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/q/" media="photo" />\r\n    <size label="Thumbnail" width="100" height="75" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_t.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/t/" media="photo" />\r\n    <size label="Small" width="240" height="180" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_m.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/s/" media="photo" />\r\n    <size label="Small 320" width="320" height="240" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_n.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/n/" media="photo" />\r\n    <size label="Medium" width="500" height="375" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/m/" media="photo" />\r\n    <size label="Medium 640" width="640" height="480" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_z.jpg?zz=1" url="http://www.flickr.com/photos/stewart/567229075/sizes/z/" media="photo" />\r\n    <size label="Medium 800" width="800" height="600" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_c.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/c/" media="photo" />\r\n    <size label="Large" width="1024" height="768" source="http://farm2.staticflickr.com/1103/567229075_2cf8456f01_b.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/l/" media="photo" />\r\n    <size label="Original" width="2400" height="1800" source="http://farm2.staticflickr.com/1103/567229075_6dc09dc6da_o.jpg" url="http://www.flickr.com/photos/stewart/567229075/sizes/o/" media="photo" />\r\n</sizes>\r\n', None),
+    ('flickr.photos.getUntagged', 'Returns a list of your photos with no tags.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Minimum upload date. Photos with an upload date greater than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'Maximum upload date. Photos with an upload date less than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'Minimum taken date. Photos with an taken date greater than or equal to this value will be returned. The date should be in the form of a mysql datetime or unix timestamp.', 'Maximum taken date. Photos with an taken date less than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Return photos only matching a certain privacy level. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends &amp; family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.getWithGeoData', 'Returns a list of your geo-tagged photos.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Minimum upload date. Photos with an upload date greater than or equal to this value will be returned. The date should be in the form of a unix timestamp.', 'Maximum upload date. Photos with an upload date less than or equal to this value will be returned. The date should be in the form of a unix timestamp.', 'Minimum taken date. Photos with an taken date greater than or equal to this value will be returned. The date should be in the form of a mysql datetime.', 'Maximum taken date. Photos with an taken date less than or equal to this value will be returned. The date should be in the form of a mysql datetime.', 'Return photos only matching a certain privacy level. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends & family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'The order in which to sort returned photos. Deafults to date-posted-desc. The possible values are: date-posted-asc, date-posted-desc, date-taken-asc, date-taken-desc, interestingness-desc, and interestingness-asc.', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.getWithoutGeoData', "Returns a list of your photos which haven't been geo-tagged.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Maximum upload date. Photos with an upload date less than or equal to this value will be returned. The date should be in the form of a unix timestamp.', 'Minimum taken date. Photos with an taken date greater than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Maximum taken date. Photos with an taken date less than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Return photos only matching a certain privacy level. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends &amp; family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'The order in which to sort returned photos. Deafults to date-posted-desc. The possible values are: date-posted-asc, date-posted-desc, date-taken-asc, date-taken-desc, interestingness-desc, and interestingness-asc.', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>', 'Minimum upload date. Photos with an upload date greater than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, None),
+    ('flickr.photos.licenses.getInfo', 'Fetches a list of available photo licenses for Flickr.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<licenses>\r\n        <license id="0" name="All Rights Reserved" url="" />\r\n\t<license id="1" name="Attribution-NonCommercial-ShareAlike License"\r\n\t\turl="http://creativecommons.org/licenses/by-nc-sa/2.0/" /> \r\n\t<license id="2" name="Attribution-NonCommercial License"\r\n\t\turl="http://creativecommons.org/licenses/by-nc/2.0/" /> \r\n\t<license id="3" name="Attribution-NonCommercial-NoDerivs License"\r\n\t\turl="http://creativecommons.org/licenses/by-nc-nd/2.0/" /> \r\n\t<license id="4" name="Attribution License"\r\n\t\turl="http://creativecommons.org/licenses/by/2.0/" /> \r\n\t<license id="5" name="Attribution-ShareAlike License"\r\n\t\turl="http://creativecommons.org/licenses/by-sa/2.0/" /> \r\n\t<license id="6" name="Attribution-NoDerivs License"\r\n\t\turl="http://creativecommons.org/licenses/by-nd/2.0/" /> \r\n\t<license id="7" name="No known copyright restrictions"\r\n\t\turl="http://flickr.com/commons/usage/" />\r\n        <license id="8" name="United States Government Work"\r\n                url="http://www.usa.gov/copyright.shtml" />\r\n</licenses>', None),
+    ('flickr.photos.licenses.setLicense', 'Sets the license for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The photo to update the license for.', 'The license to apply, or 0 (zero) to remove the current license. Note : as of this writing the "no known copyright restrictions" license (7) is not a valid argument.'), None, None),
+    ('flickr.photos.notes.add', 'Add a note to a photo. Coordinates and sizes are in pixels, based on the 500px image size shown on individual photo pages.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to add a note to', 'The left coordinate of the note', 'The top coordinate of the note', 'The width of the note', 'The height of the note', 'The description of the note'), '<note id="1234" />', None),
+    ('flickr.photos.notes.delete', 'Delete a note from a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the note to delete'), None, None),
+    ('flickr.photos.notes.edit', 'Edit a note on a photo. Coordinates and sizes are in pixels, based on the 500px image size shown on individual photo pages.\r\n', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the note to edit', 'The left coordinate of the note', 'The top coordinate of the note', 'The width of the note', 'The height of the note', 'The description of the note'), None, None),
+    ('flickr.photos.people.add', 'Add a person to a photo. Coordinates and sizes of boxes are optional; they are measured in pixels, based on the 500px image size shown on individual photo pages.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to add a person to.', 'The NSID of the user to add to the photo.', 'The left-most pixel co-ordinate of the box around the person.', 'The top-most pixel co-ordinate of the box around the person.', 'The width (in pixels) of the box around the person.', 'The height (in pixels) of the box around the person.'), None, None),
+    ('flickr.photos.people.delete', 'Remove a person from a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to remove a person from.', 'The NSID of the person to remove from the photo.', 'An email address for an invited user.'), None, None),
+    ('flickr.photos.people.deleteCoords', 'Remove the bounding box from a person in a photo', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to edit a person in.', 'The NSID of the person whose bounding box you want to remove.'), None, None),
+    ('flickr.photos.people.editCoords', 'Edit the bounding box of an existing person on a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to edit a person in.', 'The NSID of the person to edit in a photo.', 'The left-most pixel co-ordinate of the box around the person.', 'The top-most pixel co-ordinate of the box around the person.', 'The width (in pixels) of the box around the person.', 'The height (in pixels) of the box around the person.', "An email address for an 'invited' person in a photo"), None, None),
+    ('flickr.photos.people.getList', 'Get a list of people in a given photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to get a list of people for.'), '<people total="1">\r\n  <person nsid="87944415@N00" username="hitherto" iconserver="1" iconfarm="1"\r\n          realname="Simon Batistoni" added_by="12037949754@N01" x="50" y="50"\r\n          w="100" h="100"/>\r\n</people>', 'x, y, w and h correspond to the coordinates of the "bounding box" around a person in a photo. Since these co-ordinates are optional, these elements may not be present for every person.'),
+    ('flickr.photos.recentlyUpdated', "<p>Return a list of your photos that have been recently created or which have been recently modified.</p>\r\n\r\n<p>Recently modified may mean that the photo's metadata (title, description, tags) may have been changed or a comment has been added (or just modified somehow :-)</p>", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A Unix timestamp or any English textual datetime description indicating the date from which modifications should be compared.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<photos page="1" pages="1" perpage="100" total="2">\r\n        <photo id="169885459" owner="35034348999@N01" \r\n               secret="c85114c195" server="46" title="Doubting Michael"\r\n               ispublic="1" isfriend="0" isfamily="0" lastupdate="1150755888" />\r\n        <photo id="85022332" owner="35034348999@N01"\r\n               secret="23de6de0c0" server="41"\r\n               title="&quot;Do you think we\'re allowed to tape stuff to the walls?&quot;"\r\n               ispublic="1" isfriend="0" isfamily="0" lastupdate="1150564974" />\r\n</photos>', '<p>Photos are sorted by their date updated timestamp, in descending order.</p>'),
+    ('flickr.photos.removeTag', 'Remove a tag from a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The tag to remove from the photo. This parameter should contain a tag id, as returned by <a href="/services/api/flickr.photos.getInfo.html">flickr.photos.getInfo</a>.'), None, None),
+    ('flickr.photos.search', "Return a list of photos matching some criteria. Only photos visible to the calling user will be returned. To return private or semi-private photos, the caller must be authenticated with 'read' permissions, and have permission to view the photos. Unauthenticated calls will only return public photos.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user who\'s photo to search. If this parameter isn\'t passed then everybody\'s public photos will be searched. A value of "me" will search against the calling user\'s photos for authenticated calls.', 'A comma-delimited list of tags. Photos with one or more of the tags listed will be returned. You can exclude results that match a term by prepending it with a - character.', "Either 'any' for an OR combination of tags, or 'all' for an AND combination. Defaults to 'any' if not specified.", "A free text search. Photos who's title, description or tags contain the text will be returned. You can exclude results that match a term by prepending it with a - character.", 'Minimum upload date. Photos with an upload date greater than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'Maximum upload date. Photos with an upload date less than or equal to this value will be returned. The date can be in the form of a unix timestamp or mysql datetime.', 'Minimum taken date. Photos with an taken date greater than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'Maximum taken date. Photos with an taken date less than or equal to this value will be returned. The date can be in the form of a mysql datetime or unix timestamp.', 'The license id for photos (for possible values see the flickr.photos.licenses.getInfo method). Multiple licenses may be comma-separated.', 'The order in which to sort returned photos. Deafults to date-posted-desc (unless you are doing a radial geo query, in which case the default sorting is by ascending distance from the point specified). The possible values are: date-posted-asc, date-posted-desc, date-taken-asc, date-taken-desc, interestingness-desc, interestingness-asc, and relevance.', 'Return photos only matching a certain privacy level. This only applies when making an authenticated call to view photos you own. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends & family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'A comma-delimited list of 4 values defining the Bounding Box of the area that will be searched.\r\n<br /><br />\r\nThe 4 values represent the bottom-left corner of the box and the top-right corner, minimum_longitude, minimum_latitude, maximum_longitude, maximum_latitude.\r\n<br /><br />\r\nLongitude has a range of -180 to 180 , latitude of -90 to 90. Defaults to -180, -90, 180, 90 if not specified.\r\n<br /><br />\r\nUnlike standard photo queries, geo (or bounding box) queries will only return 250 results per page.\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &#8212; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'Recorded accuracy level of the location information.  Current range is 1-16 : \r\n\r\n<ul>\r\n<li>World level is 1</li>\r\n<li>Country is ~3</li>\r\n<li>Region is ~6</li>\r\n<li>City is ~11</li>\r\n<li>Street is ~16</li>\r\n</ul>\r\n\r\nDefaults to maximum value if not specified.', 'Safe search setting:\r\n\r\n<ul>\r\n<li>1 for safe.</li>\r\n<li>2 for moderate.</li>\r\n<li>3 for restricted.</li>\r\n</ul>\r\n\r\n(Please note: Un-authed calls can only see Safe content.)', "Content Type setting:\r\n<ul>\r\n<li>1 for photos only.</li>\r\n<li>2 for screenshots only.</li>\r\n<li>3 for 'other' only.</li>\r\n<li>4 for photos and screenshots.</li>\r\n<li>5 for screenshots and 'other'.</li>\r\n<li>6 for photos and 'other'.</li>\r\n<li>7 for photos, screenshots, and 'other' (all).</li>\r\n</ul>", 'Aside from passing in a fully formed machine tag, there is a special syntax for searching on specific properties :\r\n\r\n<ul>\r\n  <li>Find photos using the \'dc\' namespace :    <code>"machine_tags" => "dc:"</code></li>\r\n\r\n  <li> Find photos with a title in the \'dc\' namespace : <code>"machine_tags" => "dc:title="</code></li>\r\n\r\n  <li>Find photos titled "mr. camera" in the \'dc\' namespace : <code>"machine_tags" => "dc:title=\\"mr. camera\\"</code></li>\r\n\r\n  <li>Find photos whose value is "mr. camera" : <code>"machine_tags" => "*:*=\\"mr. camera\\""</code></li>\r\n\r\n  <li>Find photos that have a title, in any namespace : <code>"machine_tags" => "*:title="</code></li>\r\n\r\n  <li>Find photos that have a title, in any namespace, whose value is "mr. camera" : <code>"machine_tags" => "*:title=\\"mr. camera\\""</code></li>\r\n\r\n  <li>Find photos, in the \'dc\' namespace whose value is "mr. camera" : <code>"machine_tags" => "dc:*=\\"mr. camera\\""</code></li>\r\n\r\n </ul>\r\n\r\nMultiple machine tags may be queried by passing a comma-separated list. The number of machine tags you can pass in a single query depends on the tag mode (AND or OR) that you are querying with. "AND" queries are limited to (16) machine tags. "OR" queries are limited\r\nto (8).', "Either 'any' for an OR combination of tags, or 'all' for an AND combination. Defaults to 'any' if not specified.", "The id of a group who's pool to search.  If specified, only matching photos posted to the group's pool will be returned.", 'boolean. Pass faves=1 along with your user_id to search within your favorites', 'Limit results by camera.  Camera names must be in the <a href="http://www.flickr.com/cameras">Camera Finder</a> normalized form.  <a href="http://flickr.com/services/api/flickr.cameras.getList">flickr.cameras.getList()</a> returns a list of searchable cameras.', 'Jump, jump!', "Search your contacts. Either 'all' or 'ff' for just friends and family. (Experimental)", 'A 32-bit identifier that uniquely represents spatial entities. (not used if bbox argument is present). \r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'A Flickr place id.  (not used if bbox argument is present).\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>', 'Any photo that has been geotagged, or if the value is "0" any photo that has <i>not</i> been geotagged.\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'Geo context is a numeric value representing the photo\'s geotagginess beyond latitude and longitude. For example, you may wish to search for photos that were taken "indoors" or "outdoors". <br /><br />\r\nThe current list of context IDs is :<br /><br/>\r\n<ul>\r\n<li><strong>0</strong>, not defined.</li>\r\n<li><strong>1</strong>, indoors.</li>\r\n<li><strong>2</strong>, outdoors.</li>\r\n</ul>\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'A valid latitude, in decimal format, for doing radial geo queries.\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'A valid longitude, in decimal format, for doing radial geo queries.\r\n<br /><br />\r\nGeo queries require some sort of limiting agent in order to prevent the database from crying. This is basically like the check against "parameterless searches" for queries without a geo component.\r\n<br /><br />\r\nA tag, for instance, is considered a limiting agent as are user defined min_date_taken and min_date_upload parameters &mdash; If no limiting factor is passed we return only photos added in the last 12 hours (though we may extend the limit in the future).', 'A valid radius used for geo queries, greater than zero and less than 20 miles (or 32 kilometers), for use with point-based geo queries. The default value is 5 (km).', 'The unit of measure when doing radial geo queries. Valid options are "mi" (miles) and "km" (kilometers). The default is "km".', 'Limit the scope of the search to only photos that are part of the <a href="http://flickr.com/commons">Flickr Commons project</a>. Default is false.', 'Limit the scope of the search to only photos that are in a <a href="http://www.flickr.com/help/galleries/">gallery</a>?  Default is false, search all photos.', 'The id of a user.  Will return photos where the user has been people tagged.  A call signed as the person_id in question will return *all* photos the user in, otherwise returns public photos.', 'Limit the scope of the search to only photos that are for sale on Getty. Default is false.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: <code>description</code>, <code>license</code>, <code>date_upload</code>, <code>date_taken</code>, <code>owner_name</code>, <code>icon_server</code>, <code>original_format</code>, <code>last_update</code>, <code>geo</code>, <code>tags</code>, <code>machine_tags</code>, <code>o_dims</code>, <code>views</code>, <code>media</code>, <code>path_alias</code>, <code>url_sq</code>, <code>url_t</code>, <code>url_s</code>, <code>url_q</code>, <code>url_m</code>, <code>url_n</code>, <code>url_z</code>, <code>url_c</code>, <code>url_l</code>, <code>url_o</code>', 'Number of photos to return per page. If this argument is omitted, it defaults to 100. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), None, 'Please note that Flickr will return at most the first 4,000 results for any given search query.  If this is an issue, we recommend trying a more specific query.'),
+    ('flickr.photos.setContentType', 'Set the content type of a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set the adultness of.', 'The content type of the photo. Must be one of: 1 for Photo, 2 for Screenshot, and 3 for Other.'), '<rsp stat="ok">\r\n<photo id="14814" content_type="3"/>\r\n</rsp>', None),
+    ('flickr.photos.setDates', 'Set one or both of the dates for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to edit dates for.', 'The date the photo was uploaded to flickr (see the <a href="/services/api/misc.dates.html">dates documentation</a>)', 'The date the photo was taken (see the <a href="/services/api/misc.dates.html">dates documentation</a>)', 'The granularity of the date the photo was taken (see the <a href="/services/api/misc.dates.html">dates documentation</a>)'), None, None),
+    ('flickr.photos.setMeta', 'Set the meta information for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set information for.', 'The title for the photo.', 'The description for the photo.'), None, None),
+    ('flickr.photos.setPerms', 'Set permissions for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set permissions for.', '1 to set the photo to public, 0 to set it to private.', '1 to make the photo visible to friends when private, 0 to not.', '1 to make the photo visible to family when private, 0 to not.', "who can add comments to the photo and it's notes. one of:<br />\r\n<code>0</code>: nobody<br />\r\n<code>1</code>: friends &amp; family<br />\r\n<code>2</code>: contacts<br />\r\n<code>3</code>: everybody", 'who can add notes and tags to the photo. one of:<br />\r\n<code>0</code>: nobody / just the owner<br />\r\n<code>1</code>: friends &amp; family<br />\r\n<code>2</code>: contacts<br />\r\n<code>3</code>: everybody\r\n'), '<photoid secret="abcdef" originalsecret="abcdef">1234</photoid>', None),
+    ('flickr.photos.setSafetyLevel', 'Set the safety level of a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set the adultness of.', 'The safety level of the photo.  Must be one of:\r\n\r\n1 for Safe, 2 for Moderate, and 3 for Restricted.', 'Whether or not to additionally hide the photo from public searches.  Must be either 1 for Yes or 0 for No.'), '<rsp stat="ok">\r\n<photo id="14814" safety_level="2" hidden="0"/>\r\n</rsp>', None),
+    ('flickr.photos.setTags', 'Set the tags for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to set tags for.\r\n', 'All tags for the photo (as a single space-delimited string).'), None, None),
+    ('flickr.photos.suggestions.approveSuggestion', 'Approve a suggestion for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The unique ID for the location suggestion to approve.'), None, None),
+    ('flickr.photos.suggestions.getList', 'Return a list of suggestions for a user that are pending approval.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Only show suggestions for a single photo.', 'Only show suggestions with a given status.\r\n\r\n<ul>\r\n<li><strong>0</strong>, pending</li>\r\n<li><strong>1</strong>, approved</li>\r\n<li><strong>2</strong>, rejected</li>\r\n</ul>\r\n\r\nThe default is pending (or "0").'), None, None),
+    ('flickr.photos.suggestions.rejectSuggestion', 'Reject a suggestion for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The unique ID of the suggestion to reject.'), None, None),
+    ('flickr.photos.suggestions.removeSuggestion', 'Remove a suggestion, made by the calling user, from a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The unique ID for the location suggestion to approve.'), None, None),
+    ('flickr.photos.suggestions.suggestLocation', 'Suggest a geotagged location for a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The photo whose location you are suggesting.', 'The latitude whose valid range is -90 to 90. Anything more than 6 decimal places will be truncated.', 'The longitude whose valid range is -180 to 180. Anything more than 6 decimal places will be truncated.', 'Recorded accuracy level of the location information. World level is 1, Country is ~3, Region ~6, City ~11, Street ~16. Current range is 1-16. Defaults to 16 if not specified.', 'The WOE ID of the location used to build the location hierarchy for the photo.', 'The Flickr Places ID of the location used to build the location hierarchy for the photo.', 'A short note or history to include with the suggestion.'), None, None),
+    ('flickr.photos.transform.rotate', 'Rotate a photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to rotate.', "The amount of degrees by which to rotate the photo (clockwise) from it's current orientation. Valid values are 90, 180 and 270."), '<photoid secret="abcdef" originalsecret="abcdef">1234</photoid>', None),
+    ('flickr.photos.upload.checkTickets', 'Checks the status of one or more asynchronous photo upload tickets.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A comma-delimited list of ticket ids', ''), '<uploader>\r\n\t<ticket id="128" complete="1" photoid="2995" />\r\n\t<ticket id="129" complete="0" />\r\n\t<ticket id="130" complete="2" />\r\n\t<ticket id="131" invalid="1" />\r\n</uploader>\r\n', '<p>There is one <code>&lt;ticket&gt;</code> element for each ticket id supplied. The <code>id</code> attribute contains the corresponding ticket id. If the ticket wasn\'t found, the <code>invalid</code> attribute is set. The status of the ticket is passed in the <code>status</code> attribute; 0 means not completed, 1 means completed and 2 means the ticket failed (indicating there was a problem converting the file). When the status is 1, the photo id is passed in the <code>photoid</code> attribute. The photo id can then be used as with the <a href="/services/api/upload.api.html">synchronous upload API</a>.'),
+)
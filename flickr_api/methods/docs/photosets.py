@@ -0,0 +1,26 @@
+"""
+    Documentation of the flickr.photosets methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.photosets.addPhoto', 'Add a photo to the end of an existing photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to add a photo to.', 'The id of the photo to add to the set.'), None, None),
+    ('flickr.photosets.comments.addComment', 'Add a comment to a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to add a comment to.', 'Text of the comment'), '<comment id="97777-12492-72057594037942601" />', None),
+    ('flickr.photosets.comments.deleteComment', 'Delete a photoset comment as the currently authenticated user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the comment to delete from a photoset.'), None, None),
+    ('flickr.photosets.comments.editComment', 'Edit the text of a comment as the currently authenticated user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the comment to edit.', 'Update the comment to this text.'), None, None),
+    ('flickr.photosets.comments.getList', 'Returns the comments for a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to fetch comments for.'), '<comments photoset_id="109722179">\r\n    <comment id="6065-109722179-72057594077818641"\r\n         author="35468159852@N01" authorname="Rev Dan Catt" date_create="1141841470"\r\n         permalink="http://www.flickr.com/photos/straup/109722179/#comment72057594077818641"\r\n         >Umm, I\'m not sure, can I get back to you on that one?</comment>\r\n</comments>', None),
+    ('flickr.photosets.create', 'Create a new photoset for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A title for the photoset.', 'A description of the photoset. May contain limited html.', 'The id of the photo to represent this set. The photo must belong to the calling user.'), '<photoset id="1234" url="http://www.flickr.com/photos/bees/sets/1234/" />', '<p>New photosets are automatically put first in the photoset ordering for the user. Use <a href="/services/api/flickr.photosets.orderSets.html">flickr.photosets.orderSets</a> if you don\'t want the new set to appear first on the user\'s photoset list.</p>'),
+    ('flickr.photosets.delete', 'Delete a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to delete. It must be owned by the calling user.'), None, None),
+    ('flickr.photosets.editMeta', 'Modify the meta-data for a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to modify.', 'The new title for the photoset.', 'A description of the photoset. May contain limited html.'), None, None),
+    ('flickr.photosets.editPhotos', 'Modify the photos in a photoset. Use this method to add, remove and re-order photos.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to modify. The photoset must belong to the calling user.', "The id of the photo to use as the 'primary' photo for the set. This id must also be passed along in photo_ids list argument.", 'A comma-delimited list of photo ids to include in the set. They will appear in the set in the order sent. This list <b>must</b> contain the primary photo id. All photos must belong to the owner of the set. This list of photos replaces the existing list. Call flickr.photosets.addPhoto to append a photo to a set.'), None, None),
+    ('flickr.photosets.getContext', 'Returns next and previous photos for a photo in a set.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to fetch the context for.', "The id of the photoset for which to fetch the photo's context.", '', '', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: description, license, date_upload, date_taken, owner_name, icon_server, original_format, last_update, geo, tags, machine_tags, o_dims, views, media, path_alias, url_sq, url_t, url_s, url_m, url_z, url_l, url_o'), '<prevphoto id="2980" secret="973da1e709"\r\n\ttitle="boo!" url="/photos/bees/2980/" /> \r\n<nextphoto id="2985" secret="059b664012"\r\n\ttitle="Amsterdam Amstel" url="/photos/bees/2985/" /> ', '<p>See <a href="/services/api/flickr.photos.getContext.html">flickr.photos.getContext</a></p>'),
+    ('flickr.photosets.getInfo', 'Gets information about a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The ID of the photoset to fetch information for.'), '<photoset id="72157624618609504" owner="34427469121@N01" primary="4847770787" secret="6abd09a292" server="4153" farm="5" photos="55" count_views="523" count_comments="1" count_photos="43" count_videos="12" can_comment="1" date_create="1280530593" date_update="1308091378">\r\n    <title>Mah Kittehs</title>\r\n    <description>Sixty and Niner. Born on the 3rd of May, 2010, or thereabouts. Came to my place on Thursday, July 29, 2010.</description>\r\n</photoset>', None),
+    ('flickr.photosets.getList', 'Returns the photosets belonging to the specified user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to get a photoset list for. If none is specified, the calling user is assumed.', 'The page of results to get. Currently, if this is not provided, all sets are returned, but this behaviour may change in future.', 'The number of sets to get per page. If paging is enabled, the maximum number of sets per page is 500.'), '<photosets page="1" pages="1" perpage="30" total="2" cancreate="1">\r\n    <photoset id="72157626216528324" primary="5504567858" secret="017804c585" server="5174" farm="6" photos="22" videos="0" count_views="137" count_comments="0" can_comment="1" date_create="1299514498" date_update="1300335009">\r\n      <title>Avis Blanche</title>\r\n      <description>My Grandma\'s Recipe File.</description>\r\n    </photoset>\r\n    <photoset id="72157624618609504" primary="4847770787" secret="6abd09a292" server="4153" farm="5" photos="43" videos="12" count_views="523" count_comments="1" can_comment="1" date_create="1280530593" date_update="1308091378">\r\n      <title>Mah Kittehs</title>\r\n      <description>Sixty and Niner. Born on the 3rd of May, 2010, or thereabouts. Came to my place on Thursday, July 29, 2010.</description>\r\n    </photoset>\r\n</photosets>', "<p>Photosets are returned in the user's specified order, which may not mean the newest set is first. Applications displaying photosets should respect the user's ordering.</p>"),
+    ('flickr.photosets.getPhotos', 'Get the list of photos in a set.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to return the photos for.', 'A comma-delimited list of extra information to fetch for each returned record. Currently supported fields are: license, date_upload, date_taken, owner_name, icon_server, original_format, last_update, geo, tags, machine_tags, o_dims, views, media, path_alias, url_sq, url_t, url_s, url_m, url_o', 'Return photos only matching a certain privacy level. This only applies when making an authenticated call to view a photoset you own. Valid values are:\r\n<ul>\r\n<li>1 public photos</li>\r\n<li>2 private photos visible to friends</li>\r\n<li>3 private photos visible to family</li>\r\n<li>4 private photos visible to friends &amp; family</li>\r\n<li>5 completely private photos</li>\r\n</ul>\r\n', 'Number of photos to return per page. If this argument is omitted, it defaults to 500. The maximum allowed value is 500.', 'The page of results to return. If this argument is omitted, it defaults to 1.', 'Filter results by media type. Possible values are <code>all</code> (default), <code>photos</code> or <code>videos</code>'), '<photoset id="4" primary="2483" page="1" perpage="500" pages="1" total="2">\r\n\t<photo id="2484" secret="123456" server="1"\r\n\t\ttitle="my photo" isprimary="0" /> \r\n\t<photo id="2483" secret="123456" server="1"\r\n\t\ttitle="flickr rocks" isprimary="1" /> \r\n</photoset>', None),
+    ('flickr.photosets.orderSets', 'Set the order of photosets for the calling user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'A comma delimited list of photoset IDs, ordered with the set to show first, first in the list. Any set IDs not given in the list will be set to appear at the end of the list, ordered by their IDs.'), None, None),
+    ('flickr.photosets.removePhoto', 'Remove a photo from a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to remove a photo from.', 'The id of the photo to remove from the set.'), None, None),
+    ('flickr.photosets.removePhotos', 'Remove multiple photos from a photoset.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to remove photos from.', 'Comma-delimited list of photo ids to remove from the photoset.'), None, None),
+    ('flickr.photosets.reorderPhotos', '', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to reorder. The photoset must belong to the calling user.', 'Ordered, comma-delimited list of photo ids. Photos that are not in the list will keep their original order'), None, None),
+    ('flickr.photosets.setPrimaryPhoto', 'Set photoset primary photo', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photoset to set primary photo to.', 'The id of the photo to set as primary.'), None, None),
+)
@@ -0,0 +1,10 @@
+"""
+    Documentation of the flickr.reflection methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.reflection.getMethodInfo', 'Returns information for a given flickr API method.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The name of the method to fetch information for.'), '<method name="flickr.fakeMethod" needslogin="1">\r\n\t<description>A fake method</description> \r\n\t<response>xml-response-example</response> \r\n\t<explanation>explanation of example response</explanation> \r\n\t<arguments>\r\n\t\t<argument name="api_key" optional="0">\r\n\t\t\tYou API application key.</argument> \r\n\t\t<argument name="color" optional="1">\r\n\t\t\tYour favorite color.</argument> \r\n\t</arguments>\r\n\t<errors>\r\n\t\t<error code="1" message="Photo not found">\r\n\t\t\tFull explanation...</error> \r\n\t\t<error code="100" message="Invalid API Key">\r\n\t\t\tFull explanation...</error> \r\n\t</errors>\r\n</method>\r\n', None),
+    ('flickr.reflection.getMethods', 'Returns a list of available flickr API methods.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<methods>\r\n\t<method>flickr.blogs.getList</method>\r\n\t<method>flickr.blogs.postPhoto</method>\r\n\t<method>flickr.contacts.getList</method>\r\n\t<method>flickr.contacts.getPublicList</method>\r\n</methods>', None),
+)
@@ -0,0 +1,23 @@
+"""
+    Documentation of the flickr.stats methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.stats.getCSVFiles', 'Returns a list of URLs for text files containing <i>all</i> your stats data (from November 26th 2007 onwards) for the currently auth\'d user.\r\n\r\n<b>Please note, these files will only be available until June 1, 2010 Noon PDT.</b> \r\nFor more information <a href="/help/stats/#1369409">please check out this FAQ</a>, or just <a href="/photos/me/stats/downloads/">go download your files</a>.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<stats> \r\n   <csvfiles> \r\n      <csv href="http://farm4.static.flickr.com/3496/stats/72157623902771865_faaa.csv" type="daily" date="2010-04-01" /> \r\n      <csv href="http://farm4.static.flickr.com/3376/stats/72157624027152370_fbbb.csv" type="monthly" date="2010-04-01" /> \r\n      <csv href="http://farm5.static.flickr.com/4006/stats/72157623627769689_fccc.csv" type="daily" date="2010-03-01" /> \r\n      ....\r\n    </csvfiles> \r\n</stats>', None),
+    ('flickr.stats.getCollectionDomains', 'Get a list of referring domains for a collection', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the collection to get stats for. If not provided, stats for all collections will be returned.', 'Number of domains to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domains page="1" perpage="25" pages="1" total="3">\r\n\t<domain name="images.search.yahoo.com" views="127" />\r\n\t<domain name="flickr.com" views="122" />\r\n\t<domain name="images.google.com" views="70" />\r\n</domains>\r\n', '<p>There is one <code>&lt;domain&gt;</code> element for each referring domain, with attributes for the domain name and the number of views.</p>\r\n\r\n<p>For details on the referrers coming from each domain listed you can call <a href="/services/api/flickr.stats.getCollectionReferrers.html">flickr.stats.getCollectionReferrers</a></p>'),
+    ('flickr.stats.getCollectionReferrers', 'Get a list of referrers from a given domain to a collection', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format. \r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The domain to return referrers for. This should be a hostname (eg: "flickr.com") with no protocol or pathname.', 'The id of the collection to get stats for. If not provided, stats for all collections will be returned.', 'Number of referrers to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domain page="1" perpage="25" pages="1" total="3" name="flickr.com">\r\n\t<referrer url="http://flickr.com/" views="11"/>\r\n\t<referrer url="http://flickr.com/photos/friends/" views="8"/>\r\n\t<referrer url="http://flickr.com/search/?q=stats+api" views="2" searchterm="stats api"/>\r\n</domain>\r\n', '<p>There is one <code>&lt;referrer&gt;</code> element for each referring page, with attributes for the url and the number of views.</p>\r\n\r\n<p>Where the referring page is a search engine and we have identified the search term it will be given in the searchterm attribute.</p>'),
+    ('flickr.stats.getCollectionStats', 'Get the number of views on a collection for a given date.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the collection to get stats for.'), '<stats views="24" />', None),
+    ('flickr.stats.getPhotoDomains', 'Get a list of referring domains for a photo', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the photo to get stats for. If not provided, stats for all photos will be returned.', 'Number of domains to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domains page="1" perpage="25" pages="1" total="3">\r\n\t<domain name="images.search.yahoo.com" views="127" />\r\n\t<domain name="flickr.com" views="122" />\r\n\t<domain name="images.google.com" views="70" />\r\n</domains>\r\n', '<p>There is one <code>&lt;domain&gt;</code> element for each referring domain, with attributes for the domain name and the number of views.</p>\r\n\r\n<p>For details on the referrers coming from each domain listed you can call <a href="/services/api/flickr.stats.getPhotoReferrers.html">flickr.stats.getPhotoReferrers</a></p>'),
+    ('flickr.stats.getPhotoReferrers', 'Get a list of referrers from a given domain to a photo', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The domain to return referrers for. This should be a hostname (eg: "flickr.com") with no protocol or pathname.', 'The id of the photo to get stats for. If not provided, stats for all photos will be returned.', 'Number of referrers to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domain page="1" perpage="25" pages="1" total="3" name="flickr.com">\r\n\t<referrer url="http://flickr.com/" views="11"/>\r\n\t<referrer url="http://flickr.com/photos/friends/" views="8"/>\r\n\t<referrer url="http://flickr.com/search/?q=stats+api" views="2" searchterm="stats api"/>\r\n</domain>', '<p>There is one <code>&lt;referrer&gt;</code> element for each referring page, with attributes for the url and the number of views.</p>\r\n\r\n<p>Where the referring page is a search engine and we have identified the search term it will be given in the searchterm attribute.</p>'),
+    ('flickr.stats.getPhotoStats', 'Get the number of views, comments and favorites on a photo for a given date.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the photo to get stats for.'), '<stats views="24" comments="4" favorites="1"/>', None),
+    ('flickr.stats.getPhotosetDomains', 'Get a list of referring domains for a photoset', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the photoset to get stats for. If not provided, stats for all sets will be returned.', 'Number of domains to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domains page="1" perpage="25" pages="1" total="3">\r\n\t<domain name="images.search.yahoo.com" views="127" />\r\n\t<domain name="flickr.com" views="122" />\r\n\t<domain name="images.google.com" views="70" />\r\n</domains>\r\n', '<p>There is one <code>&lt;domain&gt;</code> element for each referring domain, with attributes for the domain name and the number of views.</p>\r\n\r\n<p>For details on the referrers coming from each domain listed you can call <a href="/services/api/flickr.stats.getPhotosetReferrers.html">flickr.stats.getPhotosetReferrers</a></p>'),
+    ('flickr.stats.getPhotosetReferrers', 'Get a list of referrers from a given domain to a photoset', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format. \r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The domain to return referrers for. This should be a hostname (eg: "flickr.com") with no protocol or pathname.', 'The id of the photoset to get stats for. If not provided, stats for all sets will be returned.', 'Number of referrers to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domain page="1" perpage="25" pages="1" total="3" name="flickr.com">\r\n\t<referrer url="http://flickr.com/" views="11"/>\r\n\t<referrer url="http://flickr.com/photos/friends/" views="8"/>\r\n\t<referrer url="http://flickr.com/search/?q=stats+api" views="2" searchterm="stats api"/>\r\n</domain>', '<p>There is one <code>&lt;referrer&gt;</code> element for each referring page, with attributes for the url and the number of views.</p>\r\n\r\n<p>Where the referring page is a search engine and we have identified the search term it will be given in the searchterm attribute.</p>'),
+    ('flickr.stats.getPhotosetStats', 'Get the number of views on a photoset for a given date.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The id of the photoset to get stats for.'), '<stats views="24" comments="1" />', None),
+    ('flickr.stats.getPhotostreamDomains', 'Get a list of referring domains for a photostream', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'Number of domains to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domains page="1" perpage="25" pages="1" total="3">\r\n\t<domain name="images.search.yahoo.com" views="127" />\r\n\t<domain name="flickr.com" views="122" />\r\n\t<domain name="images.google.com" views="70" />\r\n</domains>\r\n', '<p>There is one <code>&lt;domain&gt;</code> element for each referring domain, with attributes for the domain name and the number of views.</p>\r\n\r\n<p>For details on the referrers coming from each domain listed you can call <a href="/services/api/flickr.stats.getPhotostreamReferrers.html">flickr.stats.getPhotostreamReferrers</a></p>'),
+    ('flickr.stats.getPhotostreamReferrers', "Get a list of referrers from a given domain to a user's photostream", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format. \r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.', 'The domain to return referrers for. This should be a hostname (eg: "flickr.com") with no protocol or pathname.', 'Number of referrers to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<domain page="1" perpage="25" pages="1" total="3" name="flickr.com">\r\n\t<referrer url="http://flickr.com/" views="11"/>\r\n\t<referrer url="http://flickr.com/photos/friends/" views="8"/>\r\n\t<referrer url="http://flickr.com/search/?q=stats+api" views="2" searchterm="stats api"/>\r\n</domain>', '<p>There is one <code>&lt;referrer&gt;</code> element for each referring page, with attributes for the url and the number of views.</p>\r\n\r\n<p>Where the referring page is a search engine and we have identified the search term it will be given in the searchterm attribute.</p>'),
+    ('flickr.stats.getPhotostreamStats', "Get the number of views on a user's photostream for a given date.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.'), '<stats views="24" />', None),
+    ('flickr.stats.getPopularPhotos', 'List the photos with the most views, comments or favorites', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format. \r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.\r\n\r\nIf no date is provided, all time view counts will be returned.', 'The order in which to sort returned photos. Defaults to views. The possible values are views, comments and favorites. \r\n\r\nOther sort options are available through <a href="/services/api/flickr.photos.search.html">flickr.photos.search</a>.', 'Number of referrers to return per page. If this argument is omitted, it defaults to 25. The maximum allowed value is 100.', 'The page of results to return. If this argument is omitted, it defaults to 1.'), '<photos page="2" pages="89" perpage="10" total="881">\r\n\t<photo id="2636" owner="47058503995@N01" \r\n\t\tsecret="a123456" server="2" title="test_04"\r\n\t\tispublic="1" isfriend="0" isfamily="0">\r\n\t\t<stats views="941" comments="18" favorites="2"/>\r\n\t</photo>\r\n\t<photo id="2635" owner="47058503995@N01"\r\n\t\tsecret="b123456" server="2" title="test_03"\r\n\t\tispublic="0" isfriend="1" isfamily="1">\r\n\t\t<stats views="141" comments="1" favorites="2"/>\r\n\t</photo>\r\n</photos>', '<p>This method returns the standard photo list xml.</p>\r\n\r\n<p>In addition each photo element contains a <code>&lt;stats&gt;</code> element. This has attributes for the view, comment and favorite counts for the requested day.</p>\r\n\r\n<p>To map <code>&lt;photo&gt;</code> elements to urls, please read the <a href="misc.urls.html">url documentation</a>.</p>\r\n'),
+    ('flickr.stats.getTotalViews', 'Get the overall view counts for an account', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'Stats will be returned for this date. This should be in either be in YYYY-MM-DD or unix timestamp format.\r\n\r\nA day according to Flickr Stats starts at midnight GMT for all users, and timestamps will automatically be rounded down to the start of the day.\r\n\r\nIf no date is provided, all time view counts will be returned.'), '<stats>\r\n\t<total views="469" />\r\n\t<photos views="386" />\r\n\t<photostream views="72" />\r\n\t<sets views="11" />\r\n\t<collections views="0" />\r\n</stats>', None),
+)
@@ -0,0 +1,17 @@
+"""
+    Documentation of the flickr.tags methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.tags.getClusterPhotos', 'Returns the first 24 photos for a given tag cluster', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The tag that this cluster belongs to.', 'The top three tags for the cluster, separated by dashes (just like the url).'), None, None),
+    ('flickr.tags.getClusters', 'Gives you a list of tag clusters for the given tag.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The tag to fetch clusters for.'), '<clusters source="cows" total="2">\r\n\t<cluster total="3">\r\n\t\t<tag>farm</tag>\r\n\t\t<tag>animals</tag>\r\n\t\t<tag>cattle</tag>\r\n\t</cluster>\r\n\t<cluster total="3">\r\n\t\t<tag>green</tag>\r\n\t\t<tag>landscape</tag>\r\n\t\t<tag>countryside</tag>\r\n\t</cluster>\r\n</clusters>', None),
+    ('flickr.tags.getHotList', 'Returns a list of hot tags for the given period.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The period for which to fetch hot tags. Valid values are <code>day</code> and <code>week</code> (defaults to <code>day</code>).', 'The number of tags to return. Defaults to 20. Maximum allowed value is 200.'), '<hottags period="day" count="6">\r\n\t<tag score="20">northerncalifornia</tag>\r\n\t<tag score="18">top20</tag>\r\n\t<tag score="15">keychain</tag>\r\n\t<tag score="10">zb</tag>\r\n\t<tag score="9">selfportraittuesday</tag>\r\n\t<tag score="4">jan06</tag>\r\n</hottags>', None),
+    ('flickr.tags.getListPhoto', 'Get the tag list for a given photo.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The id of the photo to return tags for.'), '<photo id="2619">\r\n\t<tags>\r\n\t\t<tag id="156" author="12037949754@N01"\r\n\t\t\tauthorname="Bees" raw="tag 1">tag1</tag> \r\n\t\t<tag id="157" author="12037949754@N01"\r\n\t\t\tauthorname="Bees" raw="tag 2">tag2</tag> \r\n\t</tags>\r\n</photo>', '<p>For an explanation of the <code>tag</code> element, please read the <a href="/services/api/misc.tags.html">tags documentation</a>.</p>'),
+    ('flickr.tags.getListUser', 'Get the tag list for a given user (or the currently logged in user).', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the tag list for. If this argument is not specified, the currently logged in user (if any) is assumed.'), '<who id="12037949754@N01">\r\n\t<tags>\r\n\t\t<tag>gull</tag> \r\n\t\t<tag>tag1</tag> \r\n\t\t<tag>tag2</tag> \r\n\t\t<tag>tags</tag> \r\n\t\t<tag>test</tag> \r\n\t</tags>\r\n</who>', None),
+    ('flickr.tags.getListUserPopular', 'Get the popular tags for a given user (or the currently logged in user).', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the tag list for. If this argument is not specified, the currently logged in user (if any) is assumed.', 'Number of popular tags to return. defaults to 10 when this argument is not present.'), '<who id="12037949754@N01">\r\n\t<tags>\r\n\t\t<tag count="10">bar</tag> \r\n\t\t<tag count="11">foo</tag> \r\n\t\t<tag count="147">gull</tag> \r\n\t\t<tag count="3">tags</tag> \r\n\t\t<tag count="3">test</tag> \r\n\t</tags>\r\n</who>', None),
+    ('flickr.tags.getListUserRaw', 'Get the raw versions of a given tag (or all tags) for the currently logged-in user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The tag you want to retrieve all raw versions for.'), '<who id="12037949754@N01">\r\n    <tags>\r\n        <tag clean="foo">\r\n            <raw>foo</raw>\r\n            <raw>Foo</raw>\r\n            <raw>f:oo</raw>\r\n        </tag>\r\n    </tags>\r\n</who>', None),
+    ('flickr.tags.getMostFrequentlyUsed', 'Returns a list of most frequently used tags for a user.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<rsp stat="ok">\r\n<who id="30135021@N05">\r\n\t<tags>\r\n\t\t<tag count="1">blah</tag>\r\n\t\t<tag count="5">publicdomain</tag>\r\n\t</tags>\r\n</who>\r\n</rsp>', None),
+    ('flickr.tags.getRelated', "Returns a list of tags 'related' to the given tag, based on clustered usage analysis.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The tag to fetch related tags for.'), '<tags source="london">\r\n\t<tag>england</tag>\r\n\t<tag>thames</tag>\r\n\t<tag>tube</tag>\r\n\t<tag>bigben</tag>\r\n\t<tag>uk</tag>\r\n</tags>\r\n', None),
+)
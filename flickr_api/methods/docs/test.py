@@ -0,0 +1,11 @@
+"""
+    Documentation of the flickr.test methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.test.echo', "A testing method which echo's all parameters back in the response.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<method>echo</method>\r\n<foo>bar</foo>', None),
+    ('flickr.test.login', 'A testing method which checks if the caller is logged in then returns their username.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), '<user id="12037949754@N01">\r\n\t<username>Bees</username> \r\n</user>\r\n', None),
+    ('flickr.test.null', 'Null test', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.',), None, None),
+)
@@ -0,0 +1,14 @@
+"""
+    Documentation of the flickr.urls methods.
+
+    Generated by flickr_api.tools.write_methods.
+"""
+
+DOCS = (
+    ('flickr.urls.getGroup', "Returns the url to a group's page.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the group to fetch the url for.'), '<group nsid="48508120860@N01" url="http://www.flickr.com/groups/test1/" /> ', None),
+    ('flickr.urls.getUserPhotos', "Returns the url to a user's photos.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the url for. If omitted, the calling user is assumed.'), '<user nsid="12037949754@N01" url="http://www.flickr.com/photos/bees/" />', None),
+    ('flickr.urls.getUserProfile', "Returns the url to a user's profile.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', 'The NSID of the user to fetch the url for. If omitted, the calling user is assumed.'), '<user nsid="12037949754@N01" url="http://www.flickr.com/people/bees/" />', None),
+    ('flickr.urls.lookupGallery', 'Returns gallery info, by url.', ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "The gallery's URL."), '<gallery id="6065-72157617483228192" url="/photos/straup/galleries/72157617483228192" owner="35034348999@N01" \r\nprimary_photo_id="292882708" \r\ndate_create="1241028772" date_update="1270111667" \r\ncount_photos="17" count_videos="0" server="112" farm="1" secret="7f29861bc4">\r\n\t<title>Cat Pictures I\'ve Sent To Kevin Collins</title>\r\n\t<description />\r\n</gallery>', 'This is the same format returned by <a href="http://www.flickr.com/services/api/flickr.galleries.getInfo.html">flickr.galleries.getInfo</a>.'),
+    ('flickr.urls.lookupGroup', "Returns a group NSID, given the url to a group's page or photo pool.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "The url to the group's page or photo pool."), '<group id="34427469792@N01">\r\n\t<groupname>FlickrCentral</groupname> \r\n</group>', None),
+    ('flickr.urls.lookupUser', "Returns a user NSID, given the url to a user's photos or profile.", ('Your API application key. <a href="/services/api/misc.api_keys.html">See here</a> for more details.', "The url to the user's profile or photos page."), '<user id="12037949632@N01">\r\n\t<username>Stewart</username> \r\n</user>', None),
+)
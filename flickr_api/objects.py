@@ -24,8 +24,9 @@
 from . import method_call
 from .flickrerrors import FlickrError
 from .reflection import caller, static_caller, FlickrAutoDoc
-from six import text_type, iteritems, with_metaclass
-from six.moves import UserList, urllib, cStringIO, range
+from collections import UserList
+import io
+import urllib.request
 from . import auth
 import warnings
 from itertools import groupby
@@ -43,6 +44,14 @@ except ImportError:
             raise RuntimeError("Image module not found.")
 
 
+__all__ = [
+    'Activity', 'Blog', 'BlogService', 'Camera', 'Category', 'Collection',
+    'CommonInstitution', 'CommonInstitutionUrl', 'Contact', 'FlickrList',
+    'FlickrObject', 'Gallery', 'Group', 'Image', 'Info', 'License',
+    'Location', 'MachineTag', 'Panda', 'Person', 'Photo', 'PhotoGeoPerms',
+    'Photoset', 'Place', 'Reflection', 'SlicedWalker', 'Tag', 'UploadTicket',
+    'Walker', 'prefs', 'stats', 'test',
+]
 
 _SIZES_LABEL = {
     'sq': 'Square',
@@ -69,7 +78,7 @@ def dict_converter(keys, func):
     return convert
 
 
-class FlickrObject(with_metaclass(FlickrAutoDoc, object)):
+class FlickrObject(object, metaclass=FlickrAutoDoc):
     """
         Base Object for Flickr API Objects.
         Flickr Objects are dynamically created from the
@@ -151,7 +160,7 @@ class FlickrObject(with_metaclass(FlickrAutoDoc, object)):
                     pass
             if not val_found:
                 continue
-            if isinstance(value, text_type):
+            if isinstance(value, str):
                 value = value.encode("utf8")
             if isinstance(value, str):
                 value = "'%s'" % value
@@ -1234,7 +1243,7 @@ class Photo(FlickrObject):
         args["date"] = date
         return (
             args,
-            lambda r: dict([(k, int(v)) for k, v in iteritems(r["stats"])])
+            lambda r: dict([(k, int(v)) for k, v in r["stats"].items()])
         )
 
     @caller("flickr.tags.getListPhoto")
@@ -1258,7 +1267,7 @@ class Photo(FlickrObject):
         sizes = {k:v for k,v in self.getSizes().items() if v["media"] == self.media}
         max_size = None
         max_area = None
-        for sl, s in iteritems(sizes):
+        for sl, s in sizes.items():
             try:
                 area = int(s["height"]) * int(s["width"])
             except TypeError:
@@ -1379,7 +1388,7 @@ class Photo(FlickrObject):
         if size_label is None:
             size_label = self._getLargestSizeLabel()
         r = urllib.request.urlopen(self.getPhotoFile(size_label))
-        b = cStringIO(r.read())
+        b = io.BytesIO(r.read())
         Image.open(b).show()
 
     @static_caller("flickr.photos.getUntagged")
@@ -1633,7 +1642,7 @@ class Photoset(FlickrObject):
         args["date"] = date
         return (
             args,
-            lambda r: dict([(k, int(v)) for k, v in iteritems(r["stats"])])
+            lambda r: dict([(k, int(v)) for k, v in r["stats"].items()])
         )
 
     @static_caller("flickr.photosets.orderSets")
@@ -1663,7 +1672,7 @@ class Photoset(FlickrObject):
 
         photo_ids = args["photo_ids"]
         if isinstance(photo_ids, list):
-            args["photo_ids"] = u", ".join(photo_ids)
+            args["photo_ids"] = ", ".join(photo_ids)
 
         return args, _none
 
@@ -1676,7 +1685,7 @@ class Photoset(FlickrObject):
 
         photo_ids = args["photo_ids"]
         if isinstance(photo_ids, list):
-            args["photo_ids"] = u",".join(photo_ids)
+            args["photo_ids"] = ",".join(photo_ids)
 
         return args, _none
 
@@ -10,8 +10,8 @@
 """
 
 import re
-from functools import wraps
-from six import iteritems
+import types
+from functools import update_wrapper, wraps
 from . import method_call
 from . import auth
 from .flickrerrors import FlickrError
@@ -20,10 +20,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 try:
-    from .methods import __methods__
+    from .methods import get_method, load_methods
 
     def make_docstring(method, ignore_arguments=[], show_errors=True):
-        info = __methods__[method]
+        info = get_method(method)
         context = {'method': method}
 
         doc = """
@@ -38,9 +38,9 @@ try:
     Arguments:
 %(arguments)s
     """
-        context["description"] = format_block(info["description"], 80, " " * 8)
-        needs_login = info["needslogin"]
-        required = info["requiredperms"]
+        context["description"] = format_block(info.description, 80, " " * 8)
+        needs_login = info.needslogin
+        required = info.requiredperms
         if needs_login:
             if required == 'none':
                 authentication = "This method requires authentication"
@@ -61,15 +61,14 @@ try:
         arguments = []
         argument = """        %(argument_name)s (%(argument_required)s):
 %(argument_descr)s"""
-        for a in info["arguments"]:
-            aname = a["name"]
+        for aname, optional, text in zip(info.arg_names, info.arg_optional,
+                                         info.arg_texts):
             if aname in ignore_arguments:
                 continue
             argument_context = {
                 'argument_name': aname,
-                'argument_required': 'optional' if a["optional"] \
-                                                else 'required',
-                'argument_descr': format_block(a["text"], 80, " " * 12)
+                'argument_required': 'optional' if optional else 'required',
+                'argument_descr': format_block(text, 80, " " * 12)
             }
             arguments.append(argument % argument_context)
         context["arguments"] = "\n".join(arguments)
@@ -82,17 +81,18 @@ try:
             errors = []
             error = """        code %(code)s:
     %(message)s"""
-            for e in info["errors"]:
+            for e in info.errors:
                 error_context = {
-                    'code': e["code"],
-                    'message': format_block(e["message"], 80, " " * 12)
+                    'code': e.code,
+                    'message': format_block(e.message, 80, " " * 12)
                 }
                 errors.append(error % error_context)
             context["errors"] = "\n".join(errors)
         return doc % context
 
 except ImportError:
-    __methods__ = {}
+    def load_methods():
+        return {}
 
     def make_docstring(method, ignore_arguments=[], show_errors=True):
         return None
@@ -117,20 +117,68 @@ def bindings_to(flickr_method):
     try:
         return __bindings__[flickr_method]
     except KeyError:
-        if flickr_method in __methods__:
+        if flickr_method in load_methods():
             return []
         else:
             raise FlickrError("Unknown Flickr API method: %s" % flickr_method)
 
 
+class _CallerDoc(object):
+    """
+        Descriptor returning the docstring of a CallerMethod object, or
+        the class docstring when accessed from the class.
+    """
+    def __init__(self, doc):
+        self.doc = doc
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self.doc
+        if obj._doc_args is not None:
+            flickr_method, ignore_arguments = obj._doc_args
+            obj._doc = make_docstring(flickr_method, ignore_arguments,
+                                      show_errors=False)
+            obj._doc_args = None
+        return obj._doc
+
+
+class CallerMethod(object):
+    """
+        Method of the object API bound to a Flickr method (see `caller`
+        and `static_caller`).
+
+        Its docstring is built from the description of the Flickr method
+        on first access, so that defining the classes of the object API
+        does not load the descriptions of all the methods.
+    """
+    def __init__(self, func):
+        update_wrapper(self, func,
+                       assigned=("__module__", "__name__", "__qualname__"))
+        self._func = func
+        self._doc = func.__doc__
+        self._doc_args = None
+
+    def __call__(self, *args, **kwargs):
+        return self._func(*args, **kwargs)
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        return types.MethodType(self, obj)
+
+
+CallerMethod.__doc__ = _CallerDoc(CallerMethod.__doc__)
+
+
 class FlickrAutoDoc(type):
     """
         Meta class that adds documentation to methods that bind
         to a flickr method, which are called 'caller methods'.
 
         It basically adds two attributes to each caller methods:
-        * __doc__: the docstring is set from the documentation
-            returned by flickr.reflection.getMethodInfo. If the method
+        * __doc__: the docstring is built, on first access, from the
+            documentation returned by flickr.reflection.getMethodInfo
+            (see CallerMethod). If the method
             is not static, the entry related to the object itself is
             removed from the docstring, using the __self_name__ class
             attribute.
@@ -144,21 +192,20 @@ class FlickrAutoDoc(type):
     """
     def __new__(mcl, classname, bases, classDict):
         self_name = classDict.get("__self_name__", None)
-        for k, v in iteritems(classDict):
+        for k, v in classDict.items():
             ignore_arguments = ["api_key"]
             if hasattr(v, 'flickr_method'):
+                # the docstrings are only built on first access, see
+                # CallerMethod
                 if v.isstatic:
-                    v.inner_func.__doc__ = make_docstring(v.flickr_method,
-                                                          ignore_arguments,
-                                                          show_errors=False)
+                    v.inner_func._doc_args = (v.flickr_method,
+                                              ignore_arguments)
                 else:
                     ignore_arguments.append(self_name)
                     v.__self_name__ = self_name  # this is used by the
                     # decorator caller to know the argument name to use to refer
                     # to the current object.
-                    v.__doc__ = make_docstring(v.flickr_method,
-                                               ignore_arguments,
-                                               show_errors=False)
+                    v._doc_args = (v.flickr_method, ignore_arguments)
 
                 class_method_name = classname + "." + k
                 method_bindings = __bindings__.setdefault(class_method_name, [])
@@ -227,7 +274,7 @@ def _get_token(self, **kwargs):
             except AttributeError:
                 pass
     if not token:
-        token = auth.AUTH_HANDLER
+        token = auth.get_auth_handler()
     return token, kwargs
 
 
@@ -260,7 +307,7 @@ def caller(flickr_method, static=False):
                 return format_result(r)
         call.flickr_method = flickr_method
         call.isstatic = False
-        return call
+        return CallerMethod(call)
     return decorator
 
 
@@ -298,5 +345,5 @@ def static_caller(flickr_method, static=False):
                 return format_result(r)
         static_call.flickr_method = flickr_method
         static_call.isstatic = True
-        return StaticCaller(static_call)
+        return StaticCaller(CallerMethod(static_call))
     return decorator
@@ -1,4 +1,6 @@
 from .method_call import call_api
+from .methods import Perms, PERMS_NAMES
+import collections
 import sys
 import os
 
@@ -30,28 +32,160 @@ def methods_info():
     return methods
 
 
-def write_reflection(path, template, methods=None):
+# Errors with a code above this one are the generic errors shared by the
+# methods (invalid signature, invalid API key, ...).
+COMMON_ERROR_CODE = 96
+
+
+def split_common_errors(methods):
+    """
+        Moves the generic errors out of the description of the methods.
+        Each method only keeps its specific errors and the list of the
+        codes of the generic errors it can return ('common_errors').
+
+        For each generic code, the most frequent (message, text) is the
+        shared one. A method documenting the code with a different
+        message or text keeps it among its specific errors.
+
+        Returns the list of the generic errors and the new descriptions.
+    """
+    counts = collections.Counter(
+        (int(e["code"]), e["message"], e["text"])
+        for method in methods.values() for e in method["errors"]
+        if int(e["code"]) >= COMMON_ERROR_CODE)
+    common = {}
+    for (code, message, text), _ in counts.most_common():
+        common.setdefault(code, {"code": code, "message": message,
+                                 "text": text})
+    new_methods = {}
+    for name, method in methods.items():
+        method = dict(method)
+        errors = []
+        codes = []
+        for e in method["errors"]:
+            code = int(e["code"])
+            shared = common.get(code)
+            if (shared is not None and shared["message"] == e["message"]
+                    and shared["text"] == e["text"]):
+                codes.append(code)
+            else:
+                errors.append(e)
+        method["errors"] = errors
+        method["common_errors"] = codes
+        new_methods[name] = method
+    return [common[c] for c in sorted(common)], new_methods
+
+
+def _method_flags(method):
+    """
+        Packs the required permission and the needslogin / needssigning
+        flags of a method, see `flickr_api.methods.Perms`.
+    """
+    flags = PERMS_NAMES.index(method["requiredperms"])
+    if method["needslogin"]:
+        flags |= Perms.NEEDS_LOGIN
+    if method["needssigning"]:
+        flags |= Perms.NEEDS_SIGNING
+    return int(flags)
+
+
+def _method_record(method, common_positions):
+    """
+        Converts the description of a method (with its generic errors
+        moved out, see `split_common_errors`) to the tuple stored in the
+        modules of `flickr_api.methods.data`. The generic errors are
+        stored as a bitmask: bit i is set if the method can return the
+        i-th generic error ('common_positions' maps the codes to i).
+    """
+    common_mask = 0
+    for code in method["common_errors"]:
+        common_mask |= 1 << common_positions[code]
+    arguments = method["arguments"]
+    return (
+        method["name"],
+        _method_flags(method),
+        tuple(a["name"] for a in arguments),
+        tuple(bool(int(a["optional"])) for a in arguments),
+        tuple((int(e["code"]), e["message"], e["text"])
+              for e in method["errors"]),
+        common_mask,
+    )
+
+
+def _docs_record(method):
+    """
+        Converts the documentation of a method to the tuple stored in the
+        modules of `flickr_api.methods.docs`.
+    """
+    return (
+        method["name"],
+        method["description"],
+        tuple(a["text"] for a in method["arguments"]),
+        method.get("response"),
+        method.get("explanation"),
+    )
+
+
+def _write_records(path, doc, name, records):
+    with open(path, "w") as f:
+        f.write('"""\n    %s\n\n'
+                '    Generated by flickr_api.tools.write_methods.\n'
+                '"""\n\n%s = (\n' % (doc, name))
+        for r in records:
+            f.write("    %r,\n" % (r,))
+        f.write(")\n")
+
+
+def write_methods(directory, methods=None):
+    """
+        Writes the description of the methods to the modules of the
+        `flickr_api.methods.data` and `flickr_api.methods.docs` packages
+        ('directory' is the directory of `flickr_api.methods`): one module
+        per namespace (second component of the method names) containing a
+        tuple of constants, and the generic errors in 'data/__init__.py'.
+    """
     if methods is None:
         methods = methods_info()
-    with open(template, "r") as t:
-        templ = t.read()
-
-    prefix = ""
-    new_templ = ""
-    tab = "    "
-    templ = templ % str(methods)
-    for c in templ:
-        if c == '{':
-            new_templ += '{\n' + prefix
-            prefix += tab
-        elif c == '}':
-            new_templ += '\n' + prefix + '}\n' + prefix
-            prefix = prefix[:-len(tab)]
-        else:
-            new_templ += c
+    common_errors, methods = split_common_errors(methods)
+    namespaces = {}
+    for name in sorted(methods):
+        namespaces.setdefault(name.split(".")[1], []).append(methods[name])
+    common_positions = {e["code"]: i for i, e in enumerate(common_errors)}
+    data_dir = os.path.join(directory, "data")
+    docs_dir = os.path.join(directory, "docs")
+    _write_records(os.path.join(data_dir, "__init__.py"),
+                   "Generic errors of the Flickr API methods.",
+                   "COMMON_ERRORS",
+                   [(e["code"], e["message"], e["text"])
+                    for e in common_errors])
+    with open(os.path.join(docs_dir, "__init__.py"), "w") as f:
+        f.write('"""\n    Documentation of the Flickr API methods.\n\n'
+                '    Generated by flickr_api.tools.write_methods.\n"""\n')
+    for namespace, ns_methods in namespaces.items():
+        _write_records(os.path.join(data_dir, "%s.py" % namespace),
+                       "Description of the flickr.%s methods." % namespace,
+                       "METHODS",
+                       [_method_record(m, common_positions)
+                        for m in ns_methods])
+        _write_records(os.path.join(docs_dir, "%s.py" % namespace),
+                       "Documentation of the flickr.%s methods." % namespace,
+                       "DOCS", [_docs_record(m) for m in ns_methods])
 
+
+def write_frozen_methods(path, methods=None):
+    """
+        Writes the sorted tuple of the method names used to build the
+        `flickr_api.api` proxies.
+    """
+    if methods is None:
+        methods = methods_info()
     with open(path, "w") as f:
-        f.write(new_templ)
+        f.write('"""\n    Names of the Flickr API methods.\n\n'
+                '    Generated by flickr_api.tools.write_frozen_methods.\n'
+                '"""\n\nMETHODS = (\n')
+        for m in sorted(methods):
+            f.write('    "%s",\n' % m)
+        f.write(")\n")
 
 
 def write_doc(output_path, exclude=["flickr_keys", "methods"]):
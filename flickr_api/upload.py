@@ -21,7 +21,6 @@ from .method_call import get_timeout
 from . import auth
 import os
 from xml.etree import ElementTree as ET
-from six import text_type, binary_type, iteritems
 import requests
 
 UPLOAD_URL = "https://api.flickr.com/services/upload/"
@@ -30,14 +29,13 @@ REPLACE_URL = "https://api.flickr.com/services/replace/"
 
 def format_dict(d):
     d_ = {}
-    for k, v in iteritems(d):
+    for k, v in d.items():
         if isinstance(v, bool):
             v = int(v)
-        elif isinstance(v, text_type):
-            v = v.encode("utf8")
-        if isinstance(k, text_type):
+        if not isinstance(v, bytes):
+            v = str(v).encode("utf8")
+        if isinstance(k, str):
             k = k.encode("utf8")
-        v = binary_type(v)
         d_[k] = v
     return d_
 
@@ -110,7 +108,8 @@ def upload(**args):
     else:
         photo_file_data = None
 
-    r = post(UPLOAD_URL, auth.AUTH_HANDLER, args, photo_file, photo_file_data)
+    r = post(UPLOAD_URL, auth.get_auth_handler(), args, photo_file,
+             photo_file_data)
 
     t = r[0]
     if t.tag == 'photoid':
@@ -166,7 +165,8 @@ def replace(**args):
     else:
         photo_file_data = None
 
-    r = post(REPLACE_URL, auth.AUTH_HANDLER, args, photo_file, photo_file_data)
+    r = post(REPLACE_URL, auth.get_auth_handler(), args, photo_file,
+             photo_file_data)
 
     t = r[0]
 
@@ -4,7 +4,15 @@ module utils
 some utility functions
 """
 
-from six.moves import urllib
+import json
+import urllib.request
+
+try:
+    # orjson decodes the responses several times faster than the json
+    # module when it is installed.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 
 def urlopen_and_read(url):
@@ -1,4 +1,5 @@
-from setuptools import setup
+from setuptools import setup, Extension
+import os
 import re
 
 VERSION_FILE = "flickr_api/_version.py"
@@ -8,6 +9,27 @@ try:
 except:
     raise RuntimeError("Could not read version file.")
 
+# Optional compiled version of method_call.clean_content. It is built from
+# the .pyx file when Cython is available, otherwise from the generated .c
+# file if it is present. A failed build is not an error: the pure Python
+# implementation is used instead.
+CLEAN_CONTENT_PYX = "flickr_api/_clean_content.pyx"
+CLEAN_CONTENT_C = "flickr_api/_clean_content.c"
+
+ext_modules = []
+try:
+    from Cython.Build import cythonize
+    if os.path.exists(CLEAN_CONTENT_PYX):
+        ext_modules = cythonize(
+            [Extension("flickr_api._clean_content", [CLEAN_CONTENT_PYX],
+                       optional=True)],
+            language_level=3)
+except (ImportError, ValueError):
+    ext_modules = []
+if not ext_modules and os.path.exists(CLEAN_CONTENT_C):
+    ext_modules = [Extension("flickr_api._clean_content", [CLEAN_CONTENT_C],
+                             optional=True)]
+
 setup(
     name="flickr_api",
     version=version_str,
@@ -15,23 +37,29 @@ setup(
     author="Alexis Mignon",
     author_email="alexis.mignon@gmail.com",
     url="https://github.com/alexis-mignon/python-flickr-api",
-    packages=["flickr_api"],
+    packages=["flickr_api", "flickr_api.methods", "flickr_api.methods.data",
+              "flickr_api.methods.docs"],
+    ext_modules=ext_modules,
+    python_requires=">=3.7",
     install_requires=[
-        "oauth2",
-        "six",
         "requests"
     ],
+    extras_require={
+        "fast": ["orjson"],
+        "stream": ["ijson"],
+    },
     license="BSD License",
     classifiers=[
         'Intended Audience :: Developers',
 
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ]
 )
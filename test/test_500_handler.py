@@ -30,7 +30,7 @@ class Test5XXHandler(unittest.TestCase):
         resp = Response()
         resp.status_code = 502
         resp.raw = BytesIO("Bad Gateway".encode("utf-8"))
-        module.requests.post = MagicMock(return_value=resp)
+        module._SESSION.post = MagicMock(return_value=resp)
 
         with self.assertRaises(FlickrServerError) as context:
             f.Person.findByUserName("tomquirkphoto")
@@ -38,3 +38,15 @@ class Test5XXHandler(unittest.TestCase):
         print(context.exception)
         self.assertEqual("HTTP Server Error 502: Bad Gateway",
                           str(context.exception))
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_post_only_retried_when_not_processed(self):
+        retry = method_call._make_session().get_adapter(
+            method_call.REST_URL).max_retries
+        self.assertFalse(retry.is_retry("POST", 500))
+        self.assertFalse(retry.is_retry("POST", 502))
+        self.assertTrue(retry.is_retry("POST", 503))
+        self.assertTrue(retry.is_retry("POST", 429))
+        self.assertTrue(retry.is_retry("GET", 502))
+        self.assertEqual(retry.read, 0)
@@ -0,0 +1,34 @@
+import json
+import os
+import tempfile
+import unittest
+
+from flickr_api.auth import AuthHandler
+
+
+class TestAuthFile(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_json_round_trip(self):
+        handler = AuthHandler(key="key", secret="secret",
+                              access_token_key="token",
+                              access_token_secret="token_secret")
+        handler.tofile(self.path, include_api_keys=True)
+        with open(self.path) as f:
+            self.assertEqual(2, json.load(f)["version"])
+        loaded = AuthHandler.fromfile(self.path)
+        self.assertEqual(("key", "secret"), (loaded.key, loaded.secret))
+        self.assertEqual(("token", "token_secret"),
+                         tuple(loaded.access_token[:2]))
+
+    def test_legacy_format(self):
+        with open(self.path, "w") as f:
+            f.write("key\nsecret\ntoken\ntoken_secret")
+        loaded = AuthHandler.fromfile(self.path)
+        self.assertEqual("key", loaded.key)
+        self.assertEqual("token", loaded.access_token.key)
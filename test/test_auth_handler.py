@@ -0,0 +1,46 @@
+import copy
+import pickle
+import threading
+import unittest
+
+from flickr_api import auth
+
+
+class TestAuthHandlerContext(unittest.TestCase):
+    def setUp(self):
+        self.previous = auth.get_auth_handler()
+
+    def tearDown(self):
+        auth.set_auth_handler(self.previous)
+
+    def test_global_handler_is_shared_by_threads(self):
+        auth.set_auth_handler(object())
+        handler = auth.AUTH_HANDLER
+        seen = []
+        t = threading.Thread(target=lambda: seen.append(auth.AUTH_HANDLER))
+        t.start()
+        t.join()
+        self.assertEqual([handler], seen)
+
+    def test_use_auth_overrides_in_context(self):
+        default, scoped = object(), object()
+        auth.set_auth_handler(default)
+        with auth.use_auth(scoped):
+            self.assertIs(scoped, auth.get_auth_handler())
+            self.assertIs(scoped, auth.AUTH_HANDLER)
+        self.assertIs(default, auth.get_auth_handler())
+
+
+class TestAuthHandlerPickle(unittest.TestCase):
+    def test_pickle_and_copy(self):
+        handler = auth.AuthHandler(key="key", secret="secret",
+                                   access_token_key="token",
+                                   access_token_secret="token_secret")
+        params = {"oauth_timestamp": "1", "oauth_nonce": "n", "a": "b"}
+        expected = handler.complete_parameters("https://example.com/", params)
+        for other in (pickle.loads(pickle.dumps(handler)),
+                      copy.deepcopy(handler)):
+            self.assertEqual(other.access_token, handler.access_token)
+            self.assertEqual(
+                other.complete_parameters("https://example.com/", params),
+                expected)
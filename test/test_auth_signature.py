@@ -0,0 +1,76 @@
+import os
+import unittest
+from unittest.mock import MagicMock
+
+from flickr_api import _oauth_lite, method_call
+from flickr_api.auth import AuthHandler
+
+
+class TestAuthSignature(unittest.TestCase):
+    def test_complete_parameters_signature(self):
+        auth_handler = AuthHandler(
+            key="key",
+            secret="secret",
+            access_token_key="token",
+            access_token_secret="token_secret")
+        params = auth_handler.complete_parameters(
+            "https://api.flickr.com/services/rest/", {
+                "method": "flickr.photos.search",
+                "text": "a b~c/d",
+                "per_page": 10,
+                "oauth_timestamp": "1300000000",
+                "oauth_nonce": "12345678",
+            })
+        self.assertEqual("key", params["oauth_consumer_key"])
+        self.assertEqual("token", params["oauth_token"])
+        self.assertEqual("HMAC-SHA1", params["oauth_signature_method"])
+        self.assertEqual("+6lbjWLN6hQ3Cec8lltm6QAzHeA=",
+                         params["oauth_signature"])
+
+
+class TestNonce(unittest.TestCase):
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_fork_draws_new_nonces(self):
+        _oauth_lite.make_nonce()  # fill the pool before forking
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, _oauth_lite.make_nonce().encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as f:
+            child_nonce = f.read().decode()
+        os.waitpid(pid, 0)
+        self.assertEqual(len(child_nonce), 32)
+        self.assertNotEqual(child_nonce, _oauth_lite.make_nonce())
+
+
+class TestApiSig(unittest.TestCase):
+    def test_md5_api_sig(self):
+        session = MagicMock()
+        previous = method_call.get_session()
+        method_call.set_session(session)
+        try:
+            method_call.call_api(api_key="key", api_secret="secret",
+                                 needssigning=True, raw=True,
+                                 method="flickr.test.echo", per_page=10)
+        finally:
+            method_call.set_session(previous)
+        data = session.post.call_args[1]["data"]
+        # md5("secretapi_keykeymethodflickr.test.echoper_page10")
+        self.assertEqual("f52929a4b45741aeec8cb9c6da51ead2", data["api_sig"])
+
+    def test_bound_call_matches_call_api(self):
+        session = MagicMock()
+        previous = method_call.get_session()
+        method_call.set_session(session)
+        try:
+            search = method_call.bind("flickr.test.echo", api_key="key",
+                                      api_secret="secret", needssigning=True,
+                                      raw=True)
+            search(per_page=10)
+        finally:
+            method_call.set_session(previous)
+        data = session.post.call_args[1]["data"]
+        self.assertEqual("f52929a4b45741aeec8cb9c6da51ead2", data["api_sig"])
@@ -0,0 +1,39 @@
+import unittest
+from unittest.mock import patch
+
+from flickr_api import api
+from flickr_api.api import flickr
+
+
+class TestBatch(unittest.TestCase):
+    def test_batched_calls_return_futures(self):
+        def fake_call_api(**kwargs):
+            return kwargs["method"] + ":" + kwargs["photo_id"]
+
+        with patch.object(api, "call_api", side_effect=fake_call_api) as m:
+            with flickr.batch(max_size=2) as b:
+                futures = [flickr.photos.getInfo(photo_id=str(i))
+                           for i in range(3)]
+                self.assertIsInstance(b, api.BatchContext)
+            results = [f.result() for f in futures]
+
+        self.assertEqual(3, m.call_count)
+        self.assertEqual(["flickr.photos.getInfo:%i" % i for i in range(3)],
+                         results)
+
+    def test_max_workers(self):
+        batch = flickr.batch(max_workers=2)
+        self.assertEqual(2, batch.max_workers)
+        with batch:
+            self.assertEqual(2, batch._executor._max_workers)
+
+    def test_errors_are_set_on_futures(self):
+        with patch.object(api, "call_api", side_effect=ValueError("boom")):
+            with flickr.batch():
+                future = flickr.test.echo()
+        self.assertRaises(ValueError, future.result)
+
+    def test_calls_outside_batch_are_direct(self):
+        with patch.object(flickr.test.echo, "_call", return_value=b"ok") as m:
+            self.assertEqual(b"ok", flickr.test.echo(name="x"))
+        m.assert_called_once_with(auth_handler=api.auth.AUTH_HANDLER, name="x")
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import flickr_api as f
 from flickr_api import method_call
@@ -31,4 +31,63 @@ class TestBytesResponse(unittest.TestCase):
         resp.raw = BytesIO(b'[0,1]')
         module.requests.post = MagicMock(return_value=resp)
         payload = module.requests.post.return_value.json()
-        self.assertEqual(type(payload), list)
\ No newline at end of file
+        self.assertEqual(type(payload), list)
+
+
+class TestStreamApi(unittest.TestCase):
+    PAYLOAD = (
+        b'{"photos": {"page": 1, "photo": [{"id": "1", "title": '
+        b'{"_content": "a"}}, {"id": "2", "title": {"_content": "b"}}]},'
+        b' "stat": "ok"}')
+
+    def _stream(self, path):
+        resp = Response()
+        resp.status_code = 200
+        resp.raw = BytesIO(self.PAYLOAD)
+        session = MagicMock()
+        session.post.return_value = resp
+        previous = method_call.get_session()
+        method_call.set_session(session)
+        try:
+            return list(method_call.stream_api(
+                "flickr.photos.search", path,
+                api_key="key", api_secret="secret", text="cat"))
+        finally:
+            method_call.set_session(previous)
+
+    def _check_paths(self):
+        photos = [{"id": "1", "title": "a"}, {"id": "2", "title": "b"}]
+        self.assertEqual(photos, self._stream("photos.photo.item"))
+        self.assertEqual([photos], self._stream("photos.photo"))
+        self.assertEqual([1], self._stream("photos.page"))
+        self.assertEqual(["1", "2"], self._stream("photos.photo.item.id"))
+        self.assertEqual([], self._stream("photos.missing"))
+
+    @unittest.skipIf(method_call.ijson is None, "requires ijson")
+    def test_stream_items(self):
+        self._check_paths()
+
+    def test_stream_items_without_ijson(self):
+        with patch.object(method_call, "ijson", None):
+            self._check_paths()
+
+    def test_stream_closes_response(self):
+        resp = Response()
+        resp.status_code = 200
+        resp.raw = BytesIO(
+            b'{"photos": {"page": 1, "photo": [{"id": "1"}, {"id": "2"}]},'
+            b' "stat": "ok"}')
+        resp.close = MagicMock()
+        session = MagicMock()
+        session.post.return_value = resp
+        previous = method_call.get_session()
+        method_call.set_session(session)
+        try:
+            photos = method_call.stream_api(
+                "flickr.photos.search", "photos.photo.item",
+                api_key="key", api_secret="secret", text="cat")
+            self.assertEqual({"id": "1"}, next(photos))
+            photos.close()
+        finally:
+            method_call.set_session(previous)
+        resp.close.assert_called_once_with()
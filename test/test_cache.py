@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import MagicMock
+
+from flickr_api import method_call
+from flickr_api.cache import SimpleCache
+
+
+class TestSimpleCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = SimpleCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(1, cache.get("a"))
+        cache.set("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+
+    def test_expired_entries_are_dropped(self):
+        cache = SimpleCache()
+        cache.set("a", 1, timeout=-1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(0, len(cache))
+
+
+class TestCallApiCache(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.previous = method_call.get_session()
+        method_call.set_session(self.session)
+        method_call.enable_cache()
+
+    def tearDown(self):
+        method_call.disable_cache()
+        method_call.set_session(self.previous)
+
+    def test_single_request_per_cache_miss(self):
+        for _ in range(3):
+            method_call.call_api(api_key="key", api_secret="secret",
+                                 raw=True, method="flickr.test.echo")
+        self.assertEqual(1, self.session.post.call_count)
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+import unittest
+
+import flickr_api
+from flickr_api import objects
+
+
+class TestExports(unittest.TestCase):
+    def test_objects_all_matches_package(self):
+        self.assertEqual(sorted(objects.__all__),
+                         sorted(flickr_api._OBJECTS))
+        for name in objects.__all__:
+            self.assertIs(getattr(objects, name), getattr(flickr_api, name))
+
+    def test_upload_after_replace(self):
+        # run in a fresh interpreter, other tests may already have bound
+        # the names; importing the submodule must not shadow the function
+        code = ("import flickr_api\n"
+                "flickr_api.replace\n"
+                "assert callable(flickr_api.upload)\n"
+                "assert flickr_api.upload is flickr_api.Upload\n")
+        subprocess.check_call([sys.executable, "-c", code])
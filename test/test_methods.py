@@ -0,0 +1,153 @@
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from flickr_api import methods
+
+
+class TestMethods(unittest.TestCase):
+    def test_get_method(self):
+        info = methods.get_method("flickr.photos.getInfo")
+        self.assertEqual(info.name, "flickr.photos.getInfo")
+        self.assertEqual(info["name"], info.name)
+        self.assertFalse(info.needslogin)
+        self.assertEqual(info["requiredperms"], "none")
+        self.assertIs(methods.__methods__["flickr.photos.getInfo"], info)
+
+    def test_flags(self):
+        info = methods.get_method("flickr.photos.notes.delete")
+        self.assertEqual(info.flags, methods.Perms.WRITE
+                         | methods.Perms.NEEDS_LOGIN
+                         | methods.Perms.NEEDS_SIGNING)
+        self.assertEqual(info.requiredperms, "write")
+        self.assertTrue(info.needslogin)
+        self.assertTrue(info.needssigning)
+
+    def test_get_description(self):
+        self.assertEqual(
+            methods.get_description("flickr.photos.notes.delete"),
+            "Delete a note from a photo.")
+        self.assertEqual(
+            methods.get_description("flickr.photos.notes.delete", "note_id"),
+            "The id of the note to delete")
+        with self.assertRaises(KeyError):
+            methods.get_description("flickr.photos.notes.delete", "foo")
+
+    def test_example_response(self):
+        response = methods.example_response("flickr.test.echo")
+        self.assertTrue(response.startswith("<method>echo</method>"))
+        self.assertIsNone(methods.example_response("flickr.test.null"))
+
+    def test_identical_arguments_are_shared(self):
+        first = methods.get_method("flickr.photos.getInfo").arguments[0]
+        second = methods.get_method("flickr.test.echo").arguments[0]
+        self.assertEqual(first.name, "api_key")
+        self.assertIs(first, second)
+
+    def test_split_common_errors_keeps_variants(self):
+        from flickr_api.tools import split_common_errors
+        generic = {"code": 100, "message": "Invalid API Key", "text": "t"}
+        variant = {"code": "100", "message": "Invalid key", "text": "t"}
+        raw = {
+            "a": {"errors": [generic]},
+            "b": {"errors": [dict(generic)]},
+            "c": {"errors": [variant]},
+        }
+        common, split = split_common_errors(raw)
+        self.assertEqual(common, [generic])
+        self.assertEqual(split["a"]["common_errors"], [100])
+        self.assertEqual(split["c"]["common_errors"], [])
+        self.assertEqual(split["c"]["errors"], [variant])
+
+    def test_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            methods.__methods__["flickr.test.echo"] = None
+        info = methods.get_method("flickr.photos.notes.delete")
+        with self.assertRaises(TypeError):
+            info.errors_by_code[1]["message"] = ""
+
+    def test_missing_arguments(self):
+        info = methods.get_method("flickr.photos.notes.delete")
+        self.assertEqual(info.arg_names, ("api_key", "note_id"))
+        self.assertEqual(info.missing_arguments({"api_key"}), ["note_id"])
+        self.assertEqual(
+            info.missing_arguments({"api_key": 1, "note_id": 2}), [])
+        self.assertEqual(info.arguments[1].name, "note_id")
+        self.assertEqual(info["arguments"][1]["name"], "note_id")
+
+    def test_methods_in(self):
+        names = methods.methods_in("flickr.photos.notes")
+        self.assertEqual(names, ("flickr.photos.notes.add",
+                                 "flickr.photos.notes.delete",
+                                 "flickr.photos.notes.edit"))
+        self.assertIn("flickr.photos.notes.add",
+                      methods.methods_in("flickr.photos"))
+        self.assertEqual(len(methods.methods_in("flickr")),
+                         len(methods.__methods__))
+        self.assertEqual(methods.methods_in("flickr.nothing"), ())
+
+    def test_proxy_method_info(self):
+        from flickr_api.api import flickr
+        info = flickr.photos.getInfo.method_info
+        self.assertIs(info, methods.get_method("flickr.photos.getInfo"))
+        self.assertIs(flickr.photos.getInfo.method_info, info)
+        self.assertIsNone(flickr.photos.method_info)
+
+    def test_make_function(self):
+        from flickr_api import api
+        func = api.make_function("flickr.photos.getInfo")
+        with patch.object(api.flickr.photos.getInfo, "_call") as m:
+            func(photo_id="1", extras="tags")
+        m.assert_called_once_with(auth_handler=api.auth.AUTH_HANDLER,
+                                  photo_id="1", extras="tags")
+        with self.assertRaises(TypeError):
+            func(secret="x")
+
+    def test_make_function_all_methods(self):
+        from flickr_api import api
+        for name in methods.method_names():
+            func = api.make_function(name)
+            self.assertTrue(callable(func), name)
+        func = api.make_function("flickr.panda.getList")
+        with patch.object(api.flickr.panda.getList, "_call") as m:
+            func()
+        m.assert_called_once_with(auth_handler=api.auth.AUTH_HANDLER)
+
+    def test_get_error(self):
+        error = methods.get_error("flickr.photos.notes.delete", "1")
+        self.assertEqual(error["message"], "Note not found")
+        error = methods.get_error("flickr.photos.notes.delete", 100)
+        self.assertEqual(error["message"], "Invalid API Key")
+        self.assertIsNone(methods.get_error("flickr.photos.notes.delete", 3))
+
+    def test_common_errors_are_shared(self):
+        first = methods.get_error("flickr.photos.notes.delete", 100)
+        second = methods.get_error("flickr.photos.getInfo", 100)
+        self.assertIs(first, second)
+        self.assertIn(first, methods.common_errors())
+
+    def test_identical_errors_are_shared(self):
+        first = methods.get_error("flickr.photos.getExif", 1)
+        second = methods.get_error("flickr.photos.comments.getList", 1)
+        self.assertIs(first, second)
+
+    def test_object_docstrings_are_lazy(self):
+        # run in a fresh interpreter: defining the classes of the object
+        # API must not load the descriptions of the methods
+        code = (
+            "import sys\n"
+            "from flickr_api import methods, objects\n"
+            "loaded = [m for m in sys.modules\n"
+            "          if m.startswith(('flickr_api.methods.data.',\n"
+            "                           'flickr_api.methods.docs.'))]\n"
+            "assert not loaded, loaded\n"
+            "assert 'flickr.photos.getInfo' in objects.Photo.getInfo.__doc__\n"
+            "assert 'photo_id' not in objects.Photo.getInfo.__doc__\n"
+            "doc = objects.Person.findByEmail.__doc__\n"
+            "assert 'flickr.people.findByEmail' in doc\n")
+        subprocess.check_call([sys.executable, "-c", code])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from flickr_api import auth
+from flickr_api.auth import AuthHandler
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        auth.enable_token_cache(
+            True, path=os.path.join(self.tmpdir, "flickr_oauth"))
+
+    def tearDown(self):
+        auth.enable_token_cache(False)
+        auth.TOKEN_CACHE_PATH = os.path.expanduser("~/.flickr_api_oauth")
+        shutil.rmtree(self.tmpdir)
+
+    def test_cached_token_is_reused(self):
+        a = AuthHandler(key="test", secret="test",
+                        access_token_key="token",
+                        access_token_secret="token_secret")
+        a._save_to_cache()
+
+        b = AuthHandler(key="test", secret="test")
+        self.assertIsNone(b.request_token)
+        self.assertEqual("token", b.access_token.key)
+        self.assertEqual("token_secret", b.access_token.secret)
+
+    def test_cache_is_keyed_by_api_key(self):
+        a = AuthHandler(key="test", secret="test",
+                        access_token_key="token",
+                        access_token_secret="token_secret")
+        a._save_to_cache()
+
+        b = AuthHandler(key="other", secret="test",
+                        access_token_key="t", access_token_secret="s")
+        self.assertFalse(b._load_from_cache())